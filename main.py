@@ -3,27 +3,29 @@
 
 # Built-in modules
 from types import ModuleType
-from typing import Any
+from typing import Any, TYPE_CHECKING
 from datetime import date
 from argparse import ArgumentParser
-from importlib import import_module
+from importlib import import_module, reload
+from importlib.util import find_spec
 from pathlib import Path
 from timeit import default_timer
+from time import process_time
 from logging import DEBUG, INFO, WARNING, ERROR
 from sys import argv as sys_argv
-from dataclasses import dataclass
-import subprocess
+from dataclasses import asdict, dataclass, field
+from io import StringIO
 import traceback
 import re
 import sys
 import signal
 
-# Third-party modules
-try:
-    from pyperclip import copy
-    from rich.panel import Panel
-    import yaml
-except ImportError:
+# Third-party modules are imported lazily by the features that use them, so only
+# check that they are installed here
+if any(
+    find_spec(module) is None
+    for module in ["pyinstrument", "pyperclip", "rich", "yaml"]
+):
     print("Please install the project requirements - `uv sync`")
     exit(1)
 
@@ -31,7 +33,17 @@ except ImportError:
 from utils.files import Files
 from utils.solution_base import SolutionBase
 from utils.output_handler import OutputHandler, Logger
-from utils.cli_args import Args
+from utils.cli_args import Args, parse_days
+from utils.timing_history import TimingHistory
+from utils.result_store import ResultStore
+from utils.event_log import EventLog
+from utils.watcher import FileWatcher
+
+if TYPE_CHECKING:
+    from utils.call_counter import FunctionCalls
+    from utils.memory_report import MemoryUsage
+    from utils.perf_store import PerfStore
+    from utils.stack_sampler import StackSampler
 
 
 @dataclass
@@ -50,6 +62,14 @@ class YamlConfig:
     debug: bool = False
     log_level: str = "INFO"
     log_path: str = "logs/log.log"
+    timing_history_path: str = "logs/timings.json"
+    result_store_path: str = "logs/results.json"
+    event_log_path: str = "logs/events.jsonl"
+    perf_store_path: str = "logs/perf.sqlite3"
+    regression_threshold: float = 10.0
+    regression_window: int = 10
+    regression_min_delta: float = 1.0
+    snapshot_window: float = 10.0
 
     @classmethod
     def from_yaml(cls, path: Path) -> "YamlConfig":
@@ -58,6 +78,8 @@ class YamlConfig:
             return cls()
 
         try:
+            import yaml
+
             with open(path, "r", encoding="utf-8") as f:
                 data: dict[str, Any] = yaml.safe_load(f) or {}
             return cls(
@@ -73,11 +95,49 @@ class YamlConfig:
                 debug=data.get("debug", False),
                 log_level=data.get("log_level", "INFO"),
                 log_path=data.get("log_path", "logs/log.log"),
+                timing_history_path=data.get(
+                    "timing_history_path", "logs/timings.json"
+                ),
+                result_store_path=data.get("result_store_path", "logs/results.json"),
+                event_log_path=data.get("event_log_path", "logs/events.jsonl"),
+                perf_store_path=data.get("perf_store_path", "logs/perf.sqlite3"),
+                regression_threshold=data.get("regression_threshold", 10.0),
+                regression_window=data.get("regression_window", 10),
+                regression_min_delta=data.get("regression_min_delta", 1.0),
+                snapshot_window=data.get("snapshot_window", 10.0),
             )
         except Exception:
             return cls()
 
 
+@dataclass
+class PartOutcome:
+    """
+    The outcome of testing and solving a single part.
+
+    Attributes:
+        passed_test (bool): Whether the tests passed or were skipped.
+        answer (Any): The answer, None if the part was not solved.
+        elapsed (float): The time taken to solve the part in seconds.
+        cpu (float): The CPU time of the process while solving the part in seconds.
+        output (str): The console output of a part run in a child process.
+        error (str | None): The traceback of a part that raised, None otherwise.
+        phases (dict[str, int]): The read, parse and solve timings in nanoseconds, with --timeit.
+        memory (MemoryUsage | None): The memory used by the part, with --memory.
+        calls (list[FunctionCalls] | None): The calls made by the part, with --count-calls.
+    """
+
+    passed_test: bool = True
+    answer: Any = None
+    elapsed: float = 0.0
+    cpu: float = 0.0
+    output: str = ""
+    error: str | None = None
+    phases: dict[str, int] = field(default_factory=dict)
+    memory: "MemoryUsage | None" = None
+    calls: "list[FunctionCalls] | None" = None
+
+
 class AdventRunner:
     """
     Main runner class for Advent of Code solutions.
@@ -105,6 +165,13 @@ class AdventRunner:
         )
 
         self._solution: SolutionBase | None = None
+        self._history: TimingHistory = TimingHistory(
+            Path(self._config.timing_history_path)
+        )
+        self._store: ResultStore = ResultStore(Path(self._config.result_store_path))
+        self._events: EventLog = EventLog(Path(self._config.event_log_path))
+        self._perf: PerfStore | None = None
+        self._sampler: StackSampler | None = None
 
     def _parse_arguments(self) -> Args:
         """Parse command-line arguments, using config as defaults."""
@@ -113,6 +180,12 @@ class AdventRunner:
         default_year = self._config.year or date.today().year
         default_day = self._config.day or date.today().day
 
+        parser.add_argument(
+            "command",
+            nargs="*",
+            metavar="COMMAND",
+            help="Run a command instead of a solution: perf history, profile diff A.json B.json, stats [YEAR]",
+        )
         parser.add_argument(
             "-y",
             "--year",
@@ -189,7 +262,35 @@ class AdventRunner:
             "--profile",
             dest="profile",
             action="store_true",
-            help="Profile the solution and open results in browser",
+            help="Profile the tests and solution and open results in browser",
+        )
+        parser.add_argument(
+            "--profile-format",
+            dest="profile_format",
+            default=None,
+            choices=["html", "speedscope", "collapsed", "pstats", "text"],
+            help="Profile and save each test and part in this format (implies --profile)",
+        )
+        parser.add_argument(
+            "--profile-out",
+            dest="profile_out",
+            default=None,
+            metavar="PATH",
+            help="Profile and write each test and part to this folder (implies --profile)",
+        )
+        parser.add_argument(
+            "--profile-interval",
+            dest="profile_interval",
+            default=0.001,
+            metavar="SECONDS",
+            type=float,
+            help="Sampling interval of the profiler (default: 0.001)",
+        )
+        parser.add_argument(
+            "--line-profile",
+            dest="line_profile",
+            action="store_true",
+            help="Print the time of every line run by the part function and the helpers it calls",
         )
         parser.add_argument(
             "--debug",
@@ -206,6 +307,97 @@ class AdventRunner:
             default=self._config.run_quality_checks,
             help="Run code quality checks before executing",
         )
+        parser.add_argument(
+            "-w",
+            "--watch",
+            dest="watch",
+            action="store_true",
+            help="Re-run the solution whenever the solution or its data files change",
+        )
+        parser.add_argument(
+            "--concurrent",
+            dest="concurrent",
+            action="store_true",
+            help="With -a, run both parts at the same time in forked processes",
+        )
+        parser.add_argument(
+            "--cached",
+            dest="cached",
+            action="store_true",
+            help="Reuse stored answers when the solution, utils and input are unchanged",
+        )
+        parser.add_argument(
+            "--bench",
+            dest="bench",
+            default=0,
+            metavar="N",
+            type=int,
+            help="Benchmark the parse and solve phases over N repetitions",
+        )
+        parser.add_argument(
+            "--warmup",
+            dest="warmup",
+            default=1,
+            metavar="K",
+            type=int,
+            help="With --bench, the number of untimed repetitions run first",
+        )
+        parser.add_argument(
+            "--bench-gc",
+            dest="bench_gc",
+            default="on",
+            choices=["on", "off", "freeze"],
+            help="With --bench, leave the garbage collector on, disable it, or freeze the parsed input",
+        )
+        parser.add_argument(
+            "--memory",
+            dest="memory",
+            nargs="?",
+            const=10,
+            default=0,
+            metavar="N",
+            type=int,
+            help="Trace the memory of each part and show the N largest allocation sites (default: 10)",
+        )
+        parser.add_argument(
+            "--count-calls",
+            dest="count_calls",
+            action="store_true",
+            help="Count the calls to and time spent in the solution and helper functions",
+        )
+        parser.add_argument(
+            "--compare-to",
+            dest="compare_to",
+            default=None,
+            metavar="REV",
+            help="Benchmark the working tree against a git revision, e.g. HEAD~3 or main",
+        )
+        parser.add_argument(
+            "--startup-report",
+            dest="startup_report",
+            action="store_true",
+            help="Print a breakdown of the import time of the runner and solution",
+        )
+        parser.add_argument(
+            "--days",
+            dest="days",
+            default=[],
+            metavar="DAYS",
+            type=parse_days,
+            help="Run several days in parallel, e.g. 1-25 or 1,3,5-7",
+        )
+        parser.add_argument(
+            "--year-all",
+            dest="year_all",
+            action="store_true",
+            help="Run every day of the year in parallel (same as --days 1-25)",
+        )
+        parser.add_argument(
+            "--fork-server",
+            dest="fork_server",
+            action="store_true",
+            help="With --days/--year-all, fork each part from a server with imports preloaded",
+        )
 
         parsed_args, unknown = parser.parse_known_args()
 
@@ -222,9 +414,28 @@ class AdventRunner:
             skip_test=parsed_args.skip_test,
             create=parsed_args.create,
             timeit=parsed_args.timeit,
-            profile=parsed_args.profile,
+            profile=parsed_args.profile
+            or parsed_args.profile_format is not None
+            or parsed_args.profile_out is not None,
+            profile_format=parsed_args.profile_format or "html",
+            profile_out=parsed_args.profile_out,
+            profile_interval=parsed_args.profile_interval,
+            line_profile=parsed_args.line_profile,
             quality=parsed_args.quality,
             debug=parsed_args.debug,
+            days=list(range(1, 26)) if parsed_args.year_all else parsed_args.days,
+            fork_server=parsed_args.fork_server,
+            watch=parsed_args.watch,
+            startup_report=parsed_args.startup_report,
+            cached=parsed_args.cached,
+            concurrent=parsed_args.concurrent,
+            bench=parsed_args.bench,
+            warmup=parsed_args.warmup,
+            bench_gc=parsed_args.bench_gc,
+            memory=parsed_args.memory,
+            count_calls=parsed_args.count_calls,
+            compare_to=parsed_args.compare_to,
+            command=parsed_args.command,
         )
 
     def _validate_arguments(self) -> bool:
@@ -232,7 +443,7 @@ class AdventRunner:
         self._current_operation = "Validating arguments"
         valid = True
 
-        if not 0 < self._args.day < 26:
+        if not self._args.days and not 0 < self._args.day < 26:
             self._context.print_error("Day must be between 1 and 25")
             self._context.log(ERROR, f"Day out of range: {self._args.day}")
             valid = False
@@ -247,6 +458,28 @@ class AdventRunner:
             self._context.log(ERROR, f"Invalid part: {self._args.part}")
             valid = False
 
+        if self._args.bench < 0 or self._args.warmup < 0:
+            self._context.print_error(
+                "Benchmark repetitions and warmup must be positive"
+            )
+            self._context.log(
+                ERROR,
+                f"Invalid benchmark: {self._args.bench} runs, {self._args.warmup} warmup",
+            )
+            valid = False
+
+        if self._args.line_profile and not hasattr(sys, "monitoring"):
+            self._context.print_error("--line-profile requires Python 3.12 or newer")
+            self._context.log(ERROR, "Line profiling is not supported")
+            valid = False
+
+        if self._args.line_profile and self._args.profile:
+            self._context.print_error(
+                "--line-profile cannot be combined with --profile, pick one"
+            )
+            self._context.log(ERROR, "Both --line-profile and --profile given")
+            valid = False
+
         if 14 <= self._args.year < 100:
             self._args.year = 2000 + self._args.year
 
@@ -270,7 +503,7 @@ class AdventRunner:
             valid = False
 
         day_specified = any(arg.startswith(("-d", "--day")) for arg in sys_argv[1:])
-        if date.today().month != 12 and not day_specified:
+        if date.today().month != 12 and not day_specified and not self._args.days:
             self._context.log(WARNING, "Not December and day not specified")
             self._context.print_warning(
                 "It is not currently December, please specify a day using -d or --day"
@@ -374,12 +607,16 @@ class AdventRunner:
             return False, False
 
         self._context.print_info(f"Installing missing module: {display_name}")
+        import subprocess
+
         subprocess.check_call(["uv", "pip", "install", install_name])
         return True, response.isupper() or install_all
 
     def _import_solution_module(self) -> ModuleType | None:
         """Import the solution module, installing missing dependencies if necessary."""
         self._current_operation = "Importing solution module"
+        from subprocess import CalledProcessError
+
         install_all = False
         solution_path = Path(f"solutions/{self._args.year}/{self._args.day_str}.py")
 
@@ -402,7 +639,7 @@ class AdventRunner:
                     success, install_all = self._install_missing_module(
                         required_module, install_name, install_all
                     )
-                except subprocess.CalledProcessError as e:
+                except CalledProcessError as e:
                     self._context.log(ERROR, f"Subprocess error: {e}")
                     self._context.print_error(f"Subprocess error: {e}")
                     return None
@@ -419,6 +656,7 @@ class AdventRunner:
     def _run_quality_checks(self) -> bool:
         """Run code quality checks using the test runner. Returns True if passed."""
         self._current_operation = "Running quality checks"
+        import subprocess
 
         try:
             cmd = [sys.executable, "utils/test_runner.py"]
@@ -457,45 +695,598 @@ class AdventRunner:
         if self._solution is None:
             return
 
+        digest = ResultStore.get_hash(self._args.year, self._args.day)
+
+        if self._args.concurrent and len(parts) > 1:
+            from multiprocessing import get_all_start_methods
+
+            if "fork" in get_all_start_methods():
+                self._run_parts_concurrently(parts, digest)
+                return
+
+            self._context.print_warning(
+                "Running parts concurrently requires fork, running them in order"
+            )
+
+        # Sample the stack in the background, so SIGUSR1 can show where the time went.
+        # Not while measuring, the sampler thread would show up in the measurements
+        if hasattr(signal, "SIGUSR1") and not (
+            self._args.timeit or self._is_instrumented()
+        ):
+            from utils.stack_sampler import StackSampler
+
+            self._sampler = StackSampler(window=self._config.snapshot_window)
+            self._sampler.start()
+
+        try:
+            for part in parts:
+                self._current_operation = f"Running part {part}"
+                self._context.log(INFO, f"Running Part {part}")
+
+                cached_answer = self._store.get(
+                    self._args.year, self._args.day, part, digest
+                )
+                if self._args.cached and cached_answer is not None:
+                    self._display_result(
+                        part, PartOutcome(answer=cached_answer), cached=True
+                    )
+                    continue
+
+                self._solution.phase_times.clear()
+
+                # Run tests if not skipped
+                passed_test = True
+                if not self._args.skip_test:
+                    self._current_operation = f"Testing part {part}"
+                    self._context.log(DEBUG, "Running tests")
+                    passed_test = self._solution.run_test(part)
+                    self._emit_test(part, passed_test, self._solution.phase_times)
+
+                if not passed_test:
+                    self._context.log(ERROR, "Tests failed")
+                    return
+
+                # Run the actual solution
+                self._current_operation = f"Solving part {part}"
+                self._context.log(DEBUG, "Tests passed. Running solution")
+
+                with self._solution.running(f"[bold green]Running P{part}...\n"):
+                    outcome = self._solve_part(part)
+
+                if outcome.answer is not None:
+                    self._finish_part(part, outcome, digest)
+        finally:
+            if self._sampler is not None:
+                self._sampler.stop()
+                self._sampler = None
+
+    def _emit_test(self, part: int, passed: bool, phases: dict[str, int]) -> None:
+        """Write the result and timings of the tests of a part to the event log."""
+        self._events.emit(
+            "test",
+            year=self._args.year,
+            day=self._args.day,
+            part=part,
+            passed=passed,
+            phases={
+                phase: duration
+                for phase, duration in phases.items()
+                if phase.startswith("test_")
+            },
+        )
+
+    def _solve_part(self, part: int) -> PartOutcome:
+        """Solve a part, tracing its memory with --memory and its calls with --count-calls."""
+        outcome = PartOutcome()
+        if self._solution is None:
+            return outcome
+
+        tracker = None
+        if self._args.memory:
+            from utils.memory_report import MemoryTracker
+
+            tracker = MemoryTracker(top=self._args.memory)
+
+        counter = None
+        if self._args.count_calls:
+            from utils.call_counter import CallCounter
+
+            if CallCounter.is_supported():
+                counter = CallCounter(
+                    [
+                        module
+                        for module in [
+                            sys.modules.get(type(self._solution).__module__),
+                            sys.modules.get("utils.helper_functions"),
+                        ]
+                        if module is not None
+                    ]
+                )
+            else:
+                self._context.print_warning(
+                    "Counting calls requires Python 3.12 or newer, running normally"
+                )
+
+        # Start the tracker last, so it does not trace the counter's own bookkeeping
+        if counter is not None:
+            counter.start()
+        if tracker is not None:
+            tracker.start()
+        try:
+            start_time, start_cpu = default_timer(), process_time()
+            outcome.answer = self._solution.solve(part)
+            outcome.elapsed = default_timer() - start_time
+            outcome.cpu = process_time() - start_cpu
+        finally:
+            if tracker is not None:
+                outcome.memory = tracker.stop()
+            if counter is not None:
+                outcome.calls = counter.stop()
+
+        outcome.phases = dict(self._solution.phase_times)
+        return outcome
+
+    def _is_instrumented(self) -> bool:
+        """Return whether the parts run under a profiler or tracer, which slows them down."""
+        return bool(
+            self._args.profile
+            or self._args.line_profile
+            or self._args.memory
+            or self._args.count_calls
+        )
+
+    def _finish_part(self, part: int, outcome: PartOutcome, digest: str | None) -> None:
+        """Record the timing and answer of a solved part and display the result."""
+        # Instrumented timings would skew the schedule and the regression baseline
+        instrumented = self._is_instrumented()
+        if not instrumented:
+            self._history.record(self._args.year, self._args.day, part, outcome.elapsed)
+            self._history.save()
+
+        self._store.record(
+            self._args.year, self._args.day, part, digest, str(outcome.answer)
+        )
+        self._store.save()
+        self._display_result(part, outcome)
+
+        if self._args.timeit and not instrumented:
+            self._record_perf(
+                part,
+                "run",
+                round(outcome.elapsed * 1e9),
+                outcome.phases.get("parse"),
+                outcome.phases.get("solve"),
+            )
+
+    def _record_perf(
+        self,
+        part: int,
+        mode: str,
+        total_ns: int,
+        parse_ns: int | None = None,
+        solve_ns: int | None = None,
+        repetitions: int = 1,
+    ) -> None:
+        """Store a timed run in the benchmark database and warn if it regressed."""
+        from utils.perf_store import PerfStore
+
+        if self._perf is None:
+            self._perf = PerfStore(Path(self._config.perf_store_path))
+
+        run = PerfStore.create_run(
+            self._args, part, mode, total_ns, parse_ns, solve_ns, repetitions
+        )
+        slowdown = self._perf.record(
+            run,
+            self._config.regression_threshold,
+            self._config.regression_window,
+            round(self._config.regression_min_delta * 1e6),
+        )
+
+        if slowdown is not None:
+            self._context.print_warning(
+                f"Part {part} is {slowdown:.1f}% slower than the median of the last "
+                f"{self._config.regression_window} {mode}s"
+            )
+            self._context.log(
+                WARNING,
+                f"Regression | Year {self._args.year} | Day {self._args.day} | "
+                f"Part {part} | {mode} | +{slowdown:.1f}%",
+            )
+
+    def _run_parts_concurrently(self, parts: list[int], digest: str | None) -> None:
+        """Run every part in its own forked process and display the results in part order."""
+        from multiprocessing import get_context
+
+        if self._solution is None:
+            return
+
+        cached: dict[int, str | None] = {
+            part: self._store.get(self._args.year, self._args.day, part, digest)
+            if self._args.cached
+            else None
+            for part in parts
+        }
+        parts_to_run = [part for part in parts if cached[part] is None]
+
+        outcomes: dict[int, PartOutcome] = {}
+
+        if parts_to_run:
+            # Parse before forking, so both children start with the parsed input
+            self._current_operation = "Parsing input"
+            self._solution.preparse(parts_to_run)
+
+            self._current_operation = f"Running parts {parts_to_run} concurrently"
+            fork_context = get_context("fork")
+
+            # Fork before the spinner starts, so no child inherits its render thread
+            children = []
+            for part in parts_to_run:
+                receiver, sender = fork_context.Pipe(duplex=False)
+                process = fork_context.Process(
+                    target=self._run_part_in_child, args=(part, sender), daemon=True
+                )
+                process.start()
+                sender.close()
+                children.append((part, process, receiver))
+
+            with self._context.console.status(
+                f"[bold green]Running P{' and P'.join(map(str, parts_to_run))}...\n",
+                spinner="dots",
+            ):
+                for part, process, receiver in children:
+                    try:
+                        outcomes[part] = receiver.recv()
+                    except EOFError:
+                        outcomes[part] = PartOutcome(
+                            passed_test=False, error="Worker process died"
+                        )
+                    process.join()
+
         for part in parts:
-            self._current_operation = f"Running part {part}"
-            self._context.log(INFO, f"Running Part {part}")
+            cached_answer = cached[part]
+            if cached_answer is not None:
+                self._display_result(
+                    part, PartOutcome(answer=cached_answer), cached=True
+                )
+                continue
+
+            outcome = outcomes[part]
+            self._context.console.file.write(outcome.output)
+
+            if outcome.error is not None:
+                self._context.print_error(f"Part {part} failed:\n{outcome.error}")
+                self._context.log(ERROR, f"Part {part} failed: {outcome.error}")
+                self._events.emit(
+                    "exception",
+                    year=self._args.year,
+                    day=self._args.day,
+                    part=part,
+                    operation=f"Running part {part}",
+                    message=outcome.error.strip().splitlines()[-1],
+                    traceback=outcome.error,
+                )
+                return
 
-            # Run tests if not skipped
-            passed_test = True
             if not self._args.skip_test:
-                self._current_operation = f"Testing part {part}"
-                self._context.log(DEBUG, "Running tests")
-                passed_test = self._solution.run_test(part)
+                self._emit_test(part, outcome.passed_test, outcome.phases)
 
-            if not passed_test:
+            if not outcome.passed_test:
                 self._context.log(ERROR, "Tests failed")
                 return
 
-            # Run the actual solution
-            self._current_operation = f"Solving part {part}"
-            self._context.log(DEBUG, "Tests passed. Running solution")
+            if outcome.answer is not None:
+                self._finish_part(part, outcome, digest)
 
-            with self._context.console.status(
-                f"[bold green]Running P{part}...\n", spinner="dots"
-            ):
-                start_time = default_timer()
-                answer: Any = self._solution.solve(part)
-                elapsed = default_timer() - start_time
+    def _run_part_in_child(self, part: int, connection: Any) -> None:
+        """Run the tests and solution of a part in a forked process, sending the outcome back."""
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+        # Capture the output so the parent can print it in part order
+        output = StringIO()
+        self._context.console.file = output
+
+        outcome = PartOutcome()
+
+        try:
+            if self._solution is not None:
+                if not self._args.skip_test:
+                    outcome.passed_test = self._solution.run_test(part)
+
+                if outcome.passed_test:
+                    outcome = self._solve_part(part)
+                    # Answers may not be picklable, the parent only needs their text
+                    if outcome.answer is not None:
+                        outcome.answer = str(outcome.answer)
+        except (Exception, SystemExit):
+            outcome.error = traceback.format_exc()
+
+        if self._solution is not None:
+            outcome.phases = dict(self._solution.phase_times)
+            # The child exits without the cleanup of the runner
+            self._solution.close()
+        outcome.output = output.getvalue()
+        connection.send(outcome)
+        connection.close()
+
+    def _watch(self, solution_module: ModuleType, parts: list[int]) -> None:
+        """Re-run the solution every time the solution file or its data files change."""
+        solution_path = Path(f"solutions/{self._args.year}/{self._args.day_str}.py")
+        data_folder = Path("data", self._args.year_str, self._args.day_str)
+        watcher = FileWatcher([solution_path, data_folder])
+
+        while True:
+            self._current_operation = "Watching for changes"
+            self._context.print_info(
+                f"Watching [cyan]{solution_path}[/cyan] and [cyan]{data_folder}[/cyan] "
+                "for changes, press Ctrl-C to stop"
+            )
 
-            if answer is not None:
-                self._display_result(part, answer, elapsed)
+            changed = watcher.wait_for_changes()
+            self._context.log(INFO, f"Changed files: {changed}")
+
+            try:
+                # Only the solution module is reloaded, unchanged input files are
+                # served from the PuzzleReader cache
+                if solution_path.resolve() in [path.resolve() for path in changed]:
+                    self._current_operation = "Reloading solution module"
+                    solution_module = reload(solution_module)
+
+                # Workers of the previous solution run the code before the reload
+                if self._solution is not None:
+                    self._solution.close()
+
+                self._current_operation = "Instantiating solution"
+                self._solution = getattr(solution_module, "Solution")(
+                    context=self._context,
+                    args=self._args,
+                )
+
+                self._context.print()
+                self._print_header(parts)
+                self._run_solution(parts)
+            except Exception as e:
+                self._context.print_error(f"Unexpected error: {e}")
+                self._context.log(ERROR, f"Unexpected error: {traceback.format_exc()}")
+
+    def _print_startup_report(self) -> None:
+        """Print the import time breakdown of a cold start of the runner and solution."""
+        self._current_operation = "Measuring startup time"
+        from utils.startup_report import StartupReport
+
+        modules = ["main"]
+        solution_path = Path(f"solutions/{self._args.year}/{self._args.day_str}.py")
+        if solution_path.exists():
+            modules.append(f"solutions.{self._args.year}.{self._args.day_str}")
+
+        with self._context.console.status(
+            "[bold green]Measuring startup...\n", spinner="dots"
+        ):
+            entries, elapsed = StartupReport.collect(modules)
+
+        StartupReport.display(self._context, entries, elapsed)
+        self._context.log(INFO, f"Cold start of {modules}: {elapsed:.4f}s")
+
+    def _run_benchmark(self, parts: list[int]) -> None:
+        """Benchmark the parse and solve phases of each part and print their statistics."""
+        if self._solution is None:
+            return
+
+        from utils.benchmark import Benchmark, BenchmarkResult, PhaseStats
+
+        benchmark = Benchmark(self._context, self._args, self._solution)
+        results: list[BenchmarkResult] = []
+
+        for part in parts:
+            # No spinner here, its render thread would add noise to the measurements
+            self._current_operation = f"Benchmarking part {part}"
+            self._context.print_info(
+                f"Benchmarking part {part}: {self._args.bench} runs "
+                f"after {self._args.warmup} warmup"
+            )
+
+            result = benchmark.run(
+                part, self._args.bench, self._args.warmup, self._args.bench_gc
+            )
+            if result is None:
+                return
+
+            results.append(result)
+
+        benchmark.display(results, self._args.bench_gc)
+
+        for result in results:
+            self._record_perf(
+                result.part,
+                "bench",
+                round(PhaseStats.summarize(result.total_ns)["median"]),
+                round(PhaseStats.summarize(result.parse.wall_ns)["median"]),
+                round(PhaseStats.summarize(result.solve.wall_ns)["median"]),
+                len(result.total_ns),
+            )
+
+    def _run_comparison(self, parts: list[int]) -> None:
+        """Benchmark the parts in the working tree against an older git revision."""
+        from utils.git_compare import GitCompare
+
+        if self._args.compare_to is None:
+            return
+
+        repetitions = self._args.bench or 10
+        compare = GitCompare(self._context, self._args, self._args.compare_to)
+
+        # No spinner here, its render thread would add noise to the measurements
+        self._current_operation = f"Comparing against {self._args.compare_to}"
+        self._context.print_info(
+            f"Comparing against {self._args.compare_to}: {repetitions} alternating "
+            f"runs after {self._args.warmup} warmup"
+        )
+
+        try:
+            comparisons = compare.run(parts, repetitions, self._args.warmup)
+        except (RuntimeError, OSError) as e:
+            self._context.print_error(f"Comparison failed: {e}")
+            self._context.log(ERROR, f"Comparison failed: {e}")
+            sys.exit(1)
+
+        compare.display(comparisons)
+
+    def _run_command(self) -> None:
+        """Run a subcommand such as `perf history` instead of a solution."""
+        if self._args.command == ["perf", "history"]:
+            from utils.perf_store import PerfStore
+
+            if not self._validate_arguments():
+                sys.exit(1)
+
+            self._perf = self._perf or PerfStore(Path(self._config.perf_store_path))
+            PerfStore.display_history(
+                self._context,
+                f"Timed runs {self._args.year}/{self._args.day_str}",
+                self._perf.history(self._args.year, self._args.day),
+            )
+            return
+
+        if (
+            self._args.command[:2] == ["profile", "diff"]
+            and len(self._args.command) == 4
+        ):
+            from utils.profile_diff import ProfileDiff
+
+            try:
+                before = ProfileDiff.load(Path(self._args.command[2]))
+                after = ProfileDiff.load(Path(self._args.command[3]))
+            except ValueError as e:
+                self._context.print_error(str(e))
+                sys.exit(1)
+
+            ProfileDiff.display(self._context, before, after)
+            return
+
+        if self._args.command[0] == "stats" and len(self._args.command) <= 2:
+            year = self._args.command[1] if len(self._args.command) == 2 else None
+            if year is not None and not year.isdigit():
+                self._context.print_error(f"Invalid year: {year}")
+                sys.exit(1)
+
+            EventLog.display_stats(
+                self._context,
+                EventLog.load(
+                    Path(self._config.event_log_path),
+                    int(year) if year is not None else None,
+                ),
+            )
+            return
+
+        self._context.print_error(
+            f"Unknown command: {' '.join(self._args.command)} "
+            "(available: perf history, profile diff A.json B.json, stats [YEAR])"
+        )
+        sys.exit(1)
+
+    def _run_batch(self) -> None:
+        """Run every requested day in parallel and print a summary table."""
+        self._current_operation = "Running days in parallel"
+        self._context.log(
+            INFO, f"Running Year {self._args.year} | Days {self._args.days}"
+        )
+
+        self._print_header([1, 2])
+
+        if self._config.run_quality_checks or self._args.quality:
+            if not self._run_quality_checks():
+                sys.exit(1)
+
+        from utils.batch_runner import BatchRunner
+
+        batch_runner = BatchRunner(
+            self._context, self._args, self._history, self._store
+        )
+
+        start_time = default_timer()
+        results = batch_runner.run()
+        elapsed = default_timer() - start_time
+
+        batch_runner.display(results, elapsed)
+
+        for result in results:
+            if result.error is not None:
+                self._events.emit(
+                    "exception",
+                    year=result.year,
+                    day=result.day,
+                    operation="Loading solution",
+                    message=result.error,
+                )
+
+            for part_result in result.parts:
+                fields: dict[str, Any] = {
+                    "year": result.year,
+                    "day": result.day,
+                    "part": part_result.part,
+                }
+                if part_result.passed_test is not None:
+                    self._events.emit("test", **fields, passed=part_result.passed_test)
+                if part_result.error is not None:
+                    self._events.emit(
+                        "exception",
+                        **fields,
+                        operation=f"Running part {part_result.part}",
+                        message=part_result.error,
+                    )
+                if part_result.answer is not None:
+                    self._events.emit(
+                        "answer",
+                        **fields,
+                        answer=part_result.answer,
+                        cached=part_result.cached,
+                        elapsed=part_result.elapsed,
+                        cpu=part_result.cpu,
+                    )
+
+        self._context.log(INFO, "All days processed, exiting.")
+
+    def _display_result(
+        self, part: int, outcome: PartOutcome, cached: bool = False
+    ) -> None:
+        """Display the solution result with optional timing, phase, memory and call breakdown."""
+        from rich.panel import Panel
+
+        answer, elapsed = outcome.answer, outcome.elapsed
+        phases, memory = outcome.phases, outcome.memory
 
-    def _display_result(self, part: int, answer: Any, elapsed: float) -> None:
-        """Display the solution result with optional timing."""
         answer_text = f"[black on green] RESULT [/black on green] {answer}"
 
-        if self._args.timeit:
+        if cached:
+            answer_text += "\n[black on blue]  TIME  [/black on blue] [blue not bold]cached[/blue not bold]"
+        elif self._args.timeit:
             elapsed_str = (
                 f"{elapsed * 1000:.2f}ms" if elapsed < 0.1 else f"{elapsed:.4f}s"
             )
             answer_text += f"\n[black on blue]  TIME  [/black on blue] [blue not bold]{elapsed_str}[/blue not bold]"
 
+            if phases:
+                from utils.benchmark import format_ns
+
+                for label, prefix in [(" PHASES ", ""), ("  TEST  ", "test_")]:
+                    if f"{prefix}solve" not in phases:
+                        continue
+
+                    phases_str = " · ".join(
+                        f"{phase} {format_ns(phases[prefix + phase])}"
+                        for phase in ["read", "parse", "solve"]
+                    )
+                    answer_text += f"\n[black on blue]{label}[/black on blue] [blue not bold]{phases_str}[/blue not bold]"
+
+        if memory is not None:
+            from utils.memory_report import format_bytes
+
+            answer_text += (
+                f"\n[black on blue] MEMORY [/black on blue] [blue not bold]"
+                f"peak {format_bytes(memory.peak)} · retained {format_bytes(memory.retained)}"
+                "[/blue not bold]"
+            )
+
         answer_panel = Panel(
             answer_text,
             style="bold green",
@@ -504,14 +1295,50 @@ class AdventRunner:
         )
 
         self._context.print(answer_panel)
+
+        if memory is not None:
+            from utils.memory_report import MemoryTracker
+
+            MemoryTracker.display(self._context, part, memory)
+
+        if outcome.calls is not None:
+            from utils.call_counter import CallCounter
+
+            CallCounter.display(self._context, part, outcome.calls)
         self._context.log(
             INFO,
             f"Year {self._args.year} | Day {self._args.day} | Part {part} | "
-            f"Answer: {answer} | Time: {elapsed:.4f}s",
+            f"Answer: {answer} | Time: {elapsed:.4f}s"
+            + (" | Cached" if cached else "")
+            + "".join(f" | {phase}: {duration}ns" for phase, duration in phases.items())
+            + (
+                f" | Peak: {memory.peak}B | Retained: {memory.retained}B"
+                if memory is not None
+                else ""
+            ),
+        )
+        self._events.emit(
+            "answer",
+            year=self._args.year,
+            day=self._args.day,
+            part=part,
+            answer=str(answer),
+            cached=cached,
+            elapsed=elapsed,
+            cpu=outcome.cpu,
+            phases={
+                phase: duration
+                for phase, duration in phases.items()
+                if not phase.startswith("test_")
+            },
+            peak=memory.peak if memory is not None else None,
+            retained=memory.retained if memory is not None else None,
         )
 
         # Copy to clipboard if requested and only one part
         if self._args.copy_result and answer is not None:
+            from pyperclip import copy
+
             copy(str(answer))
             self._context.print(" Answer Copied ", style="black on blue")
 
@@ -527,7 +1354,10 @@ class AdventRunner:
         )
         self._context.print(
             f"Running Day [cyan]{self._args.year}/{self._args.day_str}[/cyan] | "
-            f"Part {' and '.join(map(str, parts))}",
+            f"Part {' and '.join(map(str, parts))}"
+            if not self._args.days
+            else f"Running Year [cyan]{self._args.year}[/cyan] | "
+            f"Days {', '.join(map(str, self._args.days))}",
             justify="center",
             style="green",
         )
@@ -535,6 +1365,8 @@ class AdventRunner:
 
     def _handle_interrupt(self, signum: int | None = None, frame: Any = None) -> None:
         """Handle keyboard interrupt gracefully."""
+        from rich.panel import Panel
+
         elapsed = default_timer() - self._start_time
 
         location = "Unknown location"
@@ -569,20 +1401,90 @@ class AdventRunner:
             WARNING,
             f"Interrupted during {self._current_operation} at {location} after {elapsed_str}",
         )
+        self._events.emit(
+            "interrupted",
+            year=self._args.year,
+            day=self._args.day,
+            operation=self._current_operation,
+            location=location,
+            elapsed=elapsed,
+        )
 
         sys.exit(130)
 
+    def _handle_snapshot(self, signum: int | None = None, frame: Any = None) -> None:
+        """Print where the solution is and what it did recently on SIGUSR1, without stopping it."""
+        from rich.markup import escape
+        from rich.panel import Panel
+
+        elapsed = default_timer() - self._start_time
+        elapsed_str = f"{elapsed * 1000:.2f}ms" if elapsed < 0.1 else f"{elapsed:.4f}s"
+
+        location = "Unknown location"
+        tb_context = ""
+        if frame is not None:
+            location = (
+                f"{frame.f_code.co_filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+            )
+            tb_context = "".join(traceback.format_stack(frame)[-5:]).strip()
+
+        self._context.print(
+            Panel(
+                f"[bold]Operation:[/bold] {self._current_operation}\n"
+                f"[bold]Location:[/bold] {location}\n"
+                f"[bold]Elapsed:[/bold] {elapsed_str}\n"
+                f"[bold]Traceback:[/bold]\n{escape(tb_context)}",
+                title="[black on blue] SNAPSHOT [/black on blue]",
+                style="blue",
+                border_style="blue",
+            )
+        )
+
+        if self._sampler is not None:
+            from utils.stack_sampler import StackSampler
+
+            StackSampler.display(
+                self._context, self._sampler.hot_functions(), self._sampler.window
+            )
+
+        self._context.log(
+            INFO,
+            f"Snapshot during {self._current_operation} at {location} after {elapsed_str}",
+        )
+
     def start(self) -> None:
         """Main entry point - orchestrates the entire execution flow."""
 
         signal.signal(signal.SIGINT, self._handle_interrupt)
+        if hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, self._handle_snapshot)
 
         try:
             self._context.print()
 
+            # Commands validate the arguments they use themselves
+            if self._args.command:
+                self._run_command()
+                return
+
             if not self._validate_arguments():
                 sys.exit(1)
 
+            self._events.emit(
+                "run_start",
+                year=self._args.year,
+                day=self._args.day,
+                args=asdict(self._args),
+            )
+
+            if self._args.startup_report:
+                self._print_startup_report()
+                return
+
+            if self._args.days:
+                self._run_batch()
+                return
+
             if not self._check_and_create_files():
                 sys.exit(0)
 
@@ -614,8 +1516,19 @@ class AdventRunner:
                 if not self._run_quality_checks():
                     sys.exit(1)
 
+            if self._args.compare_to:
+                self._run_comparison(parts)
+                return
+
+            if self._args.bench:
+                self._run_benchmark(parts)
+                return
+
             self._run_solution(parts)
 
+            if self._args.watch:
+                self._watch(solution_module, parts)
+
             self._context.log(INFO, "All parts processed, exiting.")
 
         except KeyboardInterrupt:
@@ -623,7 +1536,18 @@ class AdventRunner:
         except Exception as e:
             self._context.print_error(f"Unexpected error: {e}")
             self._context.log(ERROR, f"Unexpected error: {traceback.format_exc()}")
+            self._events.emit(
+                "exception",
+                year=self._args.year,
+                day=self._args.day,
+                operation=self._current_operation,
+                message=f"{type(e).__name__}: {e}",
+                traceback=traceback.format_exc(),
+            )
             sys.exit(1)
+        finally:
+            if self._solution is not None:
+                self._solution.close()
 
 
 def main() -> None:
@@ -1,4 +1,6 @@
+from functools import partial
 from typing import Any
+from utils.shared_grid import SharedGrid
 from utils.solution_base import SolutionBase
 import utils.helper_functions as h
 
@@ -23,25 +25,27 @@ class Solution(SolutionBase):
     def part2(self, data: list[list[str]]) -> int:
         guard_position = h.find_in_grid_or_error(data, "^")
 
-        grid_copy = [row.copy() for row in data]
-
-        total_loops = 0
-
         seen_moves, _ = self.walk(data, True)
+        blocks = [position for position in seen_moves if position != guard_position]
+
+        # Workers only receive the name of the shared grid, not a copy of it per task
+        loops = self.parallel_map(
+            partial(self.is_loop_with_block, self.share_grid(data)), blocks
+        )
 
-        for block_row, block_col in seen_moves:
-            if (block_row, block_col) == guard_position:
-                continue
+        return sum(loops)
 
-            changed_grid = [row[:] for row in grid_copy]
-            changed_grid[block_row][block_col] = "#"
+    def is_loop_with_block(
+        self, grid: SharedGrid | list[list[str]], block: tuple[int, int]
+    ) -> bool:
+        block_row, block_col = block
 
-            _, is_loop = self.walk(changed_grid, True)
+        changed_grid = [row[:] for row in grid]
+        changed_grid[block_row][block_col] = "#"
 
-            if is_loop:
-                total_loops += 1
+        _, is_loop = self.walk(changed_grid, True)
 
-        return total_loops
+        return is_loop
 
     def walk(self, data: list[list[str]], part2: bool = False) -> Any:
         seen_positions: set[tuple[int, int]] = set()
@@ -1,3 +1,5 @@
+from functools import partial
+
 from utils.solution_base import SolutionBase
 import utils.helper_functions as h
 
@@ -50,30 +52,30 @@ class Solution(SolutionBase):
 
             robots.append((position, velocity))
 
+        return self.search_parallel(partial(self.has_unique_positions, robots), start=1)
+
+    def has_unique_positions(
+        self, robots: list[tuple[tuple[int, int], tuple[int, int]]], time: int
+    ) -> bool:
         WIDTH = 101
         HEIGHT = 103
-        time = 0
 
         # May be different for other inputs
         # I found that blacklisting 175 yielded my correct puzzle output
         blacklisted_times = [175]
 
-        while True:
-            time += 1
-
-            if time in blacklisted_times:
-                continue
+        if time in blacklisted_times:
+            return False
 
-            positions: set[tuple[int, int]] = set()
+        positions: set[tuple[int, int]] = set()
 
-            for robot in robots:
-                x, y = robot[0]
-                vx, vy = robot[1]
+        for robot in robots:
+            x, y = robot[0]
+            vx, vy = robot[1]
 
-                new_x = (x + time * (vx + WIDTH)) % WIDTH
-                new_y = (y + time * (vy + HEIGHT)) % HEIGHT
+            new_x = (x + time * (vx + WIDTH)) % WIDTH
+            new_y = (y + time * (vy + HEIGHT)) % HEIGHT
 
-                positions.add((new_x, new_y))
+            positions.add((new_x, new_y))
 
-            if len(positions) == len(robots):
-                return time
+        return len(positions) == len(robots)
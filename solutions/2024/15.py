@@ -4,6 +4,7 @@ import utils.helper_functions as h
 
 class Solution(SolutionBase):
     raw_input: bool = True
+    share_parsed = "copy"
 
     def parse(self, data: str) -> tuple[list[list[str]], str]:
         grid, moves = h.split_groups(data)
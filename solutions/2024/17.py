@@ -1,3 +1,5 @@
+from functools import partial
+
 from utils.solution_base import SolutionBase
 import utils.helper_functions as h
 
@@ -73,37 +75,21 @@ class Solution(SolutionBase):
 
         return ",".join([str(num) for num in output])
 
-    def part2(self, data: tuple[dict[str, int], list[int]]) -> int | str:
-        debug = False
+    def outputs_program(
+        self, registers: dict[str, int], program: list[int], a_reg: int
+    ) -> bool:
+        return self.get_output({**registers, "A": a_reg}, program) == program
 
+    def part2(self, data: tuple[dict[str, int], list[int]]) -> int | str:
         registers, program = data
-        a_value = 0
-        best = 0
-
-        while True:
-            a_value += 1
-            # a_reg = a_value
-            # a_reg = a_value * 8**correct_values + offset
-            # This value will be different for every person
-            a_reg = a_value * 8**14 + 0o00532756025052
-
-            registers["A"] = a_reg
-
-            output = self.get_output(registers, program)
-
-            if output == program:
-                return a_reg
-
-            if debug:
-                counter = 0
-                for expected, curr in zip(program, output):
-                    if expected != curr:
-                        break
-
-                    counter += 1
 
-                if counter > best:
-                    best = counter
-                    print(f"{a_value=}, {a_reg=}, {oct(a_reg)=}, {best=}")
-                    print(output)
-                    print(program)
+        # a_reg = a_value
+        # a_reg = a_value * 8**correct_values + offset
+        # This value will be different for every person
+        return self.search_parallel(
+            partial(self.outputs_program, registers, program),
+            start=8**14 + 0o00532756025052,
+            step=8**14,
+            # The search takes minutes, continue where an interrupted run stopped
+            checkpoint="part2",
+        )
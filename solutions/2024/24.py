@@ -8,6 +8,8 @@ import networkx as nx  # type: ignore
 class Solution(SolutionBase):
     raw_input: bool = True
     skip_empty_tests: bool = True
+    share_parsed = "copy"
+    parse_cache: bool = True
 
     compute: dict[str, Callable[[int, int], int]] = {
         "AND": lambda x, y: x & y,
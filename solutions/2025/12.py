@@ -4,6 +4,8 @@ import utils.helper_functions as h
 
 class Solution(SolutionBase):
     raw_input: bool = True
+    share_parsed = "share"
+    parse_cache: bool = True
 
     def parse(
         self, data: str
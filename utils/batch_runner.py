@@ -0,0 +1,453 @@
+"""Contains the BatchRunner class for running multiple days in parallel worker processes."""
+
+# Built-in modules
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from importlib import import_module
+from logging import INFO, ERROR
+from os import cpu_count
+from pathlib import Path
+from time import process_time
+from timeit import default_timer
+from typing import Any
+
+# Third-party modules
+from rich.console import Console
+from rich.table import Table
+
+# Local modules
+from utils.cli_args import Args
+from utils.files import Files
+from utils.output_handler import OutputHandler, Logger
+from utils.puzzle_reader import PuzzleReader
+from utils.timing_history import TimingHistory
+from utils.result_store import ResultStore
+from utils.fork_server import ForkServer, RUNNER_MODULES
+
+
+@dataclass
+class PartResult:
+    """
+    Result of running a single part of a day in a worker process.
+
+    Attributes:
+        part (int): The part of the puzzle.
+        answer (str | None): The answer as a string, or None if no answer was produced.
+        passed_test (bool | None): Whether the test passed, or None if tests were skipped.
+        elapsed (float): The wall time of the solution in seconds.
+        cpu (float): The CPU time of the worker process while solving in seconds.
+        error (str | None): The error message if the part raised an exception.
+        cached (bool): Whether the answer was taken from the result store instead of running.
+        missing (str | None): The input file that is missing or empty, "input" or
+            "test input", if the part could not run because of it.
+    """
+
+    part: int
+    answer: str | None = None
+    passed_test: bool | None = None
+    elapsed: float = 0.0
+    cpu: float = 0.0
+    error: str | None = None
+    cached: bool = False
+    missing: str | None = None
+
+
+@dataclass
+class DayResult:
+    """
+    Result of running every part of a day in a worker process.
+
+    Attributes:
+        year (int): The year of the puzzle.
+        day (int): The day of the puzzle.
+        parts (list[PartResult]): The results for each part.
+        error (str | None): The error message if the day could not be loaded.
+    """
+
+    year: int
+    day: int
+    parts: list[PartResult] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def failed(self) -> bool:
+        """Return True if the day or any of its parts failed."""
+        return self.error is not None or any(
+            part.error is not None or part.passed_test is False for part in self.parts
+        )
+
+    @property
+    def missing(self) -> bool:
+        """Return True if a part of the day could not run because an input file is missing."""
+        return any(part.missing is not None for part in self.parts)
+
+
+def run_day(
+    year: int, day: int, parts: list[int], skip_test: bool, only_test: bool
+) -> DayResult:
+    """
+    Import and run the given parts of a single day. Executed inside a worker process.
+
+    Output from the solution is discarded, only the results are sent back to the parent.
+
+    Args:
+        year (int): The year of the puzzle.
+        day (int): The day of the puzzle.
+        parts (list[int]): The parts of the puzzle to run.
+        skip_test (bool): Whether to skip running the tests.
+        only_test (bool): Whether to only run the tests.
+
+    Returns:
+        DayResult: The result of every requested part of the day.
+    """
+    args = Args(year=year, day=day, skip_test=skip_test, only_test=only_test)
+    console = Console(quiet=True)
+    context = OutputHandler(
+        logger=Logger(name=f"{year}-{day}-batch", console=console), console=console
+    )
+    result = DayResult(year=year, day=day)
+
+    try:
+        module = import_module(f"solutions.{args.year}.{args.day_str}")
+        solution = getattr(module, "Solution")(context=context, args=args)
+    except (Exception, SystemExit) as e:
+        result.error = f"{type(e).__name__}: {e}"
+        return result
+
+    # `run_test` counts a missing test input as passed, and `solve` returns no answer
+    # without input, so check them here to report the day as incomplete instead
+    has_test = PuzzleReader.has_input(args, is_test=True)
+    has_input = PuzzleReader.has_input(args)
+
+    for part in parts:
+        part_result = PartResult(part=part)
+        result.parts.append(part_result)
+
+        if only_test and not has_test:
+            part_result.missing = "test input"
+            continue
+        if not only_test and not has_input:
+            part_result.missing = "input"
+            continue
+
+        try:
+            if not skip_test and has_test:
+                part_result.passed_test = solution.run_test(part)
+                if not part_result.passed_test:
+                    continue
+
+            start_time, start_cpu = default_timer(), process_time()
+            answer: Any = solution.solve(part)
+            part_result.elapsed = default_timer() - start_time
+            part_result.cpu = process_time() - start_cpu
+        except (Exception, SystemExit) as e:
+            part_result.error = f"{type(e).__name__}: {e}"
+            continue
+
+        if answer is not None:
+            part_result.answer = str(answer)
+
+    # Worker processes and shared grids of the parallel helpers
+    solution.close()
+
+    return result
+
+
+class BatchRunner:
+    """Runs multiple days of a year in a process pool and summarizes the results."""
+
+    def __init__(
+        self,
+        context: OutputHandler,
+        args: Args,
+        history: TimingHistory,
+        store: ResultStore,
+    ) -> None:
+        """
+        Initialize a new BatchRunner instance.
+
+        Args:
+            context (OutputHandler): The output handler for the current run of the program.
+            args (Args): The parsed command-line arguments, with `days` set.
+            history (TimingHistory): The recorded durations used to schedule the slowest days first.
+            store (ResultStore): The stored answers, reused for unchanged days with `cached` set.
+        """
+        self.__context = context
+        self.__args = args
+        self.__history = history
+        self.__store = store
+
+    @staticmethod
+    def available_days(year: int, days: list[int]) -> list[int]:
+        """
+        Filter the given days down to the ones that have a solution file.
+
+        Args:
+            year (int): The year of the puzzle.
+            days (list[int]): The days to check.
+
+        Returns:
+            list[int]: The days that have a solution file.
+        """
+        solution_folder = Path(Files.get_path(), "solutions", str(year))
+        return [day for day in days if Path(solution_folder, f"{day:02}.py").exists()]
+
+    def run(self) -> list[DayResult]:
+        """
+        Run every requested day, one day per worker process.
+
+        Days are submitted longest-expected-first so that a slow day never starts last,
+        and the measured durations are added to the timing history afterwards. With
+        `fork_server` set, every part runs in its own child forked from a warm server.
+        With `cached` set, parts whose sources and input are unchanged are not run again.
+
+        Returns:
+            list[DayResult]: The results, sorted by day.
+        """
+        days = BatchRunner.available_days(self.__args.year, self.__args.days)
+        missing = sorted(set(self.__args.days) - set(days))
+
+        if missing:
+            self.__context.print_warning(
+                f"Skipping days without a solution: {', '.join(map(str, missing))}"
+            )
+
+        if not days:
+            return []
+
+        year = self.__args.year
+        digests = {day: ResultStore.get_hash(year, day) for day in days}
+        results: dict[int, DayResult] = {}
+        jobs: list[tuple[int, list[int]]] = []
+
+        for day in days:
+            parts = [1, 2]
+
+            if self.__args.cached:
+                cached = {
+                    part: self.__store.get(year, day, part, digests[day])
+                    for part in parts
+                }
+                parts = [part for part, answer in cached.items() if answer is None]
+                results[day] = DayResult(
+                    year=year,
+                    day=day,
+                    parts=[
+                        PartResult(part=part, answer=answer, cached=True)
+                        for part, answer in cached.items()
+                        if answer is not None
+                    ],
+                )
+
+            if parts and self.__args.fork_server:
+                jobs.extend((day, [part]) for part in parts)
+            elif parts:
+                jobs.append((day, parts))
+
+        if jobs:
+            self.__run_jobs(jobs, days, results)
+
+        for result in results.values():
+            result.parts.sort(key=lambda part: part.part)
+            for part in result.parts:
+                if part.answer is None or part.cached or part.passed_test is False:
+                    continue
+
+                self.__history.record(year, result.day, part.part, part.elapsed)
+                self.__store.record(
+                    year, result.day, part.part, digests[result.day], part.answer
+                )
+
+        self.__history.save()
+        self.__store.save()
+
+        return sorted(results.values(), key=lambda result: result.day)
+
+    def __run_jobs(
+        self,
+        jobs: list[tuple[int, list[int]]],
+        days: list[int],
+        results: dict[int, DayResult],
+    ) -> None:
+        """
+        Run (day, parts) jobs in the process pool, merging their results per day.
+
+        Args:
+            jobs (list[tuple[int, list[int]]]): The days and parts to run.
+            days (list[int]): Every requested day, used to find the modules to preload.
+            results (dict[int, DayResult]): The results so far, updated in place.
+        """
+        jobs = self.__history.longest_first(self.__args.year, jobs)
+        self.__context.log(INFO, f"Scheduling jobs in order: {jobs}")
+
+        workers = min(len(jobs), cpu_count() or 1)
+        self.__context.log(INFO, f"Running {len(jobs)} jobs on {workers} workers")
+
+        with (
+            self.__create_executor(workers, days) as executor,
+            self.__context.console.status(
+                f"[bold green]Running {len(days)} days...\n", spinner="dots"
+            ) as status,
+        ):
+            futures = [
+                executor.submit(
+                    run_day,
+                    self.__args.year,
+                    day,
+                    parts,
+                    self.__args.skip_test,
+                    self.__args.only_test,
+                )
+                for day, parts in jobs
+            ]
+
+            for finished, future in enumerate(as_completed(futures), start=1):
+                result: DayResult = future.result()
+                merged = results.setdefault(result.day, result)
+                if merged is not result:
+                    merged.parts.extend(result.parts)
+                    merged.error = merged.error or result.error
+
+                status.update(
+                    f"[bold green]Running {len(days)} days... "
+                    f"({finished}/{len(jobs)} jobs done)\n"
+                )
+
+    def __create_executor(self, workers: int, days: list[int]) -> ProcessPoolExecutor:
+        """
+        Create the process pool, reporting the startup time saved by the fork server.
+
+        Args:
+            workers (int): The maximum number of concurrent workers.
+            days (list[int]): The days that will run, used to find the modules to preload.
+
+        Returns:
+            ProcessPoolExecutor: The process pool.
+        """
+        if not self.__args.fork_server:
+            return ProcessPoolExecutor(max_workers=workers)
+
+        if not ForkServer.is_supported():
+            self.__context.print_warning(
+                "Fork server is not supported on this platform, using a regular pool"
+            )
+            return ProcessPoolExecutor(max_workers=workers)
+
+        preload = RUNNER_MODULES + ForkServer.declared_modules(self.__args.year, days)
+        self.__context.log(INFO, f"Preloading modules in fork server: {preload}")
+
+        executor = ForkServer.create_executor(workers, preload)
+        cold_start = ForkServer.measure_cold_start(preload)
+        warm_start = ForkServer.measure_warm_start(executor)
+
+        message = (
+            f"Fork server saves {BatchRunner.format_time(cold_start - warm_start)} "
+            f"of startup per job (cold: {BatchRunner.format_time(cold_start)}, "
+            f"warm: {BatchRunner.format_time(warm_start)})"
+        )
+        self.__context.print_info(message)
+        self.__context.log(INFO, message)
+
+        return executor
+
+    def display(self, results: list[DayResult], elapsed: float) -> None:
+        """
+        Print a summary table of the results and log every answer.
+
+        Args:
+            results (list[DayResult]): The results to display.
+            elapsed (float): The wall time of the whole batch in seconds.
+        """
+        table = Table(title=f"Advent of Code {self.__args.year}", border_style="green")
+        table.add_column("Day", justify="right", style="cyan")
+        table.add_column("Part", justify="right")
+        table.add_column("Test", justify="center")
+        table.add_column("Answer", justify="right", style="bold")
+        table.add_column("Time", justify="right", style="blue")
+
+        total_time = 0.0
+
+        for result in results:
+            if result.error is not None:
+                table.add_row(
+                    str(result.day), "-", "", f"[red]{result.error}[/red]", ""
+                )
+                self.__context.log(
+                    ERROR, f"Year {result.year} | Day {result.day} | {result.error}"
+                )
+                continue
+
+            for part in result.parts:
+                total_time += part.elapsed
+                answer = (
+                    f"[red]{part.error}[/red]"
+                    if part.error
+                    else f"[yellow]no {part.missing}[/yellow]"
+                    if part.missing
+                    else part.answer or "-"
+                )
+                table.add_row(
+                    str(result.day),
+                    str(part.part),
+                    ""
+                    if part.cached or part.missing
+                    else BatchRunner.__test_status(part.passed_test),
+                    answer,
+                    "[dim]cached[/dim]"
+                    if part.cached
+                    else BatchRunner.format_time(part.elapsed)
+                    if part.answer
+                    else "",
+                )
+                self.__context.log(
+                    INFO if not part.error else ERROR,
+                    f"Year {result.year} | Day {result.day} | Part {part.part} | "
+                    f"Answer: {part.answer} | Time: {part.elapsed:.4f}s"
+                    + (f" | Error: {part.error}" if part.error else "")
+                    + (" | Cached" if part.cached else ""),
+                )
+
+        self.__context.print(table)
+
+        failed = sum(result.failed for result in results)
+        missing = sum(result.missing and not result.failed for result in results)
+        summary = (
+            f"{len(results)} days in {BatchRunner.format_time(elapsed)} "
+            f"(sum of parts: {BatchRunner.format_time(total_time)})"
+        )
+        incomplete = f"{missing} missing input" if missing else ""
+
+        if failed:
+            self.__context.print_error(
+                ", ".join(filter(None, [summary, f"{failed} failed", incomplete]))
+            )
+        elif missing:
+            self.__context.print_warning(f"{summary}, {incomplete}")
+        else:
+            self.__context.print_ok(summary)
+
+    @staticmethod
+    def format_time(elapsed: float) -> str:
+        """
+        Format a duration in seconds for display.
+
+        Args:
+            elapsed (float): The duration in seconds.
+
+        Returns:
+            str: The formatted duration.
+
+        Example:
+            >>> BatchRunner.format_time(0.0123)
+            '12.30ms'
+            >>> BatchRunner.format_time(1.5)
+            '1.5000s'
+        """
+        return f"{elapsed * 1000:.2f}ms" if elapsed < 0.1 else f"{elapsed:.4f}s"
+
+    @staticmethod
+    def __test_status(passed_test: bool | None) -> str:
+        """Return the table cell for a test result."""
+        if passed_test is None:
+            return "[dim]skipped[/dim]"
+        return "[green]passed[/green]" if passed_test else "[red]failed[/red]"
@@ -0,0 +1,268 @@
+"""Contains the Benchmark class for timing the parse and solve phases over many repetitions."""
+
+# Built-in modules
+from dataclasses import dataclass, field
+from logging import INFO
+from statistics import median, quantiles, stdev
+from time import perf_counter_ns, process_time_ns
+from typing import Any, Callable, Literal
+import gc
+import os
+import platform
+
+# Local modules
+from utils.cli_args import Args
+from utils.output_handler import OutputHandler
+from utils.puzzle_reader import PuzzleReader
+from utils.solution_base import SolutionBase
+
+GcMode = Literal["on", "off", "freeze"]
+
+
+def format_ns(duration: float) -> str:
+    """
+    Format a duration in nanoseconds for display.
+
+    Args:
+        duration (float): The duration in nanoseconds.
+
+    Returns:
+        str: The formatted duration.
+
+    Example:
+        >>> format_ns(12_345)
+        '12.35µs'
+        >>> format_ns(12_345_678)
+        '12.35ms'
+        >>> format_ns(1_234_567_890)
+        '1.2346s'
+    """
+    if duration < 1_000_000:
+        return f"{duration / 1_000:.2f}µs"
+    if duration < 1_000_000_000:
+        return f"{duration / 1_000_000:.2f}ms"
+    return f"{duration / 1_000_000_000:.4f}s"
+
+
+@dataclass
+class PhaseStats:
+    """
+    Samples of a single phase (parse or solve) of a benchmark.
+
+    Attributes:
+        wall_ns (list[int]): The wall time of every repetition, in nanoseconds.
+        cpu_ns (list[int]): The CPU time of every repetition, in nanoseconds.
+    """
+
+    wall_ns: list[int] = field(default_factory=list)
+    cpu_ns: list[int] = field(default_factory=list)
+
+    @staticmethod
+    def summarize(samples: list[int]) -> dict[str, float]:
+        """
+        Compute robust statistics of a list of samples.
+
+        Args:
+            samples (list[int]): The samples.
+
+        Returns:
+            dict[str, float]: The min, median, interquartile range and standard deviation.
+
+        Example:
+            >>> stats = PhaseStats.summarize([2, 4, 4, 4, 5, 5, 7, 9])
+            >>> stats["min"], stats["median"], stats["iqr"], round(stats["stddev"], 3)
+            (2, 4.5, 2.5, 2.138)
+            >>> PhaseStats.summarize([7])
+            {'min': 7, 'median': 7, 'iqr': 0.0, 'stddev': 0.0}
+        """
+        if len(samples) < 2:
+            return {"min": samples[0], "median": samples[0], "iqr": 0.0, "stddev": 0.0}
+
+        first_quartile, _, third_quartile = quantiles(samples, n=4)
+        return {
+            "min": min(samples),
+            "median": median(samples),
+            "iqr": third_quartile - first_quartile,
+            "stddev": stdev(samples),
+        }
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Result of benchmarking a single part.
+
+    Attributes:
+        part (int): The part of the puzzle.
+        answer (Any): The answer of the last repetition.
+        parse (PhaseStats): The samples of the parse phase.
+        solve (PhaseStats): The samples of the solve phase.
+    """
+
+    part: int
+    answer: Any = None
+    parse: PhaseStats = field(default_factory=PhaseStats)
+    solve: PhaseStats = field(default_factory=PhaseStats)
+
+    @property
+    def total_ns(self) -> list[int]:
+        """Return the wall time of parsing and solving in every repetition."""
+        return [
+            parse + solve
+            for parse, solve in zip(self.parse.wall_ns, self.solve.wall_ns)
+        ]
+
+
+class Benchmark:
+    """Times the parse and solve phases of a solution separately over many repetitions."""
+
+    def __init__(
+        self, context: OutputHandler, args: Args, solution: SolutionBase
+    ) -> None:
+        """
+        Initialize a new Benchmark instance.
+
+        Args:
+            context (OutputHandler): The output handler for the current run of the program.
+            args (Args): The parsed command-line arguments.
+            solution (SolutionBase): The solution to benchmark.
+        """
+        self.__context = context
+        self.__args = args
+        self.__solution = solution
+
+    @staticmethod
+    def environment() -> dict[str, str]:
+        """
+        Describe the environment the benchmark runs in, so results can be compared.
+
+        Returns:
+            dict[str, str]: The Python version, platform and the CPUs the process may run on.
+        """
+        cpu_count = os.cpu_count() or 1
+
+        if hasattr(os, "sched_getaffinity"):
+            affinity = sorted(os.sched_getaffinity(0))
+            cpus = f"{len(affinity)}/{cpu_count} ({','.join(map(str, affinity))})"
+        else:
+            cpus = f"{cpu_count}/{cpu_count}"
+
+        return {
+            "python": f"{platform.python_implementation()} {platform.python_version()}",
+            "platform": platform.platform(terse=True),
+            "cpus": cpus,
+        }
+
+    def run(
+        self, part: int, repetitions: int, warmup: int, gc_mode: GcMode = "on"
+    ) -> BenchmarkResult | None:
+        """
+        Benchmark a part of the solution.
+
+        Every repetition reads the input untimed, then parses it and solves the part,
+        timing both phases with `perf_counter_ns` and `process_time_ns`.
+
+        Args:
+            part (int): The part of the puzzle.
+            repetitions (int): The number of timed repetitions.
+            warmup (int): The number of untimed repetitions run first.
+            gc_mode (GcMode, optional): "on" leaves the garbage collector alone, "off"
+                disables it while timing and "freeze" moves the parsed input to the
+                permanent generation before solving. Defaults to "on".
+
+        Returns:
+            BenchmarkResult | None: The samples, or None if the input is missing.
+        """
+        func: Callable[[Any], Any] = getattr(self.__solution, f"part{part}")
+        result = BenchmarkResult(part=part)
+
+        self.__solution.is_test = False
+        self.__solution.is_part_1 = part == 1
+
+        for repetition in range(warmup + repetitions):
+            # Read outside of the timed region, the solution may mutate its input
+            puzzle_input: Any = PuzzleReader.get_input(
+                self.__context, self.__args, self.__solution.raw_input
+            )
+            if puzzle_input is None:
+                return None
+
+            gc.collect()
+            if gc_mode == "off":
+                gc.disable()
+
+            try:
+                wall_start, cpu_start = perf_counter_ns(), process_time_ns()
+                data: Any = self.__solution.parse(puzzle_input)
+                wall_parsed, cpu_parsed = perf_counter_ns(), process_time_ns()
+
+                if gc_mode == "freeze":
+                    gc.freeze()
+
+                wall_solve, cpu_solve = perf_counter_ns(), process_time_ns()
+                result.answer = func(data)
+                wall_end, cpu_end = perf_counter_ns(), process_time_ns()
+            finally:
+                gc.enable()
+                if gc_mode == "freeze":
+                    gc.unfreeze()
+
+            if repetition < warmup:
+                continue
+
+            result.parse.wall_ns.append(wall_parsed - wall_start)
+            result.parse.cpu_ns.append(cpu_parsed - cpu_start)
+            result.solve.wall_ns.append(wall_end - wall_solve)
+            result.solve.cpu_ns.append(cpu_end - cpu_solve)
+
+        return result
+
+    def display(self, results: list[BenchmarkResult], gc_mode: GcMode) -> None:
+        """
+        Print a table of the statistics of every part and phase, and log them.
+
+        Args:
+            results (list[BenchmarkResult]): The benchmark results.
+            gc_mode (GcMode): The garbage collector mode used while timing.
+        """
+        from rich.table import Table
+
+        environment = Benchmark.environment()
+        table = Table(
+            title=f"Benchmark {self.__args.year}/{self.__args.day_str}",
+            caption=f"{environment['python']} | {environment['platform']} | "
+            f"CPUs {environment['cpus']} | GC {gc_mode}",
+            border_style="blue",
+        )
+        table.add_column("Part", justify="right")
+        table.add_column("Phase")
+        table.add_column("Min", justify="right", style="bold blue")
+        table.add_column("Median", justify="right", style="blue")
+        table.add_column("IQR", justify="right")
+        table.add_column("Stddev", justify="right")
+        table.add_column("CPU median", justify="right")
+
+        for result in results:
+            for phase, stats in [("parse", result.parse), ("solve", result.solve)]:
+                wall = PhaseStats.summarize(stats.wall_ns)
+                cpu = PhaseStats.summarize(stats.cpu_ns)
+                table.add_row(
+                    str(result.part),
+                    phase,
+                    format_ns(wall["min"]),
+                    format_ns(wall["median"]),
+                    format_ns(wall["iqr"]),
+                    format_ns(wall["stddev"]),
+                    format_ns(cpu["median"]),
+                )
+                self.__context.log(
+                    INFO,
+                    f"Benchmark | Year {self.__args.year} | Day {self.__args.day} | "
+                    f"Part {result.part} | {phase} | runs: {len(stats.wall_ns)} | "
+                    f"min: {wall['min']}ns | median: {wall['median']}ns | "
+                    f"iqr: {wall['iqr']:.0f}ns | stddev: {wall['stddev']:.0f}ns | "
+                    f"cpu median: {cpu['median']}ns | gc: {gc_mode} | "
+                    f"python: {environment['python']} | cpus: {environment['cpus']}",
+                )
+
+        self.__context.print(table)
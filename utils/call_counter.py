@@ -0,0 +1,274 @@
+"""Contains the CallCounter class for counting calls to solution functions with `sys.monitoring`."""
+
+# Built-in modules
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter_ns
+from types import CodeType, FunctionType, ModuleType
+from typing import Any
+import sys
+
+# Local modules
+from utils.files import Files
+from utils.output_handler import OutputHandler
+
+
+@dataclass
+class FunctionCalls:
+    """
+    The calls to a single function.
+
+    Attributes:
+        name (str): The qualified name of the function and its location.
+        calls (int): The number of calls.
+        cumulative_ns (int): The time spent in the function and everything it called,
+            in nanoseconds. Recursive calls are only counted once.
+    """
+
+    name: str
+    calls: int
+    cumulative_ns: int
+
+
+class CallCounter:
+    """
+    Counts the calls to and the time spent in the functions of a few modules.
+
+    Only the code objects of the given modules get `sys.monitoring` events, so code
+    outside of them, like the standard library, runs at full speed.
+    """
+
+    def __init__(self, modules: list[ModuleType]) -> None:
+        """
+        Initialize a new CallCounter instance.
+
+        Args:
+            modules (list[ModuleType]): The modules whose functions are counted.
+        """
+        self.__codes = CallCounter.get_codes(modules)
+
+        self.__tool: int | None = None
+        self.__calls: dict[CodeType, int] = {}
+        self.__depth: dict[CodeType, int] = {}
+        self.__started: dict[CodeType, int] = {}
+        self.__cumulative: dict[CodeType, int] = {}
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Return whether `sys.monitoring` is available (Python 3.12+)."""
+        return sys.version_info >= (3, 12)
+
+    @staticmethod
+    def get_codes(modules: list[ModuleType]) -> set[CodeType]:
+        """
+        Return the code objects of the functions defined in modules, including nested ones.
+
+        Args:
+            modules (list[ModuleType]): The modules to search.
+
+        Returns:
+            set[CodeType]: The code objects of functions, methods, lambdas and comprehensions.
+        """
+        codes: set[CodeType] = set()
+        for module in modules:
+            CallCounter.__collect(module, getattr(module, "__file__", None), codes)
+
+        return codes
+
+    @staticmethod
+    def __collect(value: Any, file: str | None, codes: set[CodeType]) -> None:
+        """Add the code objects defined in `file` that are reachable from a module or class."""
+        members = vars(value).values() if isinstance(value, (ModuleType, type)) else []
+
+        for member in members:
+            if isinstance(member, (staticmethod, classmethod)):
+                member = member.__func__
+            elif isinstance(member, property):
+                member = member.fget
+
+            if isinstance(member, FunctionType):
+                CallCounter.__collect_code(member.__code__, file, codes)
+            elif (
+                isinstance(member, type)
+                and member is not value
+                and getattr(sys.modules.get(member.__module__), "__file__", None)
+                == file
+            ):
+                CallCounter.__collect(member, file, codes)
+
+    @staticmethod
+    def __collect_code(code: CodeType, file: str | None, codes: set[CodeType]) -> None:
+        """Add a code object and the nested functions, lambdas and comprehensions inside it."""
+        if code.co_filename != file or code in codes:
+            return
+
+        codes.add(code)
+        for constant in code.co_consts:
+            if isinstance(constant, CodeType):
+                CallCounter.__collect_code(constant, file, codes)
+
+    @staticmethod
+    def use_tool_id(name: str) -> int:
+        """
+        Claim a free `sys.monitoring` tool id.
+
+        Args:
+            name (str): The name the tool id is registered under.
+
+        Returns:
+            int: The claimed tool id, to be released with `sys.monitoring.free_tool_id`.
+
+        Raises:
+            RuntimeError: If `sys.monitoring` is unavailable, or every tool id that may
+                be used is already in use.
+        """
+        if sys.version_info < (3, 12):
+            raise RuntimeError("sys.monitoring requires Python 3.12 or newer")
+
+        monitoring = sys.monitoring
+
+        # cProfile uses the profiler id from 3.12 on, fall back to the unassigned ids
+        for tool in [monitoring.PROFILER_ID, 3, 4]:
+            if monitoring.get_tool(tool) is None:
+                monitoring.use_tool_id(tool, name)
+                return tool
+
+        raise RuntimeError("No free sys.monitoring tool id")
+
+    def start(self) -> None:
+        """
+        Start counting calls.
+
+        Raises:
+            RuntimeError: If the Python version is older than 3.12, or every
+                `sys.monitoring` tool id is already in use.
+        """
+        if sys.version_info < (3, 12):
+            raise RuntimeError("Counting calls requires Python 3.12 or newer")
+
+        monitoring = sys.monitoring
+        events = monitoring.events
+
+        self.__tool = CallCounter.use_tool_id("aoc call counter")
+        monitoring.register_callback(self.__tool, events.PY_START, self.__on_start)
+        monitoring.register_callback(self.__tool, events.PY_RESUME, self.__on_resume)
+        monitoring.register_callback(self.__tool, events.PY_RETURN, self.__on_exit)
+        monitoring.register_callback(self.__tool, events.PY_YIELD, self.__on_exit)
+        monitoring.register_callback(self.__tool, events.PY_UNWIND, self.__on_unwind)
+
+        local_events = (
+            events.PY_START | events.PY_RESUME | events.PY_RETURN | events.PY_YIELD
+        )
+        for code in self.__codes:
+            monitoring.set_local_events(self.__tool, code, local_events)
+
+        # Unwinding cannot be scoped to code objects, it only fires when an exception escapes
+        monitoring.set_events(self.__tool, events.PY_UNWIND)
+
+    def __enter(self, code: CodeType) -> None:
+        """Start the clock of a function, unless it is already running (recursion)."""
+        depth = self.__depth.get(code, 0)
+        if not depth:
+            self.__started[code] = perf_counter_ns()
+        self.__depth[code] = depth + 1
+
+    def __on_start(self, code: CodeType, offset: int) -> None:
+        """Count a call and start its clock."""
+        self.__calls[code] = self.__calls.get(code, 0) + 1
+        self.__enter(code)
+
+    def __on_resume(self, code: CodeType, offset: int) -> None:
+        """Restart the clock of a generator that resumes."""
+        self.__enter(code)
+
+    def __on_exit(self, code: CodeType, offset: int, value: Any) -> None:
+        """Stop the clock of a function that returns or yields."""
+        depth = self.__depth.get(code, 0) - 1
+        if depth < 0:
+            return
+
+        self.__depth[code] = depth
+        if not depth:
+            elapsed = perf_counter_ns() - self.__started[code]
+            self.__cumulative[code] = self.__cumulative.get(code, 0) + elapsed
+
+    def __on_unwind(
+        self, code: CodeType, offset: int, exception: BaseException
+    ) -> None:
+        """Stop the clock of a counted function that exits with an exception."""
+        if code in self.__codes:
+            self.__on_exit(code, offset, exception)
+
+    def stop(self) -> list[FunctionCalls]:
+        """
+        Stop counting calls.
+
+        Returns:
+            list[FunctionCalls]: The functions that were called, most time first.
+        """
+        # The tool is only claimed on 3.12+, the version check is for type checkers
+        if self.__tool is not None and sys.version_info >= (3, 12):
+            monitoring = sys.monitoring
+            for code in self.__codes:
+                monitoring.set_local_events(
+                    self.__tool, code, monitoring.events.NO_EVENTS
+                )
+            monitoring.set_events(self.__tool, monitoring.events.NO_EVENTS)
+            monitoring.free_tool_id(self.__tool)
+            self.__tool = None
+
+        root = Files.get_path()
+        results: list[FunctionCalls] = []
+
+        for code, calls in self.__calls.items():
+            path = Path(code.co_filename)
+            if path.is_relative_to(root):
+                path = path.relative_to(root)
+
+            name = code.co_qualname if sys.version_info >= (3, 11) else code.co_name
+            results.append(
+                FunctionCalls(
+                    name=f"{name} ({path.as_posix()}:{code.co_firstlineno})",
+                    calls=calls,
+                    cumulative_ns=self.__cumulative.get(code, 0),
+                )
+            )
+
+        return sorted(results, key=lambda result: result.cumulative_ns, reverse=True)
+
+    @staticmethod
+    def display(
+        context: OutputHandler, part: int, results: list[FunctionCalls], top: int = 25
+    ) -> None:
+        """
+        Print the call counts and cumulative times of a part.
+
+        Args:
+            context (OutputHandler): The output handler for the current run of the program.
+            part (int): The part of the puzzle.
+            results (list[FunctionCalls]): The counted functions.
+            top (int, optional): The number of functions to show. Defaults to 25.
+        """
+        from rich.markup import escape
+        from rich.table import Table
+
+        from utils.benchmark import format_ns
+
+        if not results:
+            return
+
+        table = Table(title=f"Part {part} calls", border_style="blue")
+        table.add_column("Function")
+        table.add_column("Calls", justify="right", style="bold blue")
+        table.add_column("Cumulative", justify="right")
+        table.add_column("Per call", justify="right")
+
+        for result in results[:top]:
+            table.add_row(
+                escape(result.name),
+                f"{result.calls:,}",
+                format_ns(result.cumulative_ns),
+                format_ns(result.cumulative_ns / result.calls),
+            )
+
+        context.print(table)
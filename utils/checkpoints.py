@@ -0,0 +1,133 @@
+"""Contains the CheckpointStore class for saving the progress of long-running parts on disk."""
+
+# Built-in modules
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+import pickle
+
+# Local modules
+from utils.cli_args import Args
+from utils.files import Files
+
+
+# Matches the hash in file names, so a key is not mistaken for the start of a longer key
+HASH_PATTERN = "?" * 32
+
+
+class CheckpointStore:
+    """
+    Stores snapshots of the state of a part in `data/YYYY/DD/.checkpoints/`.
+
+    Entries are keyed by a hash of the solution source and the puzzle input, so a
+    snapshot is only resumed by the same code on the same input.
+    """
+
+    @staticmethod
+    def get_folder(args: Args) -> Path:
+        """
+        Return the checkpoint folder for a specific year and day.
+
+        Args:
+            args (Args): The parsed command-line arguments.
+
+        Returns:
+            Path: The checkpoint folder.
+        """
+        return Path(
+            Files.get_path(), "data", args.year_str, args.day_str, ".checkpoints"
+        )
+
+    @staticmethod
+    def get_hash(solution_source: bytes, puzzle_input: bytes) -> str:
+        """
+        Hash the solution source and the puzzle input into a checkpoint hash.
+
+        Args:
+            solution_source (bytes): The source of the solution module.
+            puzzle_input (bytes): The contents of the input file.
+
+        Returns:
+            str: The checkpoint hash.
+
+        Example:
+            >>> CheckpointStore.get_hash(b"def part2", b"1") == CheckpointStore.get_hash(b"def part2", b"1")
+            True
+            >>> CheckpointStore.get_hash(b"def part2", b"1") == CheckpointStore.get_hash(b"def part2", b"2")
+            False
+        """
+        digest = sha256()
+        for part in [solution_source, puzzle_input]:
+            digest.update(part)
+            digest.update(b"\0")
+
+        return digest.hexdigest()[:32]
+
+    @staticmethod
+    def load(folder: Path, key: str, digest: str) -> tuple[bool, Any]:
+        """
+        Load the latest snapshot of a key.
+
+        Args:
+            folder (Path): The checkpoint folder.
+            key (str): The name of the checkpoint.
+            digest (str): The current hash from `get_hash`.
+
+        Returns:
+            tuple[bool, Any]: Whether a snapshot was found, and the snapshot.
+        """
+        file_path = Path(folder, f"{key}_{digest}.pickle")
+
+        try:
+            with open(file_path, "rb") as f:
+                return True, pickle.load(f)
+        except FileNotFoundError:
+            return False, None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            file_path.unlink(missing_ok=True)
+            return False, None
+
+    @staticmethod
+    def store(folder: Path, key: str, digest: str, state: Any) -> bool:
+        """
+        Store a snapshot, replacing earlier snapshots of the key.
+
+        Args:
+            folder (Path): The checkpoint folder.
+            key (str): The name of the checkpoint.
+            digest (str): The current hash from `get_hash`.
+            state (Any): The snapshot.
+
+        Returns:
+            bool: True if the snapshot was stored, False if it cannot be pickled.
+        """
+        try:
+            contents = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return False
+
+        folder.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first, so an interrupt while writing keeps the previous snapshot
+        file_path = Path(folder, f"{key}_{digest}.pickle")
+        temp_path = file_path.with_suffix(".tmp")
+        temp_path.write_bytes(contents)
+        temp_path.replace(file_path)
+
+        for stale in folder.glob(f"{key}_{HASH_PATTERN}.pickle"):
+            if stale != file_path:
+                stale.unlink(missing_ok=True)
+
+        return True
+
+    @staticmethod
+    def remove(folder: Path, key: str) -> None:
+        """
+        Remove every snapshot of a key.
+
+        Args:
+            folder (Path): The checkpoint folder.
+            key (str): The name of the checkpoint.
+        """
+        for file_path in folder.glob(f"{key}_{HASH_PATTERN}.pickle"):
+            file_path.unlink(missing_ok=True)
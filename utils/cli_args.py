@@ -1,6 +1,7 @@
 """Module for handling command line arguments."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Literal
 
 
 @dataclass
@@ -19,8 +20,25 @@ class Args:
         create (bool): Whether to create the necessary files for the specified year and day.
         timeit (bool): Whether to time the execution of the solution.
         profile (bool): Whether to profile the execution of the solution.
+        profile_format (str): The format profiles are saved in - "html", "speedscope", "collapsed", "pstats" or "text".
+        profile_out (str | None): The folder profiles are written to, None to open HTML in the browser or print text.
+        profile_interval (float): The sampling interval of the profiler in seconds.
+        line_profile (bool): Whether to print the time of every line run by the part functions.
         quality (bool): Whether to run code quality checks before the solution.
         debug (bool): Whether to run the solution in debug mode.
+        days (list[int]): The days to run in parallel, empty when running a single day.
+        fork_server (bool): Whether to fork each part of a multi-day run from a warm server.
+        watch (bool): Whether to re-run the solution whenever its files change.
+        startup_report (bool): Whether to print the import time breakdown instead of running.
+        cached (bool): Whether to reuse stored answers for solutions whose sources and input are unchanged.
+        concurrent (bool): Whether to run the parts at the same time in forked processes.
+        bench (int): The number of timed benchmark repetitions, 0 to run normally.
+        warmup (int): The number of untimed repetitions run before benchmarking.
+        memory (int): The number of allocation sites to report per part, 0 to not trace memory.
+        count_calls (bool): Whether to count the calls to the solution and helper functions.
+        compare_to (str | None): The git revision to benchmark the working tree against.
+        command (list[str]): The subcommand to run instead of a solution, e.g. ["perf", "history"].
+        bench_gc (str): How the garbage collector is handled while benchmarking - "on", "off" or "freeze".
 
     Properties:
         year_str (str): The year as a string.
@@ -37,8 +55,27 @@ class Args:
     create: bool = False
     timeit: bool = False
     profile: bool = False
+    profile_format: Literal["html", "speedscope", "collapsed", "pstats", "text"] = (
+        "html"
+    )
+    profile_out: str | None = None
+    profile_interval: float = 0.001
+    line_profile: bool = False
     quality: bool = False
     debug: bool = False
+    days: list[int] = field(default_factory=list)
+    fork_server: bool = False
+    watch: bool = False
+    startup_report: bool = False
+    cached: bool = False
+    concurrent: bool = False
+    bench: int = 0
+    warmup: int = 1
+    bench_gc: Literal["on", "off", "freeze"] = "on"
+    memory: int = 0
+    count_calls: bool = False
+    compare_to: str | None = None
+    command: list[str] = field(default_factory=list)
 
     @property
     def year_str(self) -> str:
@@ -49,3 +86,36 @@ class Args:
     def day_str(self) -> str:
         """Return the day as a string with 2 digits."""
         return str(self.day).zfill(2)
+
+
+def parse_days(spec: str) -> list[int]:
+    """
+    Parse a day specification such as "1-25" or "1,3,5-7" into a sorted list of days.
+
+    Args:
+        spec (str): The day specification.
+
+    Returns:
+        list[int]: The sorted, de-duplicated list of days.
+
+    Raises:
+        ValueError: If the specification is malformed or a day is out of range.
+
+    Example:
+        >>> parse_days("1-3,7,2")
+        [1, 2, 3, 7]
+        >>> parse_days("25")
+        [25]
+    """
+    days: set[int] = set()
+
+    for chunk in spec.split(","):
+        start, _, end = chunk.strip().partition("-")
+        first, last = int(start), int(end or start)
+
+        if not 0 < first <= last < 26:
+            raise ValueError(f"Invalid day range: {chunk}")
+
+        days.update(range(first, last + 1))
+
+    return sorted(days)
@@ -0,0 +1,268 @@
+"""Contains the EventLog class for a machine-readable log of every run, and its summary."""
+
+# Built-in modules
+from datetime import datetime
+from json import JSONDecodeError, dumps, loads
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+# Local modules
+from utils.output_handler import OutputHandler
+
+# The events written by the runner, in the order they usually happen
+EVENTS = ["run_start", "test", "answer", "exception", "interrupted"]
+
+
+def sparkline(values: list[float]) -> str:
+    """
+    Draw values as a line of block characters, scaled between their minimum and maximum.
+
+    Args:
+        values (list[float]): The values to draw.
+
+    Returns:
+        str: One block character per value.
+
+    Example:
+        >>> sparkline([1, 2, 3, 4, 5, 6, 7, 8])
+        '▁▂▃▄▅▆▇█'
+        >>> sparkline([3, 3, 3])
+        '▄▄▄'
+    """
+    blocks = "▁▂▃▄▅▆▇█"
+    low, high = min(values, default=0), max(values, default=0)
+
+    if high == low:
+        return blocks[3] * len(values)
+
+    return "".join(
+        blocks[round((value - low) / (high - low) * (len(blocks) - 1))]
+        for value in values
+    )
+
+
+class EventLog:
+    """
+    Appends structured events of every run to a JSON Lines file.
+
+    Every line is a JSON object with the time, the id of the run it belongs to, the
+    event name and its fields, so runs can be analyzed without parsing the text log.
+
+    Attributes:
+        path (Path): The path to the JSON Lines file.
+        run_id (str): The id shared by all events of this run.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize a new EventLog instance.
+
+        Args:
+            path (Path): The path to the JSON Lines file.
+        """
+        self.path = path
+        self.run_id = uuid4().hex[:12]
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """
+        Append an event to the log. Failures to write are ignored, the log is best effort.
+
+        Args:
+            event (str): The name of the event, one of `EVENTS`.
+            **fields (Any): The fields of the event, they must be JSON serializable or
+                are written as strings.
+        """
+        record = {
+            "time": datetime.now().isoformat(timespec="milliseconds"),
+            "run": self.run_id,
+            "event": event,
+            **fields,
+        }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(dumps(record, default=str) + "\n")
+        except OSError:
+            pass
+
+    @staticmethod
+    def load(path: Path, year: int | None = None) -> list[dict[str, Any]]:
+        """
+        Load the events of a log, skipping lines that cannot be read.
+
+        Args:
+            path (Path): The path to the JSON Lines file.
+            year (int | None, optional): Only load the events of this year. Defaults to None.
+
+        Returns:
+            list[dict[str, Any]]: The events in the order they were written.
+        """
+        if not path.exists():
+            return []
+
+        events: list[dict[str, Any]] = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = loads(line)
+                except JSONDecodeError:
+                    continue
+
+                if isinstance(event, dict) and (
+                    year is None or event.get("year") == year
+                ):
+                    events.append(event)
+
+        return events
+
+    @staticmethod
+    def display_stats(
+        context: OutputHandler, events: list[dict[str, Any]], top: int = 10
+    ) -> None:
+        """
+        Print the slowest days, the time trends, the failure rates and the time per year.
+
+        Args:
+            context (OutputHandler): The output handler for the current run of the program.
+            events (list[dict[str, Any]]): The events to summarize.
+            top (int, optional): The number of rows of the day and part tables. Defaults to 10.
+        """
+        from rich.table import Table
+
+        from utils.benchmark import format_ns
+
+        def seconds(value: float) -> str:
+            return format_ns(value * 1e9)
+
+        answers = [
+            event
+            for event in events
+            if event.get("event") == "answer"
+            and not event.get("cached")
+            and {"year", "day", "part", "elapsed"} <= event.keys()
+        ]
+
+        if not answers:
+            context.print_info("No solved parts recorded yet, run a solution first")
+            return
+
+        # Slowest days, by the latest time of each part
+        latest: dict[tuple[int, int], dict[int, float]] = {}
+        timings: dict[tuple[int, int, int], list[float]] = {}
+        for event in answers:
+            key = (event["year"], event["day"])
+            latest.setdefault(key, {})[event["part"]] = event["elapsed"]
+            timings.setdefault((*key, event["part"]), []).append(event["elapsed"])
+
+        table = Table(title="Slowest days", border_style="blue")
+        table.add_column("Day", no_wrap=True)
+        table.add_column("Part 1", justify="right")
+        table.add_column("Part 2", justify="right")
+        table.add_column("Total", justify="right", style="bold blue")
+
+        for (year, day), parts in sorted(
+            latest.items(), key=lambda item: sum(item[1].values()), reverse=True
+        )[:top]:
+            table.add_row(
+                f"{year}/{day:02}",
+                *(seconds(parts[part]) if part in parts else "-" for part in [1, 2]),
+                seconds(sum(parts.values())),
+            )
+
+        context.print(table)
+
+        # Trends, the parts whose time changed the most between their first and latest run
+        trends = [
+            (key, samples)
+            for key, samples in timings.items()
+            if len(samples) > 1 and samples[0] > 0
+        ]
+        if trends:
+            table = Table(title="Time trends", border_style="blue")
+            table.add_column("Part", no_wrap=True)
+            table.add_column("Runs", justify="right")
+            table.add_column("Best", justify="right")
+            table.add_column("Latest", justify="right")
+            table.add_column("Change", justify="right", style="bold")
+            table.add_column("Last 20", no_wrap=True)
+
+            for (year, day, part), samples in sorted(
+                trends,
+                key=lambda item: abs(item[1][-1] / item[1][0] - 1),
+                reverse=True,
+            )[:top]:
+                change = samples[-1] / samples[0] - 1
+                style = "red" if change > 0.1 else "green" if change < -0.1 else ""
+                table.add_row(
+                    f"{year}/{day:02} P{part}",
+                    str(len(samples)),
+                    seconds(min(samples)),
+                    seconds(samples[-1]),
+                    f"[{style}]{change:+.0%}[/{style}]" if style else f"{change:+.0%}",
+                    sparkline(samples[-20:]),
+                )
+
+            context.print(table)
+
+        # Failure rates, the share of runs of a day that failed a test or raised
+        runs: dict[tuple[int, int], set[str]] = {}
+        failed: dict[tuple[int, int], set[str]] = {}
+        for event in events:
+            if event.get("event") not in ["test", "answer", "exception"]:
+                continue
+            if "year" not in event or "day" not in event:
+                continue
+
+            key = (event["year"], event["day"])
+            runs.setdefault(key, set()).add(event.get("run", ""))
+
+            if event["event"] == "exception" or (
+                event["event"] == "test" and event.get("passed") is False
+            ):
+                failed.setdefault(key, set()).add(event.get("run", ""))
+
+        if failed:
+            table = Table(title="Failure rates", border_style="blue")
+            table.add_column("Day", no_wrap=True)
+            table.add_column("Runs", justify="right")
+            table.add_column("Failed", justify="right")
+            table.add_column("Rate", justify="right", style="bold red")
+
+            for (year, day), failures in sorted(
+                failed.items(),
+                key=lambda item: len(item[1]) / len(runs[item[0]]),
+                reverse=True,
+            ):
+                table.add_row(
+                    f"{year}/{day:02}",
+                    str(len(runs[(year, day)])),
+                    str(len(failures)),
+                    f"{len(failures) / len(runs[(year, day)]):.0%}",
+                )
+
+            context.print(table)
+
+        # Time spent per year
+        years: dict[int, list[dict[str, Any]]] = {}
+        for event in answers:
+            years.setdefault(event["year"], []).append(event)
+
+        table = Table(title="Time per year", border_style="blue")
+        table.add_column("Year", no_wrap=True)
+        table.add_column("Runs", justify="right")
+        table.add_column("Parts solved", justify="right")
+        table.add_column("Wall", justify="right")
+        table.add_column("CPU", justify="right", style="bold blue")
+
+        for year, year_answers in sorted(years.items()):
+            table.add_row(
+                str(year),
+                str(len({event.get("run") for event in year_answers})),
+                str(len(year_answers)),
+                seconds(sum(event["elapsed"] for event in year_answers)),
+                seconds(sum(event.get("cpu", 0.0) for event in year_answers)),
+            )
+
+        context.print(table)
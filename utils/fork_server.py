@@ -0,0 +1,137 @@
+"""Helpers for running batch jobs from a warm fork server instead of cold interpreters."""
+
+# Built-in modules
+from ast import Import, ImportFrom, parse, walk
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
+from pathlib import Path
+from timeit import default_timer
+import subprocess
+import sys
+
+# Local modules
+from utils.files import Files
+
+RUNNER_MODULES: list[str] = [
+    "utils.batch_runner",
+    "utils.cli_args",
+    "utils.files",
+    "utils.helper_functions",
+    "utils.output_handler",
+    "utils.puzzle_reader",
+    "utils.solution_base",
+    "rich.console",
+    "rich.logging",
+    "rich.panel",
+    "rich.table",
+    "pyinstrument",
+    "pyperclip",
+    "yaml",
+]
+
+
+class ForkServer:
+    """Creates process pools whose workers are forked from a server with the modules already imported."""
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Return True if the platform supports the forkserver start method."""
+        return "forkserver" in get_all_start_methods()
+
+    @staticmethod
+    def declared_modules(year: int, days: list[int]) -> list[str]:
+        """
+        Collect the top-level modules imported by the solutions of the given days.
+
+        Args:
+            year (int): The year of the puzzle.
+            days (list[int]): The days whose solution files are scanned.
+
+        Returns:
+            list[str]: The sorted module names, excluding the local `utils` and `solutions` packages.
+        """
+        modules: set[str] = set()
+        solution_folder = Path(Files.get_path(), "solutions", str(year))
+
+        for day in days:
+            solution_path = Path(solution_folder, f"{day:02}.py")
+            try:
+                tree = parse(solution_path.read_text(encoding="utf-8"))
+            except (OSError, SyntaxError):
+                continue
+
+            for node in walk(tree):
+                if isinstance(node, Import):
+                    modules.update(alias.name.split(".")[0] for alias in node.names)
+                elif isinstance(node, ImportFrom) and node.module and not node.level:
+                    modules.add(node.module.split(".")[0])
+
+        return sorted(modules - {"utils", "solutions"})
+
+    @staticmethod
+    def create_executor(max_workers: int, preload: list[str]) -> ProcessPoolExecutor:
+        """
+        Create a process pool that forks a fresh child per job from a warm server.
+
+        Modules that fail to import are ignored by the server, so a missing optional
+        dependency only fails the jobs that actually need it. Before Python 3.11 the
+        children cannot be limited to one job, so they are reused between jobs.
+
+        Args:
+            max_workers (int): The maximum number of concurrent children.
+            preload (list[str]): The modules the server imports once before forking.
+
+        Returns:
+            ProcessPoolExecutor: The process pool.
+        """
+        context = get_context("forkserver")
+        context.set_forkserver_preload(preload)
+
+        if sys.version_info >= (3, 11):
+            return ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=context, max_tasks_per_child=1
+            )
+
+        return ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+    @staticmethod
+    def measure_cold_start(modules: list[str]) -> float:
+        """
+        Measure how long a fresh interpreter takes to import the given modules.
+
+        Args:
+            modules (list[str]): The modules to import.
+
+        Returns:
+            float: The wall time in seconds, including interpreter startup.
+        """
+        code = "\n".join(
+            f"try:\n    import {module}\nexcept ImportError:\n    pass"
+            for module in modules
+        )
+        start_time = default_timer()
+        subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Files.get_path(),
+            capture_output=True,
+        )
+        return default_timer() - start_time
+
+    @staticmethod
+    def measure_warm_start(executor: ProcessPoolExecutor) -> float:
+        """
+        Measure how long the pool takes to fork a child and run an empty job.
+
+        The first job also starts the server itself, so it is run once before measuring.
+
+        Args:
+            executor (ProcessPoolExecutor): A pool created by `create_executor`.
+
+        Returns:
+            float: The wall time in seconds.
+        """
+        executor.submit(int).result()
+
+        start_time = default_timer()
+        executor.submit(int).result()
+        return default_timer() - start_time
@@ -0,0 +1,351 @@
+"""
+Contains the GitCompare class for benchmarking the working tree against an older revision.
+
+This module is also run as a script inside the temporary worktree of the older
+revision, so it only imports the standard library at the top level.
+"""
+
+# Built-in modules
+from dataclasses import dataclass, field
+from logging import INFO
+from math import exp, log
+from pathlib import Path
+from random import Random
+from statistics import fmean, median
+from typing import TYPE_CHECKING, Any, TextIO
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+if TYPE_CHECKING:
+    # Local modules
+    from utils.cli_args import Args
+    from utils.output_handler import OutputHandler
+
+
+def speedup_interval(
+    baseline_ns: list[int],
+    current_ns: list[int],
+    confidence: float = 0.95,
+    resamples: int = 2000,
+) -> tuple[float, float, float]:
+    """
+    Estimate how many times faster the current samples are than the baseline.
+
+    The samples are paired by repetition, so slow drifts of the machine affect both
+    sides equally. The estimate is the geometric mean of the paired ratios, and the
+    confidence interval is a seeded bootstrap of it.
+
+    Args:
+        baseline_ns (list[int]): The baseline durations, in nanoseconds.
+        current_ns (list[int]): The current durations, in nanoseconds, in the same order.
+        confidence (float, optional): The confidence level of the interval. Defaults to 0.95.
+        resamples (int, optional): The number of bootstrap resamples. Defaults to 2000.
+
+    Returns:
+        tuple[float, float, float]: The speedup and the lower and upper bounds of its interval.
+
+    Example:
+        >>> speedup_interval([200, 200, 200], [100, 100, 100])
+        (2.0, 2.0, 2.0)
+        >>> speedup, low, high = speedup_interval([210, 190, 205, 195], [100, 100, 100, 100])
+        >>> low <= speedup <= high
+        True
+    """
+    log_ratios = [log(base / cur) for base, cur in zip(baseline_ns, current_ns)]
+    random = Random(0)
+
+    estimates = sorted(
+        fmean(random.choices(log_ratios, k=len(log_ratios))) for _ in range(resamples)
+    )
+    tail = (1 - confidence) / 2
+    low = estimates[int(tail * (resamples - 1))]
+    high = estimates[int((1 - tail) * (resamples - 1))]
+
+    return exp(fmean(log_ratios)), exp(low), exp(high)
+
+
+@dataclass
+class PartComparison:
+    """
+    The alternating samples of one part in both trees.
+
+    Attributes:
+        part (int): The part of the puzzle.
+        baseline_ns (list[int]): The durations at the older revision, in nanoseconds.
+        current_ns (list[int]): The durations in the working tree, in nanoseconds.
+        baseline_answer (str | None): The answer at the older revision.
+        current_answer (str | None): The answer in the working tree.
+    """
+
+    part: int
+    baseline_ns: list[int] = field(default_factory=list)
+    current_ns: list[int] = field(default_factory=list)
+    baseline_answer: str | None = None
+    current_answer: str | None = None
+
+
+class GitCompare:
+    """Runs the same day in the working tree and in a temporary worktree of an older revision."""
+
+    def __init__(self, context: "OutputHandler", args: "Args", revision: str) -> None:
+        """
+        Initialize a new GitCompare instance.
+
+        Args:
+            context (OutputHandler): The output handler for the current run of the program.
+            args (Args): The parsed command-line arguments.
+            revision (str): The git revision to compare against.
+        """
+        self.__context = context
+        self.__args = args
+        self.revision = revision
+        self.root = Path(__file__).resolve().parent.parent
+
+    def __git(self, *command: str) -> str:
+        """Run a git command and return its output, raising RuntimeError on failure."""
+        result = subprocess.run(
+            ["git", *command],
+            cwd=self.root,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"git {command[0]} failed")
+
+        return result.stdout.strip()
+
+    def __start_worker(self, tree: Path) -> subprocess.Popen:
+        """Start a worker process that imports the solution from the given tree."""
+        return subprocess.Popen(
+            [
+                sys.executable,
+                str(Path(self.root, "utils", "git_compare.py")),
+                str(tree),
+                str(self.__args.year),
+                str(self.__args.day),
+            ],
+            cwd=tree,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+
+    @staticmethod
+    def __request(worker: subprocess.Popen, part: int) -> tuple[int, str | None]:
+        """Ask a worker to solve a part and return its duration and answer."""
+        assert worker.stdin is not None and worker.stdout is not None
+
+        worker.stdin.write(f"{part}\n")
+        worker.stdin.flush()
+        reply: dict[str, Any] = json.loads(worker.stdout.readline() or "{}")
+
+        if "ns" not in reply:
+            raise RuntimeError(reply.get("error", "The worker exited unexpectedly"))
+
+        return reply["ns"], reply["answer"]
+
+    def run(
+        self, parts: list[int], repetitions: int, warmup: int
+    ) -> list[PartComparison]:
+        """
+        Solve every part alternately in both trees.
+
+        The revision is checked out into a temporary worktree with a copy of the
+        day's data folder, so both trees read the same input. Each repetition runs
+        both trees back to back, alternating which one goes first.
+
+        Args:
+            parts (list[int]): The parts of the puzzle.
+            repetitions (int): The number of timed repetitions per tree.
+            warmup (int): The number of untimed repetitions run first.
+
+        Returns:
+            list[PartComparison]: The samples of every part.
+
+        Raises:
+            RuntimeError: If the revision cannot be checked out or a worker fails.
+        """
+        commit = self.__git("rev-parse", "--verify", f"{self.revision}^{{commit}}")
+        temp_folder = Path(tempfile.mkdtemp(prefix="aoc-compare-"))
+        tree = Path(temp_folder, "tree")
+        workers: list[subprocess.Popen] = []
+
+        try:
+            self.__git("worktree", "add", "--detach", str(tree), commit)
+
+            # The revision may track files of the day already, the working tree's win
+            data_folder = Path("data", self.__args.year_str, self.__args.day_str)
+            shutil.copytree(
+                Path(self.root, data_folder),
+                Path(tree, data_folder),
+                ignore=shutil.ignore_patterns(".*"),
+                dirs_exist_ok=True,
+            )
+
+            workers = [self.__start_worker(tree), self.__start_worker(self.root)]
+            comparisons: list[PartComparison] = []
+
+            for part in parts:
+                comparison = PartComparison(part=part)
+                comparisons.append(comparison)
+
+                for repetition in range(warmup + repetitions):
+                    order = [0, 1] if repetition % 2 == 0 else [1, 0]
+                    samples: dict[int, tuple[int, str | None]] = {
+                        side: GitCompare.__request(workers[side], part)
+                        for side in order
+                    }
+
+                    baseline_ns, comparison.baseline_answer = samples[0]
+                    current_ns, comparison.current_answer = samples[1]
+
+                    if repetition >= warmup:
+                        comparison.baseline_ns.append(baseline_ns)
+                        comparison.current_ns.append(current_ns)
+
+            return comparisons
+        finally:
+            for worker in workers:
+                worker.kill()
+                worker.wait()
+
+            try:
+                self.__git("worktree", "remove", "--force", str(tree))
+            except RuntimeError:
+                self.__git("worktree", "prune")
+            shutil.rmtree(temp_folder, ignore_errors=True)
+
+    def display(self, comparisons: list[PartComparison]) -> None:
+        """
+        Print the speedup of every part with its confidence interval, and log it.
+
+        Args:
+            comparisons (list[PartComparison]): The samples of every part.
+        """
+        from rich.table import Table
+
+        from utils.benchmark import format_ns
+
+        table = Table(
+            title=f"{self.__args.year}/{self.__args.day_str} vs {self.revision}",
+            caption="Speedup > 1 means the working tree is faster",
+            border_style="blue",
+        )
+        table.add_column("Part", justify="right")
+        table.add_column(self.revision, justify="right")
+        table.add_column("Working tree", justify="right")
+        table.add_column("Speedup", justify="right", style="bold blue")
+        table.add_column("95% CI", justify="right")
+
+        for comparison in comparisons:
+            speedup, low, high = speedup_interval(
+                comparison.baseline_ns, comparison.current_ns
+            )
+            style = "green" if low > 1 else "red" if high < 1 else ""
+
+            table.add_row(
+                str(comparison.part),
+                format_ns(median(comparison.baseline_ns)),
+                format_ns(median(comparison.current_ns)),
+                f"[{style}]{speedup:.3f}x[/]" if style else f"{speedup:.3f}x",
+                f"{low:.3f}x - {high:.3f}x",
+            )
+            self.__context.log(
+                INFO,
+                f"Compare | Year {self.__args.year} | Day {self.__args.day} | "
+                f"Part {comparison.part} | vs {self.revision} | "
+                f"runs: {len(comparison.current_ns)} | speedup: {speedup:.3f}x | "
+                f"ci: {low:.3f}x-{high:.3f}x",
+            )
+
+            if comparison.baseline_answer != comparison.current_answer:
+                self.__context.print_warning(
+                    f"Part {comparison.part} answers differ: {comparison.baseline_answer} "
+                    f"at {self.revision}, {comparison.current_answer} in the working tree"
+                )
+
+        self.__context.print(table)
+
+
+def serve(year: int, day: int, requests: TextIO, replies: TextIO) -> None:
+    """
+    Solve the parts read from `requests`, replying with one JSON line each.
+
+    Runs inside a tree with its own `utils` and `solutions` on `sys.path`, so the
+    solution and the runner code are those of that tree. Like `Benchmark`, only the
+    parse and the part are timed, the input is read before, so differences in how the
+    trees read files do not count.
+
+    Args:
+        year (int): The year of the puzzle.
+        day (int): The day of the puzzle.
+        requests (TextIO): The stream of part numbers, one per line.
+        replies (TextIO): The stream the replies are written to.
+    """
+    from importlib import import_module
+    from time import perf_counter_ns
+
+    try:
+        from rich.console import Console
+
+        from utils.cli_args import Args
+        from utils.output_handler import Logger, OutputHandler
+        from utils.puzzle_reader import PuzzleReader
+
+        args = Args(year=year, day=day, skip_test=True)
+        console = Console(quiet=True)
+        context = OutputHandler(
+            logger=Logger(name=f"{year}-{day}-compare", console=console),
+            console=console,
+        )
+        module = import_module(f"solutions.{year}.{args.day_str}")
+        solution = getattr(module, "Solution")(context=context, args=args)
+
+        # Caches would skip the parse on one side only, so parse on every run
+        for name, value in {"share_parsed": "none", "parse_cache": False}.items():
+            if hasattr(solution, name):
+                setattr(solution, name, value)
+    except (Exception, SystemExit) as e:
+        error = f"{type(e).__name__}: {e}"
+        for _ in requests:
+            replies.write(json.dumps({"error": error}) + "\n")
+            replies.flush()
+        return
+
+    for line in requests:
+        try:
+            part = int(line)
+            func = getattr(solution, f"part{part}")
+            solution.is_test = False
+            solution.is_part_1 = part == 1
+
+            # Read outside of the timed region, the solution may mutate its input
+            puzzle_input: Any = PuzzleReader.get_input(
+                context, args, solution.raw_input
+            )
+            if puzzle_input is None:
+                raise FileNotFoundError("The puzzle input is missing")
+
+            start_time = perf_counter_ns()
+            answer: Any = func(solution.parse(puzzle_input))
+            reply = {"ns": perf_counter_ns() - start_time, "answer": str(answer)}
+        except (Exception, SystemExit) as e:
+            reply = {"error": f"{type(e).__name__}: {e}"}
+
+        replies.write(json.dumps(reply) + "\n")
+        replies.flush()
+
+
+if __name__ == "__main__":
+    # Import everything from the tree being measured instead of this file's folder
+    sys.path[0] = sys.argv[1]
+    os.chdir(sys.argv[1])
+
+    # Anything the solution prints must not end up in the replies
+    replies, sys.stdout = sys.stdout, sys.stderr
+    serve(int(sys.argv[2]), int(sys.argv[3]), sys.stdin, replies)
@@ -0,0 +1,331 @@
+"""Contains the LineProfiler class for timing the lines of a part with `sys.monitoring`."""
+
+# Built-in modules
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter_ns
+from types import CodeType, ModuleType
+from typing import Any
+import linecache
+import sys
+
+# Local modules
+from utils.call_counter import CallCounter
+from utils.files import Files
+from utils.output_handler import OutputHandler
+
+
+@dataclass
+class LineTime:
+    """
+    The executions of a single source line.
+
+    Attributes:
+        hits (int): The number of times the line was executed.
+        time_ns (int): The time spent on the line in nanoseconds, including the
+            functions it called.
+    """
+
+    hits: int = 0
+    time_ns: int = 0
+
+
+@dataclass
+class FunctionLines:
+    """
+    The line timings of a function, including its lambdas and comprehensions.
+
+    Attributes:
+        name (str): The qualified name of the function and its location.
+        file (str): The file the function is defined in.
+        first_line (int): The first line of the function.
+        last_line (int): The last line of the function.
+        lines (dict[int, LineTime]): The executed lines keyed by line number.
+    """
+
+    name: str
+    file: str
+    first_line: int
+    last_line: int
+    lines: dict[int, LineTime] = field(default_factory=dict)
+
+
+class LineProfiler:
+    """
+    Times every line of the functions of a few modules.
+
+    Only the code objects of the given modules get `sys.monitoring` line events. The
+    time of a line runs until the next line of the same function starts, so a line
+    that calls another function includes the time spent in it. Lambdas, comprehensions,
+    nested functions and recursive calls are timed on the lines of the function around
+    them instead, so no time is counted twice in one function.
+    """
+
+    def __init__(self, modules: list[ModuleType]) -> None:
+        """
+        Initialize a new LineProfiler instance.
+
+        Args:
+            modules (list[ModuleType]): The modules whose functions are timed.
+        """
+        self.__codes = CallCounter.get_codes(modules)
+
+        # The outermost function around every code object, its lines are shown together
+        self.__owners: dict[CodeType, CodeType] = {}
+        nested = {
+            constant
+            for code in self.__codes
+            for constant in code.co_consts
+            if isinstance(constant, CodeType)
+        }
+        for code in self.__codes - nested:
+            LineProfiler.__set_owner(code, code, self.__owners)
+
+        self.__tool: int | None = None
+        self.__started: int = 0
+        self.total_ns: int = 0
+
+        # The running frames as [code, current line, time the line started]
+        self.__stack: list[list[Any]] = []
+        # Line times keyed by the owner of the code that ran them
+        self.__lines: dict[tuple[CodeType, int], LineTime] = {}
+
+    @staticmethod
+    def __set_owner(
+        code: CodeType, owner: CodeType, owners: dict[CodeType, CodeType]
+    ) -> None:
+        """Record the owner of a code object and of the code objects nested in it."""
+        owners[code] = owner
+        for constant in code.co_consts:
+            if isinstance(constant, CodeType):
+                LineProfiler.__set_owner(constant, owner, owners)
+
+    def start(self) -> None:
+        """
+        Start timing lines.
+
+        Raises:
+            RuntimeError: If the Python version is older than 3.12, or every
+                `sys.monitoring` tool id is already in use.
+        """
+        if sys.version_info < (3, 12):
+            raise RuntimeError("Profiling lines requires Python 3.12 or newer")
+
+        monitoring = sys.monitoring
+        events = monitoring.events
+
+        self.__tool = CallCounter.use_tool_id("aoc line profiler")
+        monitoring.register_callback(self.__tool, events.PY_START, self.__on_start)
+        monitoring.register_callback(self.__tool, events.PY_RESUME, self.__on_start)
+        monitoring.register_callback(self.__tool, events.LINE, self.__on_line)
+        monitoring.register_callback(self.__tool, events.PY_RETURN, self.__on_exit)
+        monitoring.register_callback(self.__tool, events.PY_YIELD, self.__on_exit)
+        monitoring.register_callback(self.__tool, events.PY_UNWIND, self.__on_unwind)
+
+        local_events = (
+            events.PY_START
+            | events.PY_RESUME
+            | events.LINE
+            | events.PY_RETURN
+            | events.PY_YIELD
+        )
+        for code in self.__codes:
+            monitoring.set_local_events(self.__tool, code, local_events)
+
+        # Unwinding cannot be scoped to code objects, it only fires when an exception escapes
+        monitoring.set_events(self.__tool, events.PY_UNWIND)
+        self.__started = perf_counter_ns()
+
+    def __push(self, code: CodeType, now: int) -> None:
+        """Push a frame, pausing the line of its caller if both belong to the same function."""
+        if self.__stack:
+            caller = self.__stack[-1]
+            if caller[1] and self.__owners[caller[0]] is self.__owners[code]:
+                self.__add_time(caller, now)
+
+        self.__stack.append([code, 0, now])
+
+    def __add_time(self, frame: list[Any], now: int) -> None:
+        """Add the time since the current line of a frame started to that line."""
+        self.__lines[(self.__owners[frame[0]], frame[1])].time_ns += now - frame[2]
+        frame[2] = now
+
+    def __on_start(self, code: CodeType, offset: int) -> None:
+        """Push a frame that starts or resumes."""
+        self.__push(code, perf_counter_ns())
+
+    def __on_line(self, code: CodeType, line: int) -> None:
+        """Close the previous line of the running frame and start the next one."""
+        now = perf_counter_ns()
+        # Frames that were already running when the profiler started have no entry
+        if not self.__stack or self.__stack[-1][0] is not code:
+            self.__push(code, now)
+
+        frame = self.__stack[-1]
+        if frame[1]:
+            self.__add_time(frame, now)
+
+        key = (self.__owners[code], line)
+        times = self.__lines.get(key)
+        if times is None:
+            times = self.__lines[key] = LineTime()
+        times.hits += 1
+
+        frame[1] = line
+        frame[2] = now
+
+    def __on_exit(self, code: CodeType, offset: int, value: Any) -> None:
+        """Close the last line of a frame that returns or yields, resuming the line of its caller."""
+        if not self.__stack or self.__stack[-1][0] is not code:
+            return
+
+        now = perf_counter_ns()
+        frame = self.__stack.pop()
+        if frame[1]:
+            self.__add_time(frame, now)
+
+        if self.__stack and self.__owners[self.__stack[-1][0]] is self.__owners[code]:
+            self.__stack[-1][2] = now
+
+    def __on_unwind(
+        self, code: CodeType, offset: int, exception: BaseException
+    ) -> None:
+        """Close the last line of a timed frame that exits with an exception."""
+        if code in self.__codes:
+            self.__on_exit(code, offset, exception)
+
+    def stop(self) -> list[FunctionLines]:
+        """
+        Stop timing lines.
+
+        Returns:
+            list[FunctionLines]: The functions that ran, slowest line first.
+        """
+        self.total_ns = perf_counter_ns() - self.__started
+
+        # The tool is only claimed on 3.12+, the version check is for type checkers
+        if self.__tool is not None and sys.version_info >= (3, 12):
+            monitoring = sys.monitoring
+            for code in self.__codes:
+                monitoring.set_local_events(
+                    self.__tool, code, monitoring.events.NO_EVENTS
+                )
+            monitoring.set_events(self.__tool, monitoring.events.NO_EVENTS)
+            monitoring.free_tool_id(self.__tool)
+            self.__tool = None
+
+        # A function ends at the last line of the code nested in it
+        last_lines: dict[CodeType, int] = {}
+        for code, owner in self.__owners.items():
+            last_lines[owner] = max(last_lines.get(owner, 0), LineProfiler.__last(code))
+
+        root = Files.get_path()
+        functions: dict[CodeType, FunctionLines] = {}
+
+        for (owner, line), times in self.__lines.items():
+            if owner not in functions:
+                path = Path(owner.co_filename)
+                if path.is_relative_to(root):
+                    path = path.relative_to(root)
+
+                name = (
+                    owner.co_qualname if sys.version_info >= (3, 11) else owner.co_name
+                )
+                functions[owner] = FunctionLines(
+                    name=f"{name} ({path.as_posix()}:{owner.co_firstlineno})",
+                    file=owner.co_filename,
+                    first_line=owner.co_firstlineno,
+                    last_line=last_lines[owner],
+                )
+
+            functions[owner].lines[line] = times
+
+        return sorted(
+            functions.values(),
+            key=lambda function: max(
+                (times.time_ns for times in function.lines.values()), default=0
+            ),
+            reverse=True,
+        )
+
+    @staticmethod
+    def __last(code: CodeType) -> int:
+        """Return the last line of a code object."""
+        return max(
+            (line for _, _, line in code.co_lines() if line is not None),
+            default=code.co_firstlineno,
+        )
+
+    @staticmethod
+    def display(
+        context: OutputHandler,
+        part: int,
+        functions: list[FunctionLines],
+        total_ns: int,
+        top: int = 10,
+    ) -> None:
+        """
+        Print the source of the slowest functions of a part, annotated with the time of every line.
+
+        Args:
+            context (OutputHandler): The output handler for the current run of the program.
+            part (int): The part of the puzzle.
+            functions (list[FunctionLines]): The timed functions.
+            total_ns (int): The time taken by the part in nanoseconds.
+            top (int, optional): The number of functions to show. Defaults to 10.
+        """
+        from rich.markup import escape
+        from rich.table import Table
+
+        from utils.benchmark import format_ns
+
+        for function in functions[:top]:
+            # Skip the signature and docstring, from the def line to the first executed line
+            first_hit = min(function.lines, default=function.first_line)
+            lines = [function.first_line] + list(
+                range(max(first_hit, function.first_line + 1), function.last_line + 1)
+            )
+            sources = {
+                line: linecache.getline(function.file, line).rstrip() for line in lines
+            }
+            indent = min(
+                (
+                    len(source) - len(source.lstrip())
+                    for source in sources.values()
+                    if source
+                ),
+                default=0,
+            )
+
+            table = Table(title=f"Part {part} · {function.name}", border_style="blue")
+            table.add_column("Line", justify="right", no_wrap=True, min_width=4)
+            table.add_column(
+                "Hits", justify="right", style="bold blue", no_wrap=True, min_width=6
+            )
+            table.add_column("Time", justify="right", no_wrap=True, min_width=8)
+            table.add_column("Per hit", justify="right", no_wrap=True, min_width=8)
+            table.add_column("%", justify="right", no_wrap=True, min_width=6)
+            table.add_column("Source", overflow="ellipsis")
+
+            for line, source in sources.items():
+                if line == first_hit and line > function.first_line + 1:
+                    table.add_row("", "", "", "", "", "⋮", style="dim")
+
+                times = function.lines.get(line)
+                if times is None:
+                    table.add_row(str(line), "", "", "", "", escape(source[indent:]))
+                    continue
+
+                share = times.time_ns / total_ns if total_ns else 0.0
+                table.add_row(
+                    str(line),
+                    f"{times.hits:,}",
+                    format_ns(times.time_ns),
+                    format_ns(times.time_ns / times.hits),
+                    f"{share:.1%}",
+                    escape(source[indent:]),
+                    # Lines that take a tenth of the part are worth a look first
+                    style="red" if share >= 0.1 else None,
+                )
+
+            context.print(table)
@@ -0,0 +1,241 @@
+"""Contains the MemoryTracker class for measuring the memory used by a part."""
+
+# Built-in modules
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Event, Thread
+import linecache
+import threading
+import tracemalloc
+
+# Local modules
+from utils.files import Files
+from utils.output_handler import OutputHandler
+
+
+def format_bytes(size: float) -> str:
+    """
+    Format a number of bytes for display.
+
+    Args:
+        size (float): The number of bytes.
+
+    Returns:
+        str: The formatted size.
+
+    Example:
+        >>> format_bytes(512)
+        '512B'
+        >>> format_bytes(1536)
+        '1.5KiB'
+        >>> format_bytes(-3 * 1024**2)
+        '-3.0MiB'
+    """
+    for unit in ["B", "KiB", "MiB"]:
+        if abs(size) < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+
+    return f"{size:.2f}GiB"
+
+
+@dataclass
+class AllocationSite:
+    """
+    A source line and the memory allocated by it.
+
+    Attributes:
+        location (str): The file and line number.
+        source (str): The source code of the line.
+        size (int): The bytes allocated by the line that were alive when measured.
+        count (int): The number of memory blocks allocated by the line that were alive when measured.
+    """
+
+    location: str
+    source: str
+    size: int
+    count: int
+
+
+@dataclass
+class MemoryUsage:
+    """
+    The memory used while solving a part.
+
+    Attributes:
+        peak (int): The most bytes allocated at once, relative to the start.
+        retained (int): The bytes still allocated when the part returned.
+        sites (list[AllocationSite]): The source lines with the largest allocations.
+        near_peak (bool): Whether the sites were measured close to the peak, rather than at the end.
+    """
+
+    peak: int
+    retained: int
+    sites: list[AllocationSite] = field(default_factory=list)
+    near_peak: bool = False
+
+
+class MemoryTracker:
+    """
+    Traces the allocations made while solving a part with `tracemalloc`.
+
+    Intermediate structures are usually freed before the part returns, so a background
+    thread takes a snapshot every time the traced memory grows significantly. The
+    allocation sites are then taken from the snapshot closest to the peak.
+
+    Attributes:
+        top (int): The number of allocation sites to report.
+        interval (float): The delay between checks of the traced memory in seconds.
+    """
+
+    # Snapshots are expensive, only take another one once the memory grew by this factor
+    GROWTH: float = 1.25
+
+    def __init__(self, top: int = 10, interval: float = 0.05) -> None:
+        """
+        Initialize a new MemoryTracker instance.
+
+        Args:
+            top (int, optional): The number of allocation sites to report. Defaults to 10.
+            interval (float, optional): The delay between checks of the traced memory in seconds. Defaults to 0.05.
+        """
+        self.top = top
+        self.interval = interval
+
+        self.__baseline: int = 0
+        self.__sampled: int = 0
+        self.__snapshot: tracemalloc.Snapshot | None = None
+        self.__stop = Event()
+        self.__thread: Thread | None = None
+
+    def start(self) -> None:
+        """Start tracing allocations."""
+        # Small parts are covered by the final snapshot, only sample above 1MiB
+        self.__sampled = 1024**2
+        self.__snapshot = None
+
+        # Start the sampler first, so its own allocations are not traced
+        self.__stop.clear()
+        self.__thread = Thread(target=self.__sample, daemon=True)
+        self.__thread.start()
+
+        tracemalloc.start()
+        self.__baseline = tracemalloc.get_traced_memory()[0]
+
+    def __sample(self) -> None:
+        """Take a snapshot whenever the traced memory grew past the last one."""
+        while not self.__stop.wait(self.interval):
+            current = tracemalloc.get_traced_memory()[0]
+            if current - self.__baseline > self.__sampled * MemoryTracker.GROWTH:
+                self.__snapshot = tracemalloc.take_snapshot()
+                self.__sampled = current - self.__baseline
+
+    def stop(self) -> MemoryUsage:
+        """
+        Stop tracing allocations.
+
+        Returns:
+            MemoryUsage: The peak and retained memory and the largest allocation sites.
+        """
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+
+        current, peak = tracemalloc.get_traced_memory()
+        final = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        # Fall back to the final snapshot for parts that finish before the first sample
+        near_peak = (
+            self.__snapshot is not None and self.__sampled > current - self.__baseline
+        )
+        snapshot = self.__snapshot if near_peak and self.__snapshot else final
+
+        return MemoryUsage(
+            peak=peak - self.__baseline,
+            retained=current - self.__baseline,
+            sites=self.__get_sites(snapshot),
+            near_peak=near_peak,
+        )
+
+    def __get_sites(self, snapshot: tracemalloc.Snapshot) -> list[AllocationSite]:
+        """Return the source lines with the largest allocations in a snapshot."""
+        snapshot = snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                # The bookkeeping of --count-calls when both are enabled
+                tracemalloc.Filter(
+                    False, str(Path(__file__).with_name("call_counter.py"))
+                ),
+                # Stack samples, should a sampler run alongside the tracker
+                tracemalloc.Filter(
+                    False, str(Path(__file__).with_name("stack_sampler.py"))
+                ),
+                tracemalloc.Filter(False, threading.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            ]
+        )
+
+        root = Files.get_path()
+        sites: list[AllocationSite] = []
+
+        for statistic in snapshot.statistics("lineno")[: self.top]:
+            frame = statistic.traceback[0]
+            path = Path(frame.filename)
+            # Library paths are long, their file name is enough to recognize them
+            name = (
+                path.relative_to(root).as_posix()
+                if path.is_relative_to(root)
+                else path.name
+            )
+
+            sites.append(
+                AllocationSite(
+                    location=f"{name}:{frame.lineno}",
+                    source=linecache.getline(frame.filename, frame.lineno).strip(),
+                    size=statistic.size,
+                    count=statistic.count,
+                )
+            )
+
+        return sites
+
+    @staticmethod
+    def display(context: OutputHandler, part: int, usage: MemoryUsage) -> None:
+        """
+        Print the largest allocation sites of a part.
+
+        Args:
+            context (OutputHandler): The output handler for the current run of the program.
+            part (int): The part of the puzzle.
+            usage (MemoryUsage): The memory used by the part.
+        """
+        from rich.markup import escape
+        from rich.table import Table
+
+        if not usage.sites:
+            return
+
+        table = Table(
+            title=f"Part {part} allocations "
+            + ("near the peak" if usage.near_peak else "when it returned"),
+            border_style="blue",
+        )
+        table.add_column(
+            "Size", justify="right", style="bold blue", no_wrap=True, min_width=8
+        )
+        table.add_column("Blocks", justify="right", no_wrap=True, min_width=6)
+        table.add_column("Line", no_wrap=True)
+        table.add_column("Source", overflow="ellipsis")
+
+        for site in usage.sites:
+            table.add_row(
+                format_bytes(site.size),
+                str(site.count),
+                site.location,
+                escape(site.source),
+            )
+
+        context.print(table)
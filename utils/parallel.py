@@ -0,0 +1,274 @@
+"""Contains the WorkerPool class that runs the parallel helpers of `SolutionBase` in other processes."""
+
+# Built-in modules
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing import get_context
+from pickle import PicklingError, dumps
+from typing import Any, Callable
+import os
+import signal
+
+# Local modules
+from utils.fork_server import ForkServer, RUNNER_MODULES
+
+
+def available_cores() -> int:
+    """
+    Return the number of cores this process may run on.
+
+    Containers and `taskset` often allow fewer cores than the machine has, so the
+    affinity of the process is preferred over the total count.
+
+    Returns:
+        int: The number of usable cores, at least 1.
+    """
+    if hasattr(os, "process_cpu_count"):
+        return os.process_cpu_count() or 1
+
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+
+    return os.cpu_count() or 1
+
+
+def is_picklable(value: Any) -> bool:
+    """
+    Return whether a value can be sent to a worker process.
+
+    Args:
+        value (Any): The value to check, usually a function.
+
+    Returns:
+        bool: True if the value can be pickled.
+
+    Example:
+        >>> is_picklable(max)
+        True
+        >>> is_picklable(lambda x: x)
+        False
+    """
+    try:
+        dumps(value)
+    except (PicklingError, TypeError, AttributeError):
+        return False
+
+    return True
+
+
+# The id of the running search and its lowest block known to contain a hit, shared by
+# all workers. Blocks above the bound and blocks of other searches stop early
+_search_bound: Any = None
+_NO_BOUND = 2**63 - 1
+
+
+def _init_worker(bound: Any) -> None:
+    """Keep the shared search bound, and leave Ctrl-C to the runner so workers do not print a traceback each."""
+    global _search_bound
+    _search_bound = bound
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _lower_bound(bound: Any, search: int, block: int) -> None:
+    """Lower the shared bound of a search to a block, unless it is already lower or the search is over."""
+    with bound.get_lock():
+        if bound[0] == search and block < bound[1]:
+            bound[1] = block
+
+
+def search_block(
+    predicate: Callable[[int], bool],
+    start: int,
+    step: int,
+    block: int,
+    stride: int,
+    search: int = 0,
+) -> int | None:
+    """
+    Return the first value of a block of a search that satisfies a predicate.
+
+    Block `block` holds the `stride` values starting at `start + block * stride * step`.
+    The block is abandoned once a lower block found a value, since no value in it can
+    be the smallest anymore, or once the search it belongs to is over.
+
+    Args:
+        predicate (Callable[[int], bool]): The condition the value must satisfy.
+        start (int): The first value of the search.
+        step (int): The difference between consecutive values.
+        block (int): The index of the block.
+        stride (int): The number of values in a block.
+        search (int, optional): The id of the search the block belongs to. Defaults to 0.
+
+    Returns:
+        int | None: The first value that satisfies the predicate, None if there is none
+            or the block was abandoned.
+
+    Example:
+        >>> search_block(lambda value: value % 5 == 0, 1, 2, 1, 5)
+        15
+        >>> search_block(lambda value: value > 100, 0, 1, 0, 10) is None
+        True
+    """
+    first = start + block * stride * step
+
+    for index in range(stride):
+        # Reading the shared bound takes a lock, checking it every value would cost more than most predicates
+        if (
+            not index % 256
+            and _search_bound is not None
+            and (_search_bound[0] != search or _search_bound[1] < block)
+        ):
+            return None
+
+        value = first + index * step
+        if predicate(value):
+            if _search_bound is not None:
+                _lower_bound(_search_bound, search, block)
+            return value
+
+    return None
+
+
+class WorkerPool:
+    """
+    A process pool that is only started the first time it is needed.
+
+    Workers are forked from a fork server with the runner modules imported where the
+    platform supports it, so they start quickly without inheriting the threads of the
+    runner. The solution module itself is not preloaded, so a pool created after the
+    solution was reloaded in watch mode runs the new code.
+
+    Attributes:
+        workers (int): The number of worker processes.
+    """
+
+    def __init__(self, workers: int | None = None) -> None:
+        """
+        Initialize a new WorkerPool instance.
+
+        Args:
+            workers (int | None, optional): The number of worker processes. Defaults to
+                the number of available cores.
+        """
+        self.workers = workers or available_cores()
+        self.__executor: ProcessPoolExecutor | None = None
+        self.__bound: Any = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Return the process pool, starting it on first use."""
+        if self.__executor is None:
+            if ForkServer.is_supported():
+                context = get_context("forkserver")
+                context.set_forkserver_preload(RUNNER_MODULES)
+            else:
+                context = get_context()
+
+            # Shared values can only be handed to workers when they start
+            self.__bound = context.Array("q", [0, _NO_BOUND])
+            self.__executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self.__bound,),
+            )
+
+        return self.__executor
+
+    def search(
+        self,
+        predicate: Callable[[int], bool],
+        start: int,
+        step: int,
+        stride: int,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """
+        Return the smallest value of `start + n * step` that satisfies a predicate.
+
+        The values are split into blocks of `stride` values that are handed out to the
+        workers in order, a few per worker at a time. Once a block finds a value, blocks
+        after it are no longer started, and the search ends as soon as every block before
+        it has finished. Blocks that are still running are then stopped through the
+        shared bound, which also keeps them from affecting later searches.
+
+        Args:
+            predicate (Callable[[int], bool]): The condition the value must satisfy.
+            start (int): The first value of the search.
+            step (int): The difference between consecutive values.
+            stride (int): The number of values in a block.
+            progress (Callable[[int], None] | None, optional): Called with the number of
+                values from the start that have all been checked, every time a block
+                finishes. Defaults to None.
+
+        Returns:
+            int: The smallest value that satisfies the predicate.
+        """
+        executor = self.executor
+        with self.__bound.get_lock():
+            search = self.__bound[0] + 1
+            self.__bound[:] = [search, _NO_BOUND]
+
+        pending: dict[Future[int | None], int] = {}
+        next_block = 0
+        # (block, value) of the lowest block with a hit so far
+        best: tuple[int, int] | None = None
+        # The lowest block that has not finished, and the finished blocks above it
+        unfinished = 0
+        finished: set[int] = set()
+
+        try:
+            while True:
+                while len(pending) < self.workers * 2 and (
+                    best is None or next_block < best[0]
+                ):
+                    future = executor.submit(
+                        search_block, predicate, start, step, next_block, stride, search
+                    )
+                    pending[future] = next_block
+                    next_block += 1
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    block = pending.pop(future)
+                    value = future.result()
+
+                    if value is not None and (best is None or block < best[0]):
+                        best = (block, value)
+                        _lower_bound(self.__bound, search, block)
+
+                    finished.add(block)
+                    while unfinished in finished:
+                        finished.remove(unfinished)
+                        unfinished += 1
+
+                if progress is not None:
+                    progress(unfinished * stride)
+
+                # Every block that could hold a smaller value has finished
+                if best is not None and all(
+                    block > best[0] for block in pending.values()
+                ):
+                    return best[1]
+        finally:
+            for future in pending:
+                future.cancel()
+            with self.__bound.get_lock():
+                self.__bound[0] = search + 1
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, cancelling queued tasks and terminating running ones."""
+        if self.__executor is None:
+            return
+
+        # There is no public way to stop running tasks before Python 3.14, and waiting
+        # for them would make an interrupted search hang until its chunk is done
+        processes = list((getattr(self.__executor, "_processes", None) or {}).values())
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
+        self.__executor = None
+        self.__bound = None
@@ -0,0 +1,118 @@
+"""Contains the ParseCache class for storing parsed puzzle input on disk."""
+
+# Built-in modules
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+import pickle
+import sys
+
+# Local modules
+from utils.cli_args import Args
+from utils.files import Files
+
+
+class ParseCache:
+    """
+    Stores the output of `parse()` in `data/YYYY/DD/.cache/`.
+
+    Entries are keyed by a hash of the input and of the parser source, so editing
+    either one automatically invalidates the cached result.
+    """
+
+    @staticmethod
+    def get_folder(args: Args) -> Path:
+        """
+        Return the cache folder for a specific year and day.
+
+        Args:
+            args (Args): The parsed command-line arguments.
+
+        Returns:
+            Path: The cache folder.
+        """
+        return Path(Files.get_path(), "data", args.year_str, args.day_str, ".cache")
+
+    @staticmethod
+    def get_key(puzzle_input: list[str] | str, parser_source: str) -> str:
+        """
+        Hash the input and the parser source into a cache key.
+
+        Args:
+            puzzle_input (list[str] | str): The input passed to `parse()`.
+            parser_source (str): The source of the parser, including anything else the output depends on.
+
+        Returns:
+            str: The cache key.
+
+        Example:
+            >>> ParseCache.get_key("1\\n2", "def parse") == ParseCache.get_key("1\\n2", "def parse")
+            True
+            >>> ParseCache.get_key("1\\n2", "def parse") == ParseCache.get_key("1\\n3", "def parse")
+            False
+        """
+        raw: str = (
+            "\n".join(puzzle_input) if isinstance(puzzle_input, list) else puzzle_input
+        )
+
+        digest = sha256()
+        for part in [sys.version, type(puzzle_input).__name__, parser_source, raw]:
+            digest.update(part.encode())
+            digest.update(b"\0")
+
+        return digest.hexdigest()[:32]
+
+    @staticmethod
+    def load(folder: Path, name: str, key: str) -> tuple[bool, Any]:
+        """
+        Load a cached result.
+
+        Args:
+            folder (Path): The cache folder.
+            name (str): The name of the entry, e.g. "input" or "test".
+            key (str): The cache key.
+
+        Returns:
+            tuple[bool, Any]: Whether the entry was found, and the cached result.
+        """
+        file_path = Path(folder, f"{name}_{key}.pickle")
+
+        try:
+            with open(file_path, "rb") as f:
+                return True, pickle.load(f)
+        except FileNotFoundError:
+            return False, None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            file_path.unlink(missing_ok=True)
+            return False, None
+
+    @staticmethod
+    def store(folder: Path, name: str, key: str, data: Any) -> bool:
+        """
+        Store a result, removing stale entries with the same name.
+
+        Args:
+            folder (Path): The cache folder.
+            name (str): The name of the entry, e.g. "input" or "test".
+            key (str): The cache key.
+            data (Any): The result of `parse()`.
+
+        Returns:
+            bool: True if the result was stored, False if it cannot be pickled.
+        """
+        try:
+            contents = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return False
+
+        folder.mkdir(parents=True, exist_ok=True)
+        for stale in folder.glob(f"{name}_*.pickle"):
+            stale.unlink(missing_ok=True)
+
+        # Write to a temporary file first, so an interrupted run never leaves a partial entry
+        file_path = Path(folder, f"{name}_{key}.pickle")
+        temp_path = file_path.with_suffix(".tmp")
+        temp_path.write_bytes(contents)
+        temp_path.replace(file_path)
+
+        return True
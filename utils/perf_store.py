@@ -0,0 +1,334 @@
+"""Contains the PerfStore class for keeping a queryable history of timed runs."""
+
+# Built-in modules
+from dataclasses import astuple, dataclass, fields
+from datetime import datetime
+from functools import cache
+from hashlib import sha256
+from pathlib import Path
+from statistics import median
+import platform
+import sqlite3
+import subprocess
+import sys
+
+# Local modules
+from utils.cli_args import Args
+from utils.files import Files
+from utils.output_handler import OutputHandler
+
+# Fewest timings on each side of a comparison, a single run is too noisy to flag
+MIN_SAMPLES = 3
+
+
+@dataclass
+class PerfRun:
+    """
+    A single timed run of a part, as stored in the benchmark database.
+
+    Attributes:
+        timestamp (str): When the run finished, in ISO format.
+        commit (str | None): The git revision of the repository, suffixed with "-dirty" if it had changes.
+        year (int): The year of the puzzle.
+        day (int): The day of the puzzle.
+        part (int): The part of the puzzle.
+        input_hash (str | None): The hash of the puzzle input.
+        mode (str): "run" for a single timed run, "bench" for the medians of `--bench`.
+        repetitions (int): The number of timed repetitions.
+        parse_ns (int | None): The parse time in nanoseconds, if it was measured separately.
+        solve_ns (int | None): The solve time in nanoseconds, if it was measured separately.
+        total_ns (int): The total time in nanoseconds, including reading the input for "run".
+        peak_memory (int | None): The peak resident memory of the process in bytes.
+        python (str): The Python implementation and version.
+        regressed (bool): Whether the run was slower than the baseline by more than the threshold.
+    """
+
+    timestamp: str
+    commit: str | None
+    year: int
+    day: int
+    part: int
+    input_hash: str | None
+    mode: str
+    repetitions: int
+    parse_ns: int | None
+    solve_ns: int | None
+    total_ns: int
+    peak_memory: int | None
+    python: str
+    regressed: bool = False
+
+    @property
+    def compared_ns(self) -> int:
+        """Return the time compared against the baseline, parse and solve if they were measured."""
+        if self.parse_ns is not None and self.solve_ns is not None:
+            return self.parse_ns + self.solve_ns
+        return self.total_ns
+
+
+class PerfStore:
+    """
+    Stores every timed run in a SQLite database and detects regressions.
+
+    Attributes:
+        path (Path): The path to the database file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize a new PerfStore instance, creating the database if needed.
+
+        Args:
+            path (Path): The path to the database file.
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.__connection = sqlite3.connect(path)
+        columns = ", ".join(f'"{field.name}"' for field in fields(PerfRun))
+        self.__connection.execute(f"CREATE TABLE IF NOT EXISTS runs ({columns})")
+        self.__connection.execute(
+            "CREATE INDEX IF NOT EXISTS runs_part ON runs (year, day, part, mode)"
+        )
+
+    @staticmethod
+    @cache
+    def get_commit() -> str | None:
+        """
+        Return the git revision of the repository.
+
+        Git is only run for the first timed run of the process, so later parts are not
+        measured right after it.
+
+        Returns:
+            str | None: The abbreviated revision with a "-dirty" suffix if there are
+                uncommitted changes, or None if git is unavailable.
+        """
+        try:
+            result = subprocess.run(
+                ["git", "describe", "--always", "--dirty", "--abbrev=8"],
+                cwd=Files.get_path(),
+                capture_output=True,
+                text=True,
+            )
+        except OSError:
+            return None
+
+        return result.stdout.strip() or None
+
+    @staticmethod
+    def get_input_hash(args: Args) -> str | None:
+        """
+        Hash the puzzle input of a specific year and day.
+
+        Args:
+            args (Args): The parsed command-line arguments.
+
+        Returns:
+            str | None: The hash, or None if the input does not exist.
+        """
+        file_path = Path(
+            Files.get_path(),
+            "data",
+            args.year_str,
+            args.day_str,
+            f"{args.day_str}_input.txt",
+        )
+
+        try:
+            return sha256(file_path.read_bytes()).hexdigest()[:16]
+        except OSError:
+            return None
+
+    @staticmethod
+    def get_peak_memory() -> int | None:
+        """
+        Return the peak resident memory of the current process.
+
+        Returns:
+            int | None: The peak memory in bytes, or None if the platform does not report it.
+        """
+        try:
+            import resource
+        except ImportError:
+            return None
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes
+        return peak if sys.platform == "darwin" else peak * 1024
+
+    @staticmethod
+    def create_run(
+        args: Args,
+        part: int,
+        mode: str,
+        total_ns: int,
+        parse_ns: int | None = None,
+        solve_ns: int | None = None,
+        repetitions: int = 1,
+    ) -> PerfRun:
+        """
+        Create a run of a part, filling in the environment of the current process.
+
+        Args:
+            args (Args): The parsed command-line arguments.
+            part (int): The part of the puzzle.
+            mode (str): "run" for a single timed run, "bench" for the medians of `--bench`.
+            total_ns (int): The total time in nanoseconds.
+            parse_ns (int | None, optional): The parse time in nanoseconds. Defaults to None.
+            solve_ns (int | None, optional): The solve time in nanoseconds. Defaults to None.
+            repetitions (int, optional): The number of timed repetitions. Defaults to 1.
+
+        Returns:
+            PerfRun: The run.
+        """
+        return PerfRun(
+            timestamp=datetime.now().isoformat(timespec="seconds"),
+            commit=PerfStore.get_commit(),
+            year=args.year,
+            day=args.day,
+            part=part,
+            input_hash=PerfStore.get_input_hash(args),
+            mode=mode,
+            repetitions=repetitions,
+            parse_ns=parse_ns,
+            solve_ns=solve_ns,
+            total_ns=total_ns,
+            peak_memory=PerfStore.get_peak_memory(),
+            python=f"{platform.python_implementation()} {platform.python_version()}",
+        )
+
+    def samples(self, run: PerfRun, limit: int, offset: int = 0) -> list[int]:
+        """
+        Return the compared times of the most recent runs comparable to a run.
+
+        Args:
+            run (PerfRun): The run to find comparable runs for.
+            limit (int): The maximum number of runs.
+            offset (int, optional): The number of most recent runs to skip. Defaults to 0.
+
+        Returns:
+            list[int]: The parse and solve times in nanoseconds, or the total times of
+                runs without phases, newest first.
+        """
+        rows = self.__connection.execute(
+            "SELECT COALESCE(parse_ns + solve_ns, total_ns) FROM runs"
+            " WHERE year = ? AND day = ? AND part = ? AND mode = ? AND input_hash IS ?"
+            " ORDER BY rowid DESC LIMIT ? OFFSET ?",
+            (run.year, run.day, run.part, run.mode, run.input_hash, limit, offset),
+        ).fetchall()
+
+        return [row[0] for row in rows]
+
+    def record(
+        self, run: PerfRun, threshold: float, window: int, min_delta_ns: int = 0
+    ) -> float | None:
+        """
+        Store a run, flagging it if it is slower than the recent baseline.
+
+        The median of the run and the runs right before it is compared against the
+        median of the `window` runs before those, unless the run is already the median
+        of `MIN_SAMPLES` or more repetitions. Nothing is flagged until both sides have
+        `MIN_SAMPLES` timings.
+
+        Args:
+            run (PerfRun): The run to store.
+            threshold (float): The slowdown in percent above which a run is flagged.
+            window (int): The number of runs to take the baseline median from.
+            min_delta_ns (int, optional): The smallest slowdown in nanoseconds that is
+                flagged, so noise on very fast parts is ignored. Defaults to 0.
+
+        Returns:
+            float | None: The slowdown in percent if the run regressed, otherwise None.
+        """
+        recent = [run.compared_ns]
+        if run.repetitions < MIN_SAMPLES:
+            recent += self.samples(run, MIN_SAMPLES - 1)
+        repeated = run.repetitions >= MIN_SAMPLES or len(recent) >= MIN_SAMPLES
+
+        baseline = self.samples(run, window, len(recent) - 1)
+        slowdown = None
+        if repeated and len(baseline) >= MIN_SAMPLES:
+            current, base = median(recent), median(baseline)
+            if base and current - base >= min_delta_ns:
+                slowdown = (current / base - 1) * 100
+
+        run.regressed = slowdown is not None and slowdown > threshold
+
+        placeholders = ", ".join("?" for _ in fields(PerfRun))
+        with self.__connection:
+            self.__connection.execute(
+                f"INSERT INTO runs VALUES ({placeholders})", astuple(run)
+            )
+
+        return slowdown if run.regressed else None
+
+    def history(
+        self, year: int, day: int, part: int | None = None, limit: int = 20
+    ) -> list[PerfRun]:
+        """
+        Return the most recent runs of a day.
+
+        Args:
+            year (int): The year of the puzzle.
+            day (int): The day of the puzzle.
+            part (int | None, optional): Only return runs of this part. Defaults to None.
+            limit (int, optional): The maximum number of runs. Defaults to 20.
+
+        Returns:
+            list[PerfRun]: The runs, oldest first.
+        """
+        rows = self.__connection.execute(
+            "SELECT * FROM runs WHERE year = ? AND day = ? AND (? IS NULL OR part = ?)"
+            " ORDER BY rowid DESC LIMIT ?",
+            (year, day, part, part, limit),
+        ).fetchall()
+
+        return [PerfRun(*row) for row in reversed(rows)]
+
+    @staticmethod
+    def display_history(
+        context: OutputHandler, title: str, runs: list[PerfRun]
+    ) -> None:
+        """
+        Print a table of runs.
+
+        Args:
+            context (OutputHandler): The output handler for the current run of the program.
+            title (str): The title of the table.
+            runs (list[PerfRun]): The runs to display.
+        """
+        from rich.table import Table
+
+        from utils.benchmark import format_ns
+
+        if not runs:
+            context.print_info(
+                "No timed runs recorded yet, run with --timeit or --bench"
+            )
+            return
+
+        table = Table(title=title, border_style="blue")
+        table.add_column("When", no_wrap=True)
+        table.add_column("Commit", no_wrap=True)
+        table.add_column("Part", justify="right")
+        table.add_column("Mode", no_wrap=True)
+        table.add_column("Parse", justify="right")
+        table.add_column("Solve", justify="right")
+        table.add_column("Total", justify="right", style="bold blue", no_wrap=True)
+        table.add_column("Peak RSS", justify="right")
+
+        for run in runs:
+            table.add_row(
+                run.timestamp.replace("T", " ")[5:16],
+                run.commit or "-",
+                str(run.part),
+                f"{run.mode} x{run.repetitions}" if run.repetitions > 1 else run.mode,
+                format_ns(run.parse_ns) if run.parse_ns is not None else "-",
+                format_ns(run.solve_ns) if run.solve_ns is not None else "-",
+                format_ns(run.total_ns)
+                + (" [bold red]▲[/bold red]" if run.regressed else ""),
+                f"{run.peak_memory / 1024**2:.1f}MiB" if run.peak_memory else "-",
+            )
+
+        context.print(table)
@@ -0,0 +1,279 @@
+"""Contains the ProfileDiff class for comparing two saved profiles function by function."""
+
+# Built-in modules
+from dataclasses import dataclass
+from json import JSONDecodeError, loads
+from pathlib import Path
+from typing import Any
+
+# Local modules
+from utils.files import Files
+from utils.output_handler import OutputHandler
+
+
+@dataclass
+class FunctionTime:
+    """
+    The time spent in a single function of a profile.
+
+    Attributes:
+        self_time (float): The time spent in the function itself, in seconds.
+        total_time (float): The time spent in the function and everything it called, in seconds.
+        line (int | None): The line the function starts at, only for display.
+    """
+
+    self_time: float = 0.0
+    total_time: float = 0.0
+    line: int | None = None
+
+
+# A function is identified by its qualified name and file, so moving it keeps its history
+FunctionKey = tuple[str, str]
+
+
+@dataclass
+class Profile:
+    """
+    The per-function times of a saved profile.
+
+    Attributes:
+        path (Path): The file the profile was loaded from.
+        duration (float): The duration of the profile, in seconds.
+        functions (dict[FunctionKey, FunctionTime]): The times keyed by function and file.
+    """
+
+    path: Path
+    duration: float
+    functions: dict[FunctionKey, FunctionTime]
+
+
+class ProfileDiff:
+    """Loads speedscope profiles written with --profile-format speedscope and compares them."""
+
+    @staticmethod
+    def __get_key(frame: dict[str, Any]) -> FunctionKey | None:
+        """Return the function and file of a speedscope frame, or None for synthetic frames such as [self]."""
+        if not frame.get("file"):
+            return None
+
+        # Library paths are long, their file name is enough to recognize them
+        path = Path(frame["file"])
+        name = (
+            path.relative_to(Files.get_path()).as_posix()
+            if path.is_relative_to(Files.get_path())
+            else path.name
+        )
+
+        return frame["name"], name
+
+    @staticmethod
+    def get_label(key: FunctionKey, times: FunctionTime) -> str:
+        """
+        Return the display name of a function.
+
+        Args:
+            key (FunctionKey): The function and file.
+            times (FunctionTime): The times of the function.
+
+        Returns:
+            str: The name as "function (file:line)".
+
+        Example:
+            >>> ProfileDiff.get_label(("f", "a.py"), FunctionTime(line=5))
+            'f (a.py:5)'
+        """
+        name, file = key
+        return f"{name} ({file}:{times.line if times.line is not None else '?'})"
+
+    @staticmethod
+    def summarize(
+        frames: list[dict[str, Any]], events: list[dict[str, Any]]
+    ) -> dict[FunctionKey, FunctionTime]:
+        """
+        Compute the self and total time of every function of an evented speedscope profile.
+
+        Recursive calls are only counted once in the total time of a function, and the
+        time of synthetic frames counts as self time of their parent.
+
+        Args:
+            frames (list[dict[str, Any]]): The shared frames of the profile.
+            events (list[dict[str, Any]]): The open ("O") and close ("C") events of the profile.
+
+        Returns:
+            dict[FunctionKey, FunctionTime]: The times keyed by function and file.
+
+        Example:
+            >>> frames = [{"name": "main", "file": "a.py", "line": 1}, {"name": "f", "file": "a.py", "line": 5}]
+            >>> times = ProfileDiff.summarize(frames, [
+            ...     {"type": "O", "frame": 0, "at": 0.0},
+            ...     {"type": "O", "frame": 1, "at": 1.0},
+            ...     {"type": "C", "frame": 1, "at": 3.0},
+            ...     {"type": "C", "frame": 0, "at": 4.0},
+            ... ])
+            >>> times["main", "a.py"], times["f", "a.py"]
+            (FunctionTime(self_time=2.0, total_time=4.0, line=1), FunctionTime(self_time=2.0, total_time=2.0, line=5))
+        """
+        keys = [ProfileDiff.__get_key(frame) for frame in frames]
+        functions: dict[FunctionKey, FunctionTime] = {}
+
+        stack: list[FunctionKey] = []
+        # How often each function is on the stack, so recursion is only counted once
+        active: dict[FunctionKey, int] = {}
+        last_time = events[0]["at"] if events else 0.0
+
+        for event in events:
+            elapsed = event["at"] - last_time
+            last_time = event["at"]
+
+            if stack and elapsed > 0:
+                functions[stack[-1]].self_time += elapsed
+                for key in active:
+                    functions[key].total_time += elapsed
+
+            key = keys[event["frame"]]
+            if key is None:
+                continue
+
+            if event["type"] == "O":
+                if key not in functions:
+                    functions[key] = FunctionTime(
+                        line=frames[event["frame"]].get("line")
+                    )
+                stack.append(key)
+                active[key] = active.get(key, 0) + 1
+            elif stack:
+                stack.pop()
+                active[key] -= 1
+                if not active[key]:
+                    del active[key]
+
+        return functions
+
+    @staticmethod
+    def load(path: Path) -> Profile:
+        """
+        Load a speedscope profile.
+
+        Args:
+            path (Path): The path to the profile.
+
+        Returns:
+            Profile: The per-function times of the profile.
+
+        Raises:
+            ValueError: If the file is not an evented speedscope profile.
+        """
+        try:
+            data: dict[str, Any] = loads(path.read_text(encoding="utf-8"))
+            frames: list[dict[str, Any]] = data["shared"]["frames"]
+            profile: dict[str, Any] = data["profiles"][
+                data.get("activeProfileIndex") or 0
+            ]
+        except (OSError, JSONDecodeError, KeyError, IndexError, TypeError) as e:
+            raise ValueError(f"{path} is not a speedscope profile: {e}") from e
+
+        if profile.get("type") != "evented":
+            raise ValueError(f"{path} is not an evented speedscope profile")
+
+        return Profile(
+            path=path,
+            duration=profile["endValue"] - profile["startValue"],
+            functions=ProfileDiff.summarize(frames, profile["events"]),
+        )
+
+    @staticmethod
+    def display(
+        context: OutputHandler,
+        before: Profile,
+        after: Profile,
+        top: int = 25,
+        hot_spot: float = 0.01,
+    ) -> None:
+        """
+        Print the functions whose time changed the most, and the hot spots that appeared or vanished.
+
+        Args:
+            context (OutputHandler): The output handler for the current run of the program.
+            before (Profile): The profile before the change.
+            after (Profile): The profile after the change.
+            top (int, optional): The number of functions to show. Defaults to 25.
+            hot_spot (float, optional): The share of the duration a function must take itself
+                to be listed as a new or vanished hot spot. Defaults to 0.01.
+        """
+        from rich.table import Table
+
+        from utils.benchmark import format_ns
+
+        def seconds(value: float) -> str:
+            return format_ns(value * 1e9)
+
+        def delta(value: float) -> str:
+            style = "red" if value > 0 else "green" if value < 0 else ""
+            text = ("+" if value > 0 else "-" if value < 0 else "") + seconds(
+                abs(value)
+            )
+            return f"[{style}]{text}[/{style}]" if style else text
+
+        empty = FunctionTime()
+        names = sorted(
+            before.functions.keys() | after.functions.keys(),
+            key=lambda name: (
+                abs(
+                    after.functions.get(name, empty).self_time
+                    - before.functions.get(name, empty).self_time
+                ),
+                abs(
+                    after.functions.get(name, empty).total_time
+                    - before.functions.get(name, empty).total_time
+                ),
+            ),
+            reverse=True,
+        )
+
+        table = Table(
+            title=f"{before.path.name} → {after.path.name}",
+            caption=f"Duration {seconds(before.duration)} → {seconds(after.duration)}",
+            border_style="blue",
+        )
+        table.add_column("Function")
+        table.add_column("Self before", justify="right")
+        table.add_column("Self after", justify="right")
+        table.add_column("Δ Self", justify="right", style="bold")
+        table.add_column("Total before", justify="right")
+        table.add_column("Total after", justify="right")
+        table.add_column("Δ Total", justify="right", style="bold")
+
+        for name in names[:top]:
+            old = before.functions.get(name, empty)
+            new = after.functions.get(name, empty)
+            table.add_row(
+                ProfileDiff.get_label(name, new if name in after.functions else old),
+                seconds(old.self_time),
+                seconds(new.self_time),
+                delta(new.self_time - old.self_time),
+                seconds(old.total_time),
+                seconds(new.total_time),
+                delta(new.total_time - old.total_time),
+            )
+
+        context.print(table)
+
+        for label, profile, other in [
+            ("New hot spots", after, before),
+            ("Vanished hot spots", before, after),
+        ]:
+            spots = [
+                f"{ProfileDiff.get_label(name, times)} ({seconds(times.self_time)})"
+                for name, times in sorted(
+                    profile.functions.items(),
+                    key=lambda item: item[1].self_time,
+                    reverse=True,
+                )
+                if name not in other.functions
+                and times.self_time >= hot_spot * profile.duration
+            ]
+
+            if spots:
+                context.print_info(f"{label}:", end="\n")
+                for spot in spots:
+                    context.print(f"  {spot}")
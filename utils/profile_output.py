@@ -0,0 +1,139 @@
+"""Contains the ProfileOutput class for rendering and saving profiler sessions."""
+
+# Built-in modules
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# Local modules
+from utils.cli_args import Args
+from utils.output_handler import OutputHandler
+
+# Third-party modules (pyinstrument is only imported when profiling)
+if TYPE_CHECKING:
+    from pyinstrument import Profiler
+    from pyinstrument.frame import Frame
+    from pyinstrument.session import Session
+
+# The formats accepted by --profile-format, and the extension of their files
+FORMATS: dict[str, str] = {
+    "html": "html",
+    "speedscope": "speedscope.json",
+    "collapsed": "collapsed.txt",
+    "pstats": "pstats",
+    "text": "txt",
+}
+
+# Where profiles are written when a format needs a file and --profile-out is not set
+DEFAULT_FOLDER = Path("logs", "profiles")
+
+
+class ProfileOutput:
+    """Renders a pyinstrument session in the format selected on the command line."""
+
+    @staticmethod
+    def get_path(args: Args, name: str) -> Path:
+        """
+        Return the file a profile is written to.
+
+        Args:
+            args (Args): The parsed command-line arguments.
+            name (str): The name of the profiled run, e.g. "p1" or "p1_test".
+
+        Returns:
+            Path: The path of the profile file.
+
+        Example:
+            >>> ProfileOutput.get_path(Args(year=2024, day=6, profile_format="speedscope"), "p2").as_posix()
+            'logs/profiles/2024_06_p2.speedscope.json'
+        """
+        folder = Path(args.profile_out) if args.profile_out else DEFAULT_FOLDER
+        extension = FORMATS[args.profile_format]
+
+        return Path(folder, f"{args.year_str}_{args.day_str}_{name}.{extension}")
+
+    @staticmethod
+    def render_collapsed(session: "Session") -> str:
+        """
+        Render a session as collapsed stacks, the input format of flamegraph.pl and friends.
+
+        Every line is a semicolon separated stack followed by its self time in microseconds.
+
+        Args:
+            session (Session): The profiler session.
+
+        Returns:
+            str: The collapsed stacks.
+        """
+        lines: list[str] = []
+
+        def visit(frame: "Frame", stack: list[str]) -> None:
+            stack = stack + [
+                f"{frame.function} ({frame.file_path_short}:{frame.line_no})"
+            ]
+            children = [child for child in frame.children if not child.is_synthetic]
+
+            self_time = frame.time - sum(child.time for child in children)
+            if round(self_time * 1e6) > 0:
+                lines.append(f"{';'.join(stack)} {round(self_time * 1e6)}")
+
+            for child in children:
+                visit(child, stack)
+
+        root = session.root_frame()
+        if root is not None:
+            visit(root, [])
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def write(
+        context: OutputHandler,
+        args: Args,
+        profiler: "Profiler",
+        session: "Session",
+        name: str,
+    ) -> None:
+        """
+        Show or save a session in the format selected with --profile-format.
+
+        Without --profile-out, HTML is opened in the browser and text is printed to
+        the console, every other format is written to `logs/profiles/`.
+
+        Args:
+            context (OutputHandler): The output handler for the current run of the program.
+            args (Args): The parsed command-line arguments.
+            profiler (Profiler): The profiler that recorded the session.
+            session (Session): The profiler session.
+            name (str): The name of the profiled run, e.g. "p1" or "p1_test".
+        """
+        from pyinstrument.renderers import PstatsRenderer, SpeedscopeRenderer
+
+        if args.profile_out is None and args.profile_format == "html":
+            profiler.open_in_browser()
+            return
+
+        if args.profile_out is None and args.profile_format == "text":
+            from rich.text import Text
+
+            context.print(
+                Text.from_ansi(profiler.output_text(unicode=True, color=True))
+            )
+            return
+
+        if args.profile_format == "html":
+            contents = profiler.output_html()
+        elif args.profile_format == "text":
+            contents = profiler.output_text(unicode=True)
+        elif args.profile_format == "speedscope":
+            contents = profiler.output(SpeedscopeRenderer())
+        elif args.profile_format == "pstats":
+            contents = profiler.output(PstatsRenderer())
+        else:
+            contents = ProfileOutput.render_collapsed(session)
+
+        file_path = ProfileOutput.get_path(args, name)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        # The pstats renderer returns marshalled bytes decoded with surrogateescape
+        file_path.write_bytes(contents.encode("utf-8", errors="surrogateescape"))
+
+        context.print_info(f"Profile written to [cyan]{file_path}[/cyan]", end="\n")
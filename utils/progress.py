@@ -0,0 +1,147 @@
+"""Contains the ProgressReporter class for showing the progress of a part in the status line."""
+
+# Built-in modules
+from time import monotonic
+from typing import TYPE_CHECKING
+
+# Third-party modules (rich is only needed for the type)
+if TYPE_CHECKING:
+    from rich.status import Status
+
+
+def format_count(count: float) -> str:
+    """
+    Format a count with a metric suffix, keeping about three significant digits.
+
+    Args:
+        count (float): The count.
+
+    Returns:
+        str: The formatted count.
+
+    Example:
+        >>> format_count(950)
+        '950'
+        >>> format_count(12_345)
+        '12.3k'
+        >>> format_count(4_560_000)
+        '4.56M'
+    """
+    for limit, suffix in [(1e9, "G"), (1e6, "M"), (1e3, "k")]:
+        if count >= limit:
+            value = count / limit
+            return f"{value:.3g}{suffix}" if value < 1000 else f"{value:,.0f}{suffix}"
+
+    return f"{count:.3g}" if count < 1 else f"{count:.0f}"
+
+
+def format_eta(seconds: float) -> str:
+    """
+    Format a remaining time in seconds as hours, minutes and seconds.
+
+    Args:
+        seconds (float): The remaining time.
+
+    Returns:
+        str: The formatted time.
+
+    Example:
+        >>> format_eta(4.2)
+        '4s'
+        >>> format_eta(125)
+        '2m 05s'
+        >>> format_eta(3725)
+        '1h 02m'
+    """
+    seconds = round(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60:02}s"
+    return f"{seconds // 3600}h {seconds % 3600 // 60:02}m"
+
+
+class ProgressReporter:
+    """
+    Shows the progress reported by a solution below the message of the status spinner.
+
+    Updates only render a few times per second, every other call costs a clock read and
+    a comparison, so they can be made from hot loops. Without a status, e.g. in batch
+    runs and worker processes, updates are dropped.
+
+    Attributes:
+        interval (float): The fewest seconds between two renders.
+    """
+
+    def __init__(self, interval: float = 0.1) -> None:
+        """
+        Initialize a new ProgressReporter instance.
+
+        Args:
+            interval (float, optional): The fewest seconds between two renders. Defaults to 0.1.
+        """
+        self.interval = interval
+
+        self.__status: Status | None = None
+        self.__message = ""
+        # Never render while detached
+        self.__next_render = float("inf")
+        self.__started = 0.0
+        self.__last_done = 0
+
+    def attach(self, status: "Status", message: str) -> None:
+        """
+        Start rendering updates into a status.
+
+        Args:
+            status (Status): The status spinner.
+            message (str): The message of the status, the progress is shown after it.
+        """
+        self.__status = status
+        self.__message = message
+        self.__next_render = 0.0
+        self.__started = monotonic()
+        self.__last_done = 0
+
+    def detach(self) -> None:
+        """Stop rendering updates, the status is about to stop."""
+        self.__status = None
+        self.__next_render = float("inf")
+
+    def update(self, done: int, total: int | None = None) -> None:
+        """
+        Report the progress, rendering it if the last render is long enough ago.
+
+        Args:
+            done (int): The number of steps done. A lower number than the last update
+                starts a new loop, which restarts the rate.
+            total (int | None, optional): The total number of steps, if known. Defaults to None.
+        """
+        now = monotonic()
+        if now < self.__next_render:
+            return
+
+        if done < self.__last_done:
+            self.__started = now
+        self.__last_done = done
+        self.__next_render = now + self.interval
+
+        self.__render(done, total, now)
+
+    def __render(self, done: int, total: int | None, now: float) -> None:
+        """Write the progress, rate and remaining time into the status."""
+        if self.__status is None:
+            return
+
+        elapsed = now - self.__started
+        rate = done / elapsed if elapsed > 0 else 0.0
+
+        details = [f"{done:,}" if total is None else f"{done:,}/{total:,}"]
+        if total:
+            details.insert(0, f"{done / total:.0%}")
+        if rate:
+            details.append(f"{format_count(rate)}/s")
+            if total is not None and total >= done:
+                details.append(f"ETA {format_eta((total - done) / rate)}")
+
+        self.__status.update(f"{self.__message}[dim]{' · '.join(details)}[/dim]")
@@ -14,6 +14,9 @@ from utils.output_handler import OutputHandler
 class PuzzleReader:
     """Utility class for reading input data and expected test results for puzzle solutions."""
 
+    # Raw file contents keyed by path, along with the (mtime, size) they were read at
+    __cache: dict[Path, tuple[tuple[int, int], str]] = {}
+
     @staticmethod
     def get_input(
         context: OutputHandler,
@@ -36,15 +39,7 @@ class PuzzleReader:
         Raises:
             FileNotFoundError: If the file corresponding to the specified year and day does not exist.
         """
-        file_name: str = (
-            f"{args.day_str}_input.txt"
-            if not is_test
-            else f"{args.day_str}_test_input.txt"
-        )
-
-        file_path: Path = Path(
-            Files.get_path(), "data", args.year_str, args.day_str, file_name
-        )
+        file_path: Path = PuzzleReader.get_input_path(args, is_test)
 
         try:
             PuzzleReader.__is_valid_file(file_path)
@@ -52,11 +47,53 @@ class PuzzleReader:
             context.print_error(str(e))
             return None
 
-        with open(file_path, "r") as f:
-            if raw_input:
-                return f.read()
-            else:
-                return [line.strip("\n") for line in f.readlines()]
+        contents: str = PuzzleReader.__read(file_path)
+
+        if raw_input:
+            return contents
+
+        return PuzzleReader.__split_lines(contents)
+
+    @staticmethod
+    def has_input(args: Args, is_test: bool = False) -> bool:
+        """
+        Return whether the input file for a specific year and day exists and is not empty.
+
+        Args:
+            args (Args): The parsed command-line arguments.
+            is_test (bool, optional): If True, the test input is checked. Defaults to False.
+
+        Returns:
+            bool: True if the input can be read.
+        """
+        file_path: Path = PuzzleReader.get_input_path(args, is_test)
+
+        try:
+            PuzzleReader.__is_valid_file(file_path)
+        except (FileNotFoundError, ValueError):
+            return False
+
+        return True
+
+    @staticmethod
+    def get_input_path(args: Args, is_test: bool = False) -> Path:
+        """
+        Return the path of the input file for a specific year and day of the puzzle.
+
+        Args:
+            args (Args): The parsed command-line arguments.
+            is_test (bool, optional): If True, the path of the test input is returned. Defaults to False.
+
+        Returns:
+            Path: The path of the input file.
+        """
+        file_name: str = (
+            f"{args.day_str}_input.txt"
+            if not is_test
+            else f"{args.day_str}_test_input.txt"
+        )
+
+        return Path(Files.get_path(), "data", args.year_str, args.day_str, file_name)
 
     @staticmethod
     def get_test_results(context: OutputHandler, args: Args, part: int) -> Any:
@@ -92,7 +129,7 @@ class PuzzleReader:
         except ValueError as e:
             raise ValueError(e)
 
-        result: Any = [line.strip("\n") for line in open(file_path, "r").readlines()]
+        result: Any = PuzzleReader.__split_lines(PuzzleReader.__read(file_path))
 
         result = (
             [int(x) for x in result] if all(x.isdigit() for x in result) else result
@@ -104,6 +141,47 @@ class PuzzleReader:
 
         return result
 
+    @staticmethod
+    def __read(file_path: Path) -> str:
+        """
+        Read the contents of a file, reusing the cached contents if the file is unchanged.
+
+        Args:
+            file_path (Path): The path to the file to be read.
+
+        Returns:
+            str: The contents of the file.
+        """
+        stat = file_path.stat()
+        version: tuple[int, int] = (stat.st_mtime_ns, stat.st_size)
+
+        cached = PuzzleReader.__cache.get(file_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        with open(file_path, "r") as f:
+            contents: str = f.read()
+
+        PuzzleReader.__cache[file_path] = (version, contents)
+        return contents
+
+    @staticmethod
+    def __split_lines(contents: str) -> list[str]:
+        """
+        Split file contents into lines the same way `readlines()` would, without line endings.
+
+        Args:
+            contents (str): The contents of the file.
+
+        Returns:
+            list[str]: The lines of the file.
+        """
+        lines: list[str] = contents.split("\n")
+        if lines[-1] == "":
+            lines.pop()
+
+        return lines
+
     @staticmethod
     def __is_valid_file(file_path: Path) -> None:
         """
@@ -0,0 +1,121 @@
+"""Contains the ResultStore class for remembering answers of unchanged solutions."""
+
+# Built-in modules
+from hashlib import sha256
+from json import JSONDecodeError, dumps, loads
+from pathlib import Path
+
+# Local modules
+from utils.files import Files
+
+# Files every solution depends on, besides its own module and input
+SHARED_SOURCES: list[str] = [
+    "utils/helper_functions.py",
+    "utils/solution_base.py",
+]
+
+
+class ResultStore:
+    """
+    Stores the answer of each (year, day, part) in a JSON file, together with a hash
+    of everything the answer depends on.
+
+    Attributes:
+        path (Path): The path to the JSON file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize a new ResultStore instance and load any existing results.
+
+        Args:
+            path (Path): The path to the JSON file.
+        """
+        self.path = path
+        self.__results: dict[str, dict[str, str]] = {}
+
+        if path.exists():
+            try:
+                self.__results = loads(path.read_text(encoding="utf-8"))
+            except (JSONDecodeError, OSError):
+                self.__results = {}
+
+    @staticmethod
+    def __key(year: int, day: int, part: int) -> str:
+        """Return the key used to store the answer of a part."""
+        return f"{year}/{day:02}/{part}"
+
+    @staticmethod
+    def get_hash(year: int, day: int) -> str | None:
+        """
+        Hash the solution module, the shared utils and the puzzle input of a day.
+
+        Args:
+            year (int): The year of the puzzle.
+            day (int): The day of the puzzle.
+
+        Returns:
+            str | None: The hash, or None if the solution or its input does not exist.
+        """
+        root: Path = Files.get_path()
+        files: list[Path] = [
+            Path(root, "solutions", str(year), f"{day:02}.py"),
+            *(Path(root, source) for source in SHARED_SOURCES),
+            Path(root, "data", str(year), f"{day:02}", f"{day:02}_input.txt"),
+        ]
+
+        digest = sha256()
+        for file in files:
+            try:
+                digest.update(file.read_bytes())
+            except OSError:
+                return None
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    def get(self, year: int, day: int, part: int, digest: str | None) -> str | None:
+        """
+        Return the stored answer of a part if it was computed from the same sources.
+
+        Args:
+            year (int): The year of the puzzle.
+            day (int): The day of the puzzle.
+            part (int): The part of the puzzle.
+            digest (str | None): The current hash from `get_hash`.
+
+        Returns:
+            str | None: The stored answer, or None if it is missing or out of date.
+        """
+        stored = self.__results.get(ResultStore.__key(year, day, part))
+
+        if digest is None or stored is None or stored["hash"] != digest:
+            return None
+
+        return stored["answer"]
+
+    def record(
+        self, year: int, day: int, part: int, digest: str | None, answer: str
+    ) -> None:
+        """
+        Store the answer of a part.
+
+        Args:
+            year (int): The year of the puzzle.
+            day (int): The day of the puzzle.
+            part (int): The part of the puzzle.
+            digest (str | None): The hash from `get_hash`, nothing is stored if None.
+            answer (str): The answer.
+        """
+        if digest is None:
+            return
+
+        self.__results[ResultStore.__key(year, day, part)] = {
+            "hash": digest,
+            "answer": answer,
+        }
+
+    def save(self) -> None:
+        """Write the results to their JSON file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(dumps(self.__results, indent=2), encoding="utf-8")
@@ -0,0 +1,166 @@
+"""Contains the SharedGrid class for handing character grids to worker processes without copying them."""
+
+# Built-in modules
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Iterator
+import os
+import sys
+
+# Segments attached in this process, by name, so every task that receives the same grid
+# reuses one mapping and one decoded copy of the rows
+_attached: dict[str, tuple[SharedMemory, list[list[str]] | None]] = {}
+
+
+def _attach(name: str) -> SharedMemory:
+    """Attach to an existing segment without making this process responsible for it."""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+
+    # Before 3.13 attaching registers the segment with the resource tracker again, which
+    # is harmless as the workers share the tracker of the process that created it
+    return SharedMemory(name=name)
+
+
+class SharedGrid:
+    """
+    A grid of single-byte characters in a shared memory segment.
+
+    The grid is stored row after row as one byte per cell, together with its shape.
+    Pickling a SharedGrid only sends the name of the segment and the shape, so passing
+    it to `parallel_map()` or `search_parallel()` costs the same for any grid size.
+    Workers attach to the segment by name and get a read-only view of it.
+
+    The process that created the grid owns the segment and removes it with `unlink()`.
+    Grids created with `SolutionBase.share_grid()` are unlinked when the run ends, also
+    when it is interrupted.
+
+    Attributes:
+        name (str): The name of the shared memory segment.
+        rows (int): The number of rows.
+        cols (int): The number of columns.
+    """
+
+    def __init__(self, grid: list[list[str]] | list[str]) -> None:
+        """
+        Copy a grid into a new shared memory segment.
+
+        Args:
+            grid (list[list[str]] | list[str]): The grid, e.g. from `h.gridify`. Rows may
+                also be strings.
+
+        Raises:
+            ValueError: If the rows differ in length or a cell is not a single byte character.
+
+        Example:
+            >>> grid = SharedGrid([["#", "."], [".", "^"]])
+            >>> grid.shape, grid[1][1], grid.to_list()
+            ((2, 2), '^', [['#', '.'], ['.', '^']])
+            >>> grid.unlink()
+        """
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+
+        data = bytearray()
+        for row in grid:
+            if len(row) != self.cols:
+                raise ValueError(
+                    f"All rows of a shared grid must have {self.cols} cells, got {len(row)}"
+                )
+
+            try:
+                cells = "".join(row).encode("latin-1")
+            except UnicodeEncodeError as e:
+                raise ValueError(
+                    "A shared grid can only hold single byte characters"
+                ) from e
+
+            if len(cells) != self.cols:
+                raise ValueError("A shared grid can only hold single character cells")
+
+            data += cells
+
+        # Segments cannot be empty
+        self.__memory = SharedMemory(create=True, size=max(1, len(data)))
+        buf = self.__memory.buf
+        assert buf is not None
+        buf[: len(data)] = data
+        self.name = self.__memory.name
+
+        self.__owner = os.getpid()
+        self.__grid: list[list[str]] | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the name and shape of the grid, its cells stay in the segment."""
+        return {"name": self.name, "rows": self.rows, "cols": self.cols}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Attach to the segment of a grid created in another process."""
+        self.name, self.rows, self.cols = state["name"], state["rows"], state["cols"]
+
+        if self.name not in _attached:
+            _attached[self.name] = (_attach(self.name), None)
+
+        self.__memory = _attached[self.name][0]
+        self.__owner = None
+        self.__grid = None
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Return the number of rows and columns."""
+        return self.rows, self.cols
+
+    @property
+    def buffer(self) -> memoryview:
+        """Return a read-only view of the cells, one byte per cell, row after row."""
+        buf = self.__memory.buf
+        assert buf is not None, "The shared grid was unlinked"
+        return buf[: self.rows * self.cols].toreadonly()
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self.rows
+
+    def __getitem__(self, row: int) -> list[str]:
+        """Return a row of the grid, so cells can be read with `grid[row][col]`."""
+        return self.to_list()[row]
+
+    def __iter__(self) -> Iterator[list[str]]:
+        """Iterate over the rows of the grid."""
+        return iter(self.to_list())
+
+    def to_list(self) -> list[list[str]]:
+        """
+        Return the grid as a list of rows of characters, like `h.gridify`.
+
+        The rows are decoded once per process and shared by every task that uses the
+        grid, so they must not be modified. Copy them first to change cells.
+
+        Returns:
+            list[list[str]]: The rows of the grid.
+        """
+        if self.__grid is None:
+            cached = _attached.get(self.name)
+            if cached is not None and cached[1] is not None:
+                self.__grid = cached[1]
+            else:
+                text = bytes(self.buffer).decode("latin-1")
+                self.__grid = [
+                    list(text[row * self.cols : (row + 1) * self.cols])
+                    for row in range(self.rows)
+                ]
+                if cached is not None:
+                    _attached[self.name] = (cached[0], self.__grid)
+
+        return self.__grid
+
+    def unlink(self) -> None:
+        """Remove the segment, if this process created it. Workers that are still attached keep their view."""
+        if self.__owner != os.getpid():
+            return
+
+        self.__owner = None
+        self.__memory.close()
+        try:
+            self.__memory.unlink()
+        except FileNotFoundError:
+            pass
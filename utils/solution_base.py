@@ -1,15 +1,33 @@
 """Base class for all solutions."""
 
 # Built-in modules
-from typing import Any, Callable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Literal,
+    Sized,
+    TypeVar,
+)
+from contextlib import contextmanager
+from copy import deepcopy
 from logging import INFO, DEBUG
 from pathlib import Path
 from io import StringIO
+from time import monotonic, perf_counter_ns
 import builtins
+import re
+import sys
 
-# Third-party modules
-from pyinstrument import Profiler
-from pyinstrument.session import Session
+# Third-party modules (pyinstrument is only imported when profiling)
+if TYPE_CHECKING:
+    from pyinstrument.session import Session
+
+    from utils.parallel import WorkerPool
+    from utils.shared_grid import SharedGrid
 
 # from rich.panel import Panel
 
@@ -17,9 +35,12 @@ from pyinstrument.session import Session
 from utils.puzzle_reader import PuzzleReader
 from utils.output_handler import OutputHandler, Logger
 from utils.cli_args import Args
+from utils.progress import ProgressReporter
 
 builtin_print = builtins.print
 
+T = TypeVar("T")
+
 
 class SolutionBase:
     """
@@ -29,11 +50,24 @@ class SolutionBase:
         raw_input (bool): Whether the input is raw text or a list of strings.
         skip_empty_tests (bool): Whether to skip tests with no expected results.
         override_print (bool): Whether to override the built-in print function.
+        share_parsed (str): How the output of `parse()` is reused between the tests and parts of a run.
+            "none" parses again every time, "share" reuses the same object, "frozen" reuses
+            an immutable (hashable) object and "copy" hands out a deep copy every time.
+        parse_per_part (bool): Whether the output of `parse()` depends on `is_part_1`.
+        parse_cache (bool): Whether to store the output of `parse()` on disk and load it on later runs.
+        parallel_threshold (int): The fewest items `parallel_map()` sends to worker processes,
+            smaller workloads run in this process.
+        parallel_workers (int | None): The number of worker processes, None for one per available core.
     """
 
     raw_input: bool = False
     skip_empty_tests: bool = False
     override_print: bool = False
+    share_parsed: Literal["none", "share", "frozen", "copy"] = "none"
+    parse_per_part: bool = False
+    parse_cache: bool = False
+    parallel_threshold: int = 100
+    parallel_workers: int | None = None
     __context: OutputHandler
 
     def __init__(
@@ -64,10 +98,63 @@ class SolutionBase:
         self.is_test: bool = False
         self.is_part_1: bool = True
 
+        # Nanoseconds spent reading, parsing and solving the last test and input of a part,
+        # keyed by phase, e.g. "test_parse" or "solve". Only filled in with --timeit
+        self.phase_times: dict[str, int] = {}
+
+        # Parsed input keyed by (is_test, raw_input, is_part_1 if parse_per_part)
+        self.__parsed: dict[tuple[bool, bool, bool | None], Any] = {}
+        # Parsed input prepared by `preparse()`, each entry is handed out only once
+        self.__preparsed: dict[tuple[bool, bool, bool | None], Any] = {}
+
+        # Worker processes of `parallel_map()` and `search_parallel()`, started on first use
+        self.__pool: WorkerPool | None = None
+        self.__serial_reasons: set[str] = set()
+        # Shared memory segments of `share_grid()`, removed by `close()`
+        self.__shared_grids: list[SharedGrid] = []
+        # When each checkpoint of the running part was last saved, by key
+        self.__checkpoints: dict[str, float] = {}
+        self.__checkpoint_hash: str | None = None
+        # Renders `progress()` and `track()` into the status of the running test or part
+        self.__progress = ProgressReporter()
+
         # Override the built-in print function
         if self.override_print:
             builtins.print = self.print  # type: ignore
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state sent to worker processes, without the console and caches."""
+        state = self.__dict__.copy()
+        for name in [
+            "context",
+            "parsed",
+            "preparsed",
+            "pool",
+            "serial_reasons",
+            "shared_grids",
+            "progress",
+        ]:
+            state.pop(f"_SolutionBase__{name}", None)
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a solution in a worker process, discarding anything it prints."""
+        from rich.console import Console
+
+        self.__dict__.update(state)
+
+        console = Console(quiet=True)
+        self.__context = OutputHandler(
+            logger=Logger(name="solution-worker", console=console), console=console
+        )
+        self.__parsed = {}
+        self.__preparsed = {}
+        self.__pool = None
+        self.__serial_reasons = set()
+        self.__shared_grids = []
+        self.__progress = ProgressReporter()
+
     def parse(self, data: Any) -> Any:
         """Parse the input data into a usable format."""
         return data
@@ -105,6 +192,7 @@ class SolutionBase:
         if self.__args.only_test:
             return
 
+        start_time = self.__now()
         puzzle_input: Any = PuzzleReader.get_input(
             self.__context, self.__args, self.raw_input
         )
@@ -113,17 +201,144 @@ class SolutionBase:
             return None
 
         self.is_part_1 = True if part == 1 else False
-        data: Any = self.parse(puzzle_input)
+        read_time = self.__now()
+        data: Any = self.__parse(puzzle_input, is_test=False)
 
         func = getattr(self, f"part{part}")
 
+        parse_time = self.__now()
         result = self.__run_solution(func, data)
 
+        # A part that finished has nothing to resume
+        self.__remove_checkpoints()
+
+        self.__record_phases(
+            "",
+            read_time - start_time,
+            parse_time - read_time,
+            self.__now() - parse_time,
+        )
         return result
 
+    def __now(self) -> int:
+        """Return a monotonic timestamp in nanoseconds, or 0 when not timing."""
+        return perf_counter_ns() if self.__args.timeit else 0
+
+    def __record_phases(self, prefix: str, read: int, parse: int, solve: int) -> None:
+        """Store the durations of the phases of a test or solve, in nanoseconds."""
+        if not self.__args.timeit:
+            return
+
+        self.phase_times[f"{prefix}read"] = read
+        self.phase_times[f"{prefix}parse"] = parse
+        self.phase_times[f"{prefix}solve"] = solve
+
+    def preparse(self, parts: list[int]) -> None:
+        """
+        Read and parse the test and puzzle input of the given parts ahead of time.
+
+        Used before forking a process per part, so every child starts with its own
+        copy-on-write copy of the parsed input instead of parsing it again.
+
+        Args:
+            parts (list[int]): The parts of the puzzle that will run.
+        """
+        for part in parts:
+            self.is_part_1 = True if part == 1 else False
+
+            for is_test in [True, False]:
+                if (is_test and self.__args.skip_test) or (
+                    not is_test and self.__args.only_test
+                ):
+                    continue
+
+                key = self.__get_parse_key(is_test)
+                file_path: Path = PuzzleReader.get_input_path(self.__args, is_test)
+                if key in self.__preparsed or not file_path.is_file():
+                    continue
+                if file_path.stat().st_size == 0:
+                    continue
+
+                puzzle_input: Any = PuzzleReader.get_input(
+                    self.__context, self.__args, self.raw_input, is_test
+                )
+                if puzzle_input is not None:
+                    self.__preparsed[key] = self.__parse_or_load(puzzle_input, is_test)
+
+    def __get_parse_key(self, is_test: bool) -> tuple[bool, bool, bool | None]:
+        """Return the key identifying the parsed input of the current part."""
+        return (
+            is_test,
+            self.raw_input,
+            self.is_part_1 if self.parse_per_part else None,
+        )
+
+    def __parse(self, puzzle_input: Any, is_test: bool) -> Any:
+        """Parse the input, reusing the result of an earlier parse as allowed by `share_parsed`."""
+        key = self.__get_parse_key(is_test)
+
+        if key in self.__preparsed:
+            return self.__preparsed.pop(key)
+
+        if self.share_parsed == "none":
+            return self.__parse_or_load(puzzle_input, is_test)
+
+        if key not in self.__parsed:
+            data: Any = self.__parse_or_load(puzzle_input, is_test)
+
+            if self.share_parsed == "frozen":
+                try:
+                    hash(data)
+                except TypeError as e:
+                    raise TypeError(
+                        "share_parsed is 'frozen' but parse() returned a mutable "
+                        f"{type(data).__name__}"
+                    ) from e
+
+            self.__parsed[key] = data
+
+        if self.share_parsed == "copy":
+            return deepcopy(self.__parsed[key])
+
+        return self.__parsed[key]
+
+    def __parse_or_load(self, puzzle_input: Any, is_test: bool) -> Any:
+        """Parse the input, or load the output of an earlier run if `parse_cache` is set."""
+        if not self.parse_cache:
+            return self.parse(puzzle_input)
+
+        from inspect import getsource
+        from utils.parse_cache import ParseCache
+
+        folder: Path = ParseCache.get_folder(self.__args)
+        name: str = "test" if is_test else "input"
+        if self.parse_per_part:
+            name += "_p1" if self.is_part_1 else "_p2"
+
+        try:
+            parser_source: str = getsource(type(self).parse)
+        except (OSError, TypeError):
+            self.__context.log(DEBUG, "Source of parse() not found, not caching")
+            return self.parse(puzzle_input)
+
+        key: str = ParseCache.get_key(puzzle_input, parser_source)
+
+        found, data = ParseCache.load(folder, name, key)
+        if found:
+            self.__context.log(DEBUG, f"Loaded parsed {name} from cache")
+            return data
+
+        data = self.parse(puzzle_input)
+        if not ParseCache.store(folder, name, key, data):
+            self.__context.log(DEBUG, f"Parsed {name} cannot be pickled, not caching")
+
+        return data
+
     def __run_solution(self, func: Callable[[Any], Any], data: Any) -> Any:
         """Run the solution function with the specified data."""
         try:
+            if self.__args.line_profile and not self.is_test:
+                return self.__line_profile(func, data)
             if self.__args.profile:
                 return self.__profile(func, data)
             return func(data)
@@ -150,15 +365,18 @@ class SolutionBase:
             bool: True if the test passed, False otherwise.
         """
         self.is_test: bool = True
+        start_time = self.__now()
         test_input: Any = self.__get_test_input()
 
         if test_input is None:
+            self.is_test = False
             return not self.skip_empty_tests
 
         try:
             expected_result: Any = self.__get_test_results(part)
         except ValueError as e:
             if self.skip_empty_tests:
+                self.is_test = False
                 self.__context.print("[black on green] SKIPPING TEST [/black on green]")
                 return True
 
@@ -181,12 +399,22 @@ class SolutionBase:
             return True
 
         self.is_part_1 = True if part == 1 else False
-        parsed_test_input = self.parse(test_input)
+        read_time = self.__now()
+        parsed_test_input = self.__parse(test_input, is_test=True)
+        parse_time = self.__now()
 
-        with self.__context.console.status(
-            f"[bold yellow]Testing P{part}...\n", spinner="dots"
-        ):
+        with self.running(f"[bold yellow]Testing P{part}...\n"):
+            # Measured inside the status, so starting the spinner is not counted
+            solve_time = self.__now()
             result = self.__run_solution(func, parsed_test_input)
+            end_time = self.__now()
+
+        self.__record_phases(
+            "test_",
+            read_time - start_time,
+            parse_time - read_time,
+            end_time - solve_time,
+        )
 
         if result is None:
             return False
@@ -232,17 +460,440 @@ class SolutionBase:
         return True
 
     def __profile(self, func: Callable[[Any], Any], *args: Any, **kwargs: Any) -> Any:
-        """Profile the solution function."""
-        profiler: Profiler = Profiler()
+        """Profile the solution function, saving the session as selected by --profile-format."""
+        from pyinstrument import Profiler
+        from utils.profile_output import ProfileOutput
+
+        profiler: Profiler = Profiler(interval=self.__args.profile_interval)
 
         profiler.start()
         result: Any = func(*args, **kwargs)
-        session: Session = profiler.stop()
+        session: "Session" = profiler.stop()
 
-        if self.__args.only_test or not self.is_test:
-            self.__context.print_info("Session too fast to profile", end="\n")
+        name: str = ("p1" if self.is_part_1 else "p2") + (
+            "_test" if self.is_test else ""
+        )
 
-        if session.sample_count != 0:
-            profiler.open_in_browser()
+        if session.sample_count == 0:
+            self.__context.print_info(
+                f"{name} finished before the first sample, "
+                "try a smaller --profile-interval",
+                end="\n",
+            )
+        else:
+            ProfileOutput.write(self.__context, self.__args, profiler, session, name)
 
         return result
+
+    def __line_profile(
+        self, func: Callable[[Any], Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Time every line of the solution and helper functions run by the part, and print them."""
+        from utils.line_profiler import LineProfiler
+
+        profiler = LineProfiler(
+            [
+                module
+                for module in [
+                    sys.modules.get(type(self).__module__),
+                    sys.modules.get("utils.helper_functions"),
+                ]
+                if module is not None
+            ]
+        )
+
+        profiler.start()
+        try:
+            result: Any = func(*args, **kwargs)
+        finally:
+            functions = profiler.stop()
+
+        LineProfiler.display(
+            self.__context,
+            1 if self.is_part_1 else 2,
+            functions,
+            profiler.total_ns,
+        )
+
+        return result
+
+    def parallel_map(
+        self,
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        chunksize: int | None = None,
+    ) -> list[Any]:
+        """
+        Apply a function to every item in worker processes, returning the results in order.
+
+        The items run in this process instead for the tests, for fewer than
+        `parallel_threshold` items, with a single worker and when `func` cannot be
+        pickled, e.g. a lambda or a nested function. Module-level functions and methods
+        of the solution can be used, the solution is copied to the workers without its
+        console, so anything they print is discarded.
+
+        Args:
+            func (Callable[[Any], Any]): The function applied to every item. It must not
+                depend on changes other items make to the solution.
+            items (Iterable[Any]): The items.
+            chunksize (int | None, optional): The number of items sent to a worker at once.
+                Defaults to 4 chunks per worker.
+
+        Returns:
+            list[Any]: The result of every item, in the order of the items.
+
+        Example:
+            valid = self.parallel_map(self.is_valid, equations)
+        """
+        items = list(items)
+
+        if len(items) < self.parallel_threshold and not self.is_test:
+            self.__run_serially(
+                "parallel_map", f"{len(items)} items are below parallel_threshold"
+            )
+            return [func(item) for item in items]
+
+        if self.__runs_serially("parallel_map", func):
+            return [func(item) for item in items]
+
+        pool = self.__get_pool()
+        chunksize = chunksize or max(1, -(-len(items) // (pool.workers * 4)))
+        return list(pool.executor.map(func, items, chunksize=chunksize))
+
+    def search_parallel(
+        self,
+        predicate: Callable[[int], bool],
+        start: int = 0,
+        step: int = 1,
+        stride: int = 1000,
+        checkpoint: str | None = None,
+    ) -> int:
+        """
+        Return the smallest of `start`, `start + step`, `start + 2 * step`, ... that satisfies
+        a predicate, checking the values in worker processes.
+
+        The values are split into blocks of `stride` values, interleaved across the workers.
+        Once a value is found and every block before it has been checked, the remaining
+        blocks are cancelled. The values are checked in this process instead for the tests,
+        with a single worker and when `predicate` cannot be pickled, like `parallel_map()`.
+        The search does not end until a value is found.
+
+        Args:
+            predicate (Callable[[int], bool]): The condition the value must satisfy. It must
+                not depend on changes other values make to the solution.
+            start (int, optional): The first value. Defaults to 0.
+            step (int, optional): The difference between consecutive values, may be negative.
+                Defaults to 1.
+            stride (int, optional): The number of values a worker checks at once. Larger
+                blocks cost less to hand out, but check more values past the answer. Defaults to 1000.
+            checkpoint (str | None, optional): Save the progress under this key with
+                `checkpoint()`, so an interrupted search continues where it stopped on the
+                next run. Defaults to None.
+
+        Returns:
+            int: The smallest value that satisfies the predicate, in the order of the search.
+
+        Raises:
+            ValueError: If `step` is 0 or `stride` is not positive.
+
+        Example:
+            return self.search_parallel(partial(self.is_quine, program), start=1)
+        """
+        if step == 0:
+            raise ValueError("search_parallel needs a non-zero step")
+        if stride < 1:
+            raise ValueError("search_parallel needs a positive stride")
+
+        # Values before the saved one were all checked by an interrupted run
+        first = start
+        if checkpoint is not None:
+            saved = self.resume(checkpoint)
+            if isinstance(saved, tuple) and saved[:2] == (start, step):
+                first = saved[2]
+
+        def save_progress(checked: int) -> None:
+            if checkpoint is not None:
+                self.checkpoint(checkpoint, (start, step, first + checked * step))
+
+        if self.__runs_serially("search_parallel", predicate):
+            index = 0
+            while not predicate(first + index * step):
+                index += 1
+                if not index % stride:
+                    save_progress(index)
+
+            return first + index * step
+
+        return self.__get_pool().search(
+            predicate,
+            first,
+            step,
+            stride,
+            save_progress if checkpoint is not None else None,
+        )
+
+    def checkpoint(self, key: str, state: Any, every: float = 30.0) -> bool:
+        """
+        Save a snapshot of the progress of a long-running part, at most once every `every` seconds.
+
+        Call it often with the state needed to continue, e.g. every iteration of a search,
+        and `resume()` returns the last saved state on the next run. Snapshots are stored in
+        `data/YYYY/DD/.checkpoints/` and are only resumed when the solution source and the
+        input did not change. They are removed when the part finishes. Nothing is saved for
+        the tests.
+
+        Args:
+            key (str): The name of the checkpoint, letters, digits, "_" and "-" only.
+            state (Any): The state to save, it must be picklable.
+            every (float, optional): The fewest seconds between two saves. Defaults to 30.0.
+
+        Returns:
+            bool: True if the state was saved by this call.
+
+        Raises:
+            ValueError: If the key contains other characters.
+
+        Example:
+            self.checkpoint("search", (a_value, best))
+        """
+        if self.is_test:
+            return False
+
+        if not re.fullmatch(r"[\w-]+", key):
+            raise ValueError(f"Invalid checkpoint key: {key!r}")
+
+        # The first call only starts the clock, a part that ends quickly saves nothing
+        now = monotonic()
+        if now - self.__checkpoints.setdefault(key, now) < every:
+            return False
+        self.__checkpoints[key] = now
+
+        digest = self.__get_checkpoint_hash()
+        if digest is None:
+            return False
+
+        from utils.checkpoints import CheckpointStore
+
+        if not CheckpointStore.store(
+            CheckpointStore.get_folder(self.__args), key, digest, state
+        ):
+            self.__context.log(DEBUG, f"Checkpoint {key} cannot be pickled, not saved")
+            return False
+
+        self.__context.log(DEBUG, f"Saved checkpoint {key}")
+        return True
+
+    def resume(self, key: str) -> Any:
+        """
+        Return the last state saved with `checkpoint()` by an earlier run that did not finish.
+
+        Args:
+            key (str): The name of the checkpoint.
+
+        Returns:
+            Any: The saved state, or None if there is none for this solution source and
+                input, or when running the tests.
+
+        Raises:
+            ValueError: If the key contains characters other than letters, digits, "_" and "-".
+
+        Example:
+            a_value, best = self.resume("search") or (0, 0)
+        """
+        if self.is_test:
+            return None
+
+        if not re.fullmatch(r"[\w-]+", key):
+            raise ValueError(f"Invalid checkpoint key: {key!r}")
+
+        # Resumed keys are removed with the saved ones once the part finishes
+        self.__checkpoints.setdefault(key, monotonic())
+
+        digest = self.__get_checkpoint_hash()
+        if digest is None:
+            return None
+
+        from utils.checkpoints import CheckpointStore
+
+        found, state = CheckpointStore.load(
+            CheckpointStore.get_folder(self.__args), key, digest
+        )
+        if found:
+            self.__context.print_info(f"Resuming from checkpoint [cyan]{key}[/cyan]")
+
+        return state
+
+    def __get_checkpoint_hash(self) -> str | None:
+        """Return the hash of the solution source and the input that checkpoints are valid for."""
+        if self.__checkpoint_hash is None:
+            from utils.checkpoints import CheckpointStore
+
+            try:
+                source = Path(sys.modules[type(self).__module__].__file__ or "")
+                self.__checkpoint_hash = CheckpointStore.get_hash(
+                    source.read_bytes(),
+                    PuzzleReader.get_input_path(self.__args).read_bytes(),
+                )
+            except (KeyError, OSError):
+                self.__context.log(DEBUG, "Solution or input not found, no checkpoints")
+
+        return self.__checkpoint_hash
+
+    def __remove_checkpoints(self) -> None:
+        """Remove the checkpoints saved or resumed by the part that just finished."""
+        if not self.__checkpoints:
+            return
+
+        from utils.checkpoints import CheckpointStore
+
+        folder = CheckpointStore.get_folder(self.__args)
+        for key in self.__checkpoints:
+            CheckpointStore.remove(folder, key)
+        self.__checkpoints = {}
+
+    @contextmanager
+    def running(self, message: str) -> Generator[None, None, None]:
+        """
+        Show a status spinner while a test or part runs, with the progress reported by it.
+
+        Args:
+            message (str): The message of the status, in rich markup.
+
+        Example:
+            with self.running("[bold green]Running P1...\\n"):
+                answer = self.solve(1)
+        """
+        with self.__context.console.status(message, spinner="dots") as status:
+            self.__progress.attach(status, message)
+            try:
+                yield
+            finally:
+                self.__progress.detach()
+
+    def progress(self, done: int, total: int | None = None) -> None:
+        """
+        Show the progress of the running test or part in its status line, with the rate and ETA.
+
+        The status is redrawn at most ten times per second, other calls return right away,
+        so this can be called every iteration of a hot loop. Calls from worker processes
+        are ignored.
+
+        Args:
+            done (int): The number of steps done. Starting over from a lower number shows
+                the progress of a new loop.
+            total (int | None, optional): The total number of steps, to show the percentage
+                and ETA. Defaults to None.
+
+        Example:
+            for i, state in enumerate(states):
+                self.progress(i, len(states))
+        """
+        self.__progress.update(done, total)
+
+    def track(self, iterable: Iterable[T], total: int | None = None) -> Iterator[T]:
+        """
+        Iterate over an iterable, showing how many items are done with `progress()`.
+
+        Args:
+            iterable (Iterable[T]): The items.
+            total (int | None, optional): The number of items. Defaults to the length of
+                the iterable, if it has one.
+
+        Yields:
+            T: The items of the iterable.
+
+        Example:
+            for robot in self.track(robots):
+                ...
+        """
+        if total is None and isinstance(iterable, Sized):
+            total = len(iterable)
+
+        update = self.__progress.update
+        for done, item in enumerate(iterable):
+            update(done, total)
+            yield item
+
+    def __runs_serially(self, helper: str, func: Callable[..., Any]) -> bool:
+        """Return whether a parallel helper has to run in this process, logging why once."""
+        if self.is_test:
+            self.__run_serially(helper, "the tests run serially")
+            return True
+
+        from multiprocessing import current_process
+
+        # Daemonic processes, like the children of --concurrent, cannot start workers
+        if current_process().daemon:
+            self.__run_serially(helper, "this process cannot start workers")
+            return True
+
+        if (self.parallel_workers or self.__get_pool().workers) < 2:
+            self.__run_serially(helper, "a single worker is available")
+            return True
+
+        from utils.parallel import is_picklable
+
+        if not is_picklable(func):
+            reason = f"{getattr(func, '__qualname__', func)} cannot be pickled"
+            if reason not in self.__serial_reasons:
+                self.__context.print_warning(
+                    f"{helper} runs serially, {reason}. "
+                    "Use a module-level function or a method instead"
+                )
+            self.__run_serially(helper, reason)
+            return True
+
+        return False
+
+    def __run_serially(self, helper: str, reason: str) -> None:
+        """Log the first time a parallel helper runs serially for a reason."""
+        if reason not in self.__serial_reasons:
+            self.__serial_reasons.add(reason)
+            self.__context.log(DEBUG, f"{helper} runs serially: {reason}")
+
+    def __get_pool(self) -> "WorkerPool":
+        """Return the worker pool, creating it on first use."""
+        if self.__pool is None:
+            from utils.parallel import WorkerPool
+
+            self.__pool = WorkerPool(self.parallel_workers)
+
+        return self.__pool
+
+    def share_grid(self, grid: list[list[str]] | list[str]) -> "SharedGrid":
+        """
+        Copy a grid into shared memory, so worker processes can read it without it being pickled.
+
+        The returned grid can be passed to `parallel_map()` and `search_parallel()` or
+        stored on the solution, workers only receive the name of the segment. Cells are
+        read with `grid[row][col]` like a list grid, but cannot be changed. The segment
+        is removed when the run ends.
+
+        Args:
+            grid (list[list[str]] | list[str]): The grid, e.g. from `h.gridify`.
+
+        Returns:
+            SharedGrid: The shared copy of the grid.
+
+        Raises:
+            ValueError: If the rows differ in length or a cell is not a single byte character.
+
+        Example:
+            loops = self.parallel_map(partial(self.loops, self.share_grid(grid)), obstacles)
+        """
+        from utils.shared_grid import SharedGrid
+
+        shared = SharedGrid(grid)
+        self.__shared_grids.append(shared)
+
+        return shared
+
+    def close(self) -> None:
+        """Stop the worker processes and remove the shared grids of the parallel helpers, if any."""
+        if self.__pool is not None:
+            self.__pool.shutdown()
+            self.__pool = None
+
+        for shared in self.__shared_grids:
+            shared.unlink()
+        self.__shared_grids = []
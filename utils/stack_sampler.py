@@ -0,0 +1,171 @@
+"""Contains the StackSampler class for summarizing what the main thread did recently."""
+
+# Built-in modules
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Event, Thread, main_thread
+from time import monotonic
+from types import CodeType
+import sys
+
+# Local modules
+from utils.files import Files
+from utils.output_handler import OutputHandler
+
+
+@dataclass
+class HotFunction:
+    """
+    The share of recent samples a function appeared in.
+
+    Attributes:
+        name (str): The qualified name of the function and its location.
+        self_share (float): The share of samples the function was running itself.
+        total_share (float): The share of samples the function was on the stack.
+    """
+
+    name: str
+    self_share: float
+    total_share: float
+
+
+class StackSampler:
+    """
+    Samples the stack of the main thread in the background, keeping the last few seconds.
+
+    Sampling at a low rate from a separate thread costs the solution close to nothing,
+    and answers "where has it been spending its time" at any moment without stopping it.
+
+    Attributes:
+        window (float): The number of seconds of samples that are kept.
+        interval (float): The delay between samples in seconds.
+    """
+
+    def __init__(self, window: float = 10.0, interval: float = 0.05) -> None:
+        """
+        Initialize a new StackSampler instance.
+
+        Args:
+            window (float, optional): The number of seconds of samples that are kept. Defaults to 10.0.
+            interval (float, optional): The delay between samples in seconds. Defaults to 0.05.
+        """
+        self.window = window
+        self.interval = interval
+
+        # (time, code objects from the outermost to the running function)
+        self.__samples: deque[tuple[float, tuple[CodeType, ...]]] = deque()
+        self.__stop = Event()
+        self.__thread: Thread | None = None
+
+    def start(self) -> None:
+        """Start sampling the main thread."""
+        self.__samples.clear()
+        self.__stop.clear()
+        self.__thread = Thread(
+            target=self.__sample, args=(main_thread().ident,), daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and drop the samples."""
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+        self.__samples.clear()
+
+    def __sample(self, thread_id: int | None) -> None:
+        """Record the stack of a thread every interval, dropping samples older than the window."""
+        if thread_id is None:
+            return
+
+        while not self.__stop.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+
+            codes: list[CodeType] = []
+            while frame is not None:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+
+            now = monotonic()
+            self.__samples.append((now, tuple(reversed(codes))))
+            while self.__samples and self.__samples[0][0] < now - self.window:
+                self.__samples.popleft()
+
+    def hot_functions(self, top: int = 8) -> list[HotFunction]:
+        """
+        Return the functions that appeared in the most samples of the window.
+
+        Args:
+            top (int, optional): The number of functions to return. Defaults to 8.
+
+        Returns:
+            list[HotFunction]: The functions with the most own samples first.
+        """
+        samples = [codes for _, codes in list(self.__samples) if codes]
+        if not samples:
+            return []
+
+        own: dict[CodeType, int] = {}
+        total: dict[CodeType, int] = {}
+        for codes in samples:
+            own[codes[-1]] = own.get(codes[-1], 0) + 1
+            # Recursive functions count once per sample
+            for code in set(codes):
+                total[code] = total.get(code, 0) + 1
+
+        root = Files.get_path()
+        hot: list[HotFunction] = []
+
+        for code in sorted(
+            own, key=lambda code: (own[code], total[code]), reverse=True
+        )[:top]:
+            path = Path(code.co_filename)
+            # Library paths are long, their file name is enough to recognize them
+            name = (
+                path.relative_to(root).as_posix()
+                if path.is_relative_to(root)
+                else path.name
+            )
+
+            hot.append(
+                HotFunction(
+                    name=f"{getattr(code, 'co_qualname', code.co_name)} ({name}:{code.co_firstlineno})",
+                    self_share=own[code] / len(samples),
+                    total_share=total[code] / len(samples),
+                )
+            )
+
+        return hot
+
+    @staticmethod
+    def display(context: OutputHandler, hot: list[HotFunction], window: float) -> None:
+        """
+        Print the hot functions of the last window.
+
+        Args:
+            context (OutputHandler): The output handler for the current run of the program.
+            hot (list[HotFunction]): The hot functions.
+            window (float): The number of seconds the samples cover.
+        """
+        from rich.markup import escape
+        from rich.table import Table
+
+        if not hot:
+            return
+
+        table = Table(title=f"Hot functions, last {window:g}s", border_style="blue")
+        table.add_column("Function")
+        table.add_column("Self", justify="right", style="bold blue", no_wrap=True)
+        table.add_column("Total", justify="right", no_wrap=True)
+
+        for function in hot:
+            table.add_row(
+                escape(function.name),
+                f"{function.self_share:.0%}",
+                f"{function.total_share:.0%}",
+            )
+
+        context.print(table)
@@ -0,0 +1,138 @@
+"""Contains the StartupReport class for breaking down the import time of the runner."""
+
+# Built-in modules
+from dataclasses import dataclass
+from timeit import default_timer
+import subprocess
+import sys
+
+# Local modules
+from utils.files import Files
+from utils.output_handler import OutputHandler
+
+
+@dataclass
+class ImportTime:
+    """
+    A single line of `python -X importtime` output.
+
+    Attributes:
+        module (str): The name of the imported module.
+        depth (int): How deeply nested the import is, 0 for top-level imports.
+        self_us (int): The time spent importing the module itself, in microseconds.
+        cumulative_us (int): The time spent importing the module and its dependencies, in microseconds.
+    """
+
+    module: str
+    depth: int
+    self_us: int
+    cumulative_us: int
+
+
+class StartupReport:
+    """Measures the cold start of the runner in a fresh interpreter."""
+
+    @staticmethod
+    def collect(modules: list[str]) -> tuple[list[ImportTime], float]:
+        """
+        Import the given modules in a fresh interpreter with `-X importtime`.
+
+        Args:
+            modules (list[str]): The modules to import, in order.
+
+        Returns:
+            tuple[list[ImportTime], float]: The import times and the wall time of the interpreter in seconds.
+        """
+        # __import__ goes through the instrumented import machinery, unlike importlib
+        code = "\n".join(f"__import__({module!r})" for module in modules)
+
+        start_time = default_timer()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=Files.get_path(),
+            capture_output=True,
+            text=True,
+        )
+        elapsed = default_timer() - start_time
+
+        return StartupReport.parse(result.stderr), elapsed
+
+    @staticmethod
+    def parse(output: str) -> list[ImportTime]:
+        """
+        Parse the output of `python -X importtime`.
+
+        Args:
+            output (str): The stderr of the interpreter.
+
+        Returns:
+            list[ImportTime]: The import times, in the order they were printed.
+
+        Example:
+            >>> StartupReport.parse(
+            ...     "import time: self [us] | cumulative | imported package\\n"
+            ...     "import time:       120 |        120 |   rich.abc\\n"
+            ...     "import time:      9425 |      46774 | rich.console\\n"
+            ... )[0]
+            ImportTime(module='rich.abc', depth=1, self_us=120, cumulative_us=120)
+        """
+        entries: list[ImportTime] = []
+
+        for line in output.splitlines():
+            if not line.startswith("import time:"):
+                continue
+
+            self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+            if not self_us.strip().isdigit():
+                continue
+
+            module = name.lstrip(" ")
+            entries.append(
+                ImportTime(
+                    module=module,
+                    depth=(len(name) - len(module) - 1) // 2,
+                    self_us=int(self_us),
+                    cumulative_us=int(cumulative_us),
+                )
+            )
+
+        return entries
+
+    @staticmethod
+    def display(
+        context: OutputHandler,
+        entries: list[ImportTime],
+        elapsed: float,
+        top: int = 25,
+    ) -> None:
+        """
+        Print the slowest imports and the total startup time.
+
+        Args:
+            context (OutputHandler): The output handler for the current run of the program.
+            entries (list[ImportTime]): The import times to display.
+            elapsed (float): The wall time of the interpreter in seconds.
+            top (int, optional): The number of imports to show. Defaults to 25.
+        """
+        from rich.table import Table
+
+        table = Table(title="Startup imports", border_style="blue")
+        table.add_column("Self", justify="right", style="blue")
+        table.add_column("Cumulative", justify="right", style="bold blue")
+        table.add_column("Module")
+
+        slowest = sorted(entries, key=lambda entry: entry.cumulative_us, reverse=True)
+        for entry in slowest[:top]:
+            table.add_row(
+                f"{entry.self_us / 1000:.2f}ms",
+                f"{entry.cumulative_us / 1000:.2f}ms",
+                "  " * entry.depth + entry.module,
+            )
+
+        context.print(table)
+
+        imports_ms = sum(entry.cumulative_us for entry in entries if not entry.depth)
+        context.print_info(
+            f"Cold start: {elapsed * 1000:.2f}ms wall, "
+            f"{imports_ms / 1000:.2f}ms in {len(entries)} imports"
+        )
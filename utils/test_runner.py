@@ -8,6 +8,7 @@ from typing import Any
 from types import ModuleType
 import argparse
 import subprocess
+import time
 from dataclasses import dataclass, field
 from typing import Set
 
@@ -175,6 +176,95 @@ class CodeQualityTests(unittest.TestCase):
                 continue
 
 
+class StartupTests(unittest.TestCase):
+    # Cold start budget for running a trivial day, in seconds
+    budget: float = 0.5
+    # Modules that must only be imported by the features that need them
+    lazy_modules: tuple[str, ...] = ("pyinstrument", "pyperclip", "rich.panel")
+
+    script: str = "\n".join(
+        [
+            "import sys",
+            "import main",
+            "from utils.cli_args import Args",
+            "from utils.output_handler import Logger, OutputHandler",
+            "from utils.templates.python_template import Solution",
+            "solution = Solution(OutputHandler(Logger()), Args(year=2024, day=1))",
+            "solution.part1(solution.parse([]))",
+            "solution.part2(solution.parse([]))",
+            "print(','.join(sorted(sys.modules)))",
+        ]
+    )
+
+    def run_trivial_day(self) -> tuple[float, set[str]]:
+        """Run the template solution in a fresh interpreter, returning the wall time and imported modules"""
+        root: Path = Path(__file__).parent.parent
+        start_time: float = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", self.script],
+            cwd=root,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return time.perf_counter() - start_time, set(result.stdout.strip().split(","))
+
+    def test_startup_budget(self) -> None:
+        """Check that the cold start of a trivial day stays within the budget"""
+        elapsed: float = min(self.run_trivial_day()[0] for _ in range(3))
+        self.assertLess(
+            elapsed,
+            self.budget,
+            f"Cold start took {elapsed * 1000:.0f}ms, budget is {self.budget * 1000:.0f}ms",
+        )
+
+    def test_lazy_imports(self) -> None:
+        """Check that optional modules are not imported on the fast path"""
+        _, modules = self.run_trivial_day()
+        for module in self.lazy_modules:
+            self.assertNotIn(module, modules, f"{module} is imported at startup")
+
+
+def parallel_map_in_child(connection: Any) -> None:
+    """Run parallel_map with two workers and send the results, or the error, back"""
+    from utils.cli_args import Args
+    from utils.output_handler import Logger, OutputHandler
+    from utils.templates.python_template import Solution
+
+    solution = Solution(OutputHandler(Logger()), Args(year=2024, day=1))
+    solution.parallel_workers = 2
+    solution.parallel_threshold = 0
+    try:
+        connection.send(solution.parallel_map(abs, [-1, -2, 3]))
+    except Exception as e:
+        connection.send(f"{type(e).__name__}: {e}")
+    finally:
+        solution.close()
+
+
+class ParallelTests(unittest.TestCase):
+    def test_parallel_map_in_daemonic_child(self) -> None:
+        """Check that parallel_map works in a daemonic process, like the children of --concurrent"""
+        from multiprocessing import get_all_start_methods, get_context
+
+        if "fork" not in get_all_start_methods():
+            self.skipTest("--concurrent requires fork")
+
+        context = get_context("fork")
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=parallel_map_in_child, args=(sender,), daemon=True
+        )
+        process.start()
+        try:
+            self.assertTrue(receiver.poll(30), "The child did not reply")
+            self.assertEqual(receiver.recv(), [1, 2, 3])
+        finally:
+            process.join(5)
+            if process.is_alive():
+                process.terminate()
+
+
 def load_tests(
     loader: unittest.TestLoader, tests: unittest.TestSuite, ignore: Any
 ) -> unittest.TestSuite:
@@ -191,6 +281,8 @@ def load_tests(
     discoverer: ProjectDocTestLoader = ProjectDocTestLoader(verbose, no_output)
     tests.addTests(discoverer.discover())
     tests.addTests(loader.loadTestsFromTestCase(CodeQualityTests))
+    tests.addTests(loader.loadTestsFromTestCase(StartupTests))
+    tests.addTests(loader.loadTestsFromTestCase(ParallelTests))
     return tests
 
 
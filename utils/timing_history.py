@@ -0,0 +1,126 @@
+"""Contains the TimingHistory class for recording how long each part of a day takes."""
+
+# Built-in modules
+from json import JSONDecodeError, dumps, loads
+from pathlib import Path
+
+
+class TimingHistory:
+    """
+    Stores the most recent solution durations per (year, day, part) in a JSON file.
+
+    The history is used to schedule the slowest days first when several days run in parallel.
+
+    Attributes:
+        path (Path): The path to the JSON file.
+        max_samples (int): The number of durations kept per part.
+    """
+
+    def __init__(self, path: Path, max_samples: int = 5) -> None:
+        """
+        Initialize a new TimingHistory instance and load any existing history.
+
+        Args:
+            path (Path): The path to the JSON file.
+            max_samples (int, optional): The number of durations kept per part. Defaults to 5.
+        """
+        self.path = path
+        self.max_samples = max_samples
+        self.__samples: dict[str, list[float]] = {}
+
+        if path.exists():
+            try:
+                self.__samples = loads(path.read_text(encoding="utf-8"))
+            except (JSONDecodeError, OSError):
+                self.__samples = {}
+
+    @staticmethod
+    def __key(year: int, day: int, part: int) -> str:
+        """Return the key used to store the durations of a part."""
+        return f"{year}/{day:02}/{part}"
+
+    def record(self, year: int, day: int, part: int, elapsed: float) -> None:
+        """
+        Record a new duration for a part, dropping the oldest samples.
+
+        Args:
+            year (int): The year of the puzzle.
+            day (int): The day of the puzzle.
+            part (int): The part of the puzzle.
+            elapsed (float): The duration in seconds.
+        """
+        samples = self.__samples.setdefault(TimingHistory.__key(year, day, part), [])
+        samples.append(elapsed)
+        del samples[: -self.max_samples]
+
+    def expected(self, year: int, day: int, part: int) -> float | None:
+        """
+        Return the expected duration of a part, or None if it has never been recorded.
+
+        Args:
+            year (int): The year of the puzzle.
+            day (int): The day of the puzzle.
+            part (int): The part of the puzzle.
+
+        Returns:
+            float | None: The median of the recorded durations in seconds.
+        """
+        from statistics import median
+
+        samples = self.__samples.get(TimingHistory.__key(year, day, part))
+        return median(samples) if samples else None
+
+    def expected_parts(self, year: int, day: int, parts: list[int]) -> float:
+        """
+        Return the expected duration of the given parts of a day.
+
+        Parts that have never been recorded are assumed to be slower than any recorded
+        part, so that new days are always scheduled first.
+
+        Args:
+            year (int): The year of the puzzle.
+            day (int): The day of the puzzle.
+            parts (list[int]): The parts of the puzzle.
+
+        Returns:
+            float: The expected duration in seconds, or infinity if unknown.
+        """
+        total = 0.0
+        for part in parts:
+            expected = self.expected(year, day, part)
+            if expected is None:
+                return float("inf")
+            total += expected
+        return total
+
+    def longest_first(
+        self, year: int, jobs: list[tuple[int, list[int]]]
+    ) -> list[tuple[int, list[int]]]:
+        """
+        Order (day, parts) jobs by expected duration, longest first.
+
+        Args:
+            year (int): The year of the puzzle.
+            jobs (list[tuple[int, list[int]]]): The jobs to order.
+
+        Returns:
+            list[tuple[int, list[int]]]: The jobs, longest expected duration first, ties broken by day.
+
+        Example:
+            >>> history = TimingHistory(Path("does-not-exist.json"))
+            >>> for day, part, elapsed in [(1, 1, 0.5), (1, 2, 0.5), (6, 1, 0.1), (6, 2, 3.0)]:
+            ...     history.record(2024, day, part, elapsed)
+            >>> history.longest_first(2024, [(1, [1, 2]), (6, [1, 2]), (7, [1, 2])])
+            [(7, [1, 2]), (6, [1, 2]), (1, [1, 2])]
+            >>> history.longest_first(2024, [(6, [1]), (6, [2]), (1, [1])])
+            [(6, [2]), (1, [1]), (6, [1])]
+        """
+        return sorted(
+            jobs,
+            key=lambda job: (-self.expected_parts(year, job[0], job[1]), job),
+        )
+
+    def save(self) -> None:
+        """Write the history to its JSON file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(dumps(self.__samples, indent=2), encoding="utf-8")
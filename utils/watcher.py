@@ -0,0 +1,75 @@
+"""Contains the FileWatcher class for detecting changes to solution and data files."""
+
+# Built-in modules
+from pathlib import Path
+from time import sleep
+
+
+class FileWatcher:
+    """
+    Polls files and directories for modifications.
+
+    Directories are watched one level deep, so cache folders inside them are ignored.
+
+    Attributes:
+        paths (list[Path]): The files and directories being watched.
+        interval (float): The delay between polls in seconds.
+    """
+
+    def __init__(self, paths: list[Path], interval: float = 0.25) -> None:
+        """
+        Initialize a new FileWatcher instance and take the first snapshot.
+
+        Args:
+            paths (list[Path]): The files and directories to watch.
+            interval (float, optional): The delay between polls in seconds. Defaults to 0.25.
+        """
+        self.paths = paths
+        self.interval = interval
+        self.__snapshot: dict[Path, int] = self.__take_snapshot()
+
+    def __take_snapshot(self) -> dict[Path, int]:
+        """Return the modification time of every watched file."""
+        snapshot: dict[Path, int] = {}
+
+        for path in self.paths:
+            try:
+                files = list(path.iterdir()) if path.is_dir() else [path]
+                for file in files:
+                    if file.is_file():
+                        snapshot[file] = file.stat().st_mtime_ns
+            except OSError:
+                continue
+
+        return snapshot
+
+    def changes(self) -> list[Path]:
+        """
+        Return the files that were modified, created or deleted since the last call.
+
+        Returns:
+            list[Path]: The changed files.
+        """
+        snapshot = self.__take_snapshot()
+        changed = [
+            path
+            for path in snapshot.keys() | self.__snapshot.keys()
+            if snapshot.get(path) != self.__snapshot.get(path)
+        ]
+        self.__snapshot = snapshot
+        return sorted(changed)
+
+    def wait_for_changes(self) -> list[Path]:
+        """
+        Block until at least one watched file changes.
+
+        Returns:
+            list[Path]: The changed files.
+        """
+        while True:
+            sleep(self.interval)
+            changed = self.changes()
+            if changed:
+                # Editors often write in several steps, let them settle before returning
+                sleep(self.interval)
+                return sorted(set(changed) | set(self.changes()))